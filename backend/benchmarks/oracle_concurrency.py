@@ -0,0 +1,72 @@
+"""Oracle Concurrency Benchmark
+
+Compares request throughput when concurrent coroutines call the blocking
+DatabaseManager directly versus the async database manager.
+
+Usage (from backend/):
+    DB_MOCK_MODE=false python -m benchmarks.oracle_concurrency --requests 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from config.queries import UtilityQueries
+from utils.database import db_manager, async_db_manager
+
+# Keeps each query busy on the server long enough for concurrency to matter
+SLOW_QUERY = """
+    SELECT COUNT(*) AS cnt
+    FROM DUAL
+    CONNECT BY LEVEL <= :rows
+"""
+
+
+async def run_blocking(total: int, concurrency: int, query: str, params: dict) -> float:
+    """Call the synchronous manager from coroutines (blocks the event loop)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            db_manager.execute_query(query, params)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(total)])
+    return time.perf_counter() - start
+
+
+async def run_async(total: int, concurrency: int, query: str, params: dict) -> float:
+    """Await the async manager from coroutines"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await async_db_manager.execute_query(query, params)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(total)])
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Oracle sync vs async throughput")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=200000, help="Rows generated per query (0 = SELECT 1 FROM DUAL)")
+    args = parser.parse_args()
+
+    if args.rows:
+        query, params = SLOW_QUERY, {"rows": args.rows}
+    else:
+        query, params = UtilityQueries.TEST_CONNECTION, {}
+
+    for label, runner in (("blocking", run_blocking), ("async", run_async)):
+        elapsed = await runner(args.requests, args.concurrency, query, params)
+        print(f"{label:>8}: {args.requests} queries in {elapsed:.2f}s "
+              f"({args.requests / elapsed:.1f} req/s, concurrency {args.concurrency})")
+
+    await async_db_manager.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Password Hashing Benchmark
+
+Simulates a login storm: concurrent coroutines each verify a passcode,
+either inline on the event loop or on the hashing thread pool, and
+report login latency percentiles per hasher. A heartbeat coroutine
+measures how long the event loop is stalled meanwhile.
+
+Usage (from backend/):
+    python -m benchmarks.password_hashing --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from utils import passwords
+
+PASSCODE = "1234"
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def heartbeat(stop: asyncio.Event, lags: List[float], interval: float = 0.01):
+    """Record how late each tick fires (event loop stall)"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(hasher: passwords.PasswordHasher, stored: str, total: int, concurrency: int, offload: bool):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    loop = asyncio.get_running_loop()
+
+    # All logins arrive together, so latency includes time spent queued
+    async def login():
+        async with semaphore:
+            if offload:
+                await loop.run_in_executor(passwords._executor, hasher.verify, PASSCODE, stored)
+            else:
+                hasher.verify(PASSCODE, stored)
+        latencies.append(time.perf_counter() - started)
+
+    stop = asyncio.Event()
+    lags: List[float] = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(total)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await beat
+    return elapsed, latencies, lags
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Login latency per passcode hasher")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--schemes", default="sha256,bcrypt,argon2")
+    args = parser.parse_args()
+
+    for scheme in args.schemes.split(","):
+        try:
+            hasher = passwords.get_hasher(scheme)
+        except (ValueError, RuntimeError) as e:
+            print(f"{scheme:>8}: skipped ({e})")
+            continue
+        stored = hasher.hash(PASSCODE)
+
+        for offload in (False, True):
+            elapsed, latencies, lags = await run(hasher, stored, args.logins, args.concurrency, offload)
+            mode = "pool" if offload else "inline"
+            print(f"{scheme:>8} {mode:>6}: {args.logins / elapsed:8.1f} logins/s  "
+                  f"p50 {percentile(latencies, 0.50) * 1000:8.1f}ms  "
+                  f"p99 {percentile(latencies, 0.99) * 1000:8.1f}ms  "
+                  f"max loop stall {max(lags, default=0.0) * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -25,6 +25,8 @@ ORACLE_CONFIG = {
     'user': os.environ.get('ORACLE_USER', 'your_username'),
     'password': os.environ.get('ORACLE_PASSWORD', 'your_password'),
     'dsn': os.environ.get('ORACLE_DSN', 'localhost:1521/XEPDB1'),  # Format: host:port/service_name
+    # encoding/nencoding/threaded are ignored by python-oracledb, which always
+    # uses UTF-8 and is thread-safe; kept for reference with cx_Oracle setups
     'encoding': 'UTF-8',
     'nencoding': 'UTF-8',
     'threaded': True,
@@ -33,8 +35,23 @@ ORACLE_CONFIG = {
     'min_pool': 2,
     'max_pool': 10,
     'increment': 1,
-    'pool_timeout': 30,
-    'max_lifetime_session': 3600
+    'pool_timeout': 30,             # Seconds to wait for a free connection before failing
+    'max_lifetime_session': 3600,   # Seconds before a pooled session is replaced
+    'ping_interval': 60,            # Seconds idle before a session is health-checked on acquire
+    'stmtcachesize': 50,            # Statements cached per session
+    
+    # Row fetching (iter_query): rows per fetch round trip and rows
+    # returned with the execute call itself
+    'arraysize': 500,
+    'prefetchrows': 501,
+    
+    # Bulk DML (execute_many): rows per executemany call and commit
+    'batch_size': 1000,
+    
+    # Async access from FastAPI routes:
+    #   native - python-oracledb asyncio pool (create_pool_async, thin mode)
+    #   thread - synchronous pool driven from a bounded thread pool
+    'async_mode': os.environ.get('ORACLE_ASYNC_MODE', 'native')
 }
 
 # ============================================================================
@@ -54,9 +71,60 @@ JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-pro
 JWT_ALGORITHM = 'HS256'
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours
 
+# Verified token claims are cached until the token expires
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', '10000'))
+
 # Passcode Settings
 PASSCODE_LENGTH = 4
-PASSCODE_HASH_ALGORITHM = 'sha256'
+# New hashes use this scheme: bcrypt, argon2 (needs argon2-cffi) or legacy sha256.
+# Hashes of another scheme are replaced on the user's next successful login.
+PASSCODE_HASH_ALGORITHM = os.environ.get('PASSCODE_HASH_ALGORITHM', 'bcrypt')
+PASSCODE_BCRYPT_ROUNDS = int(os.environ.get('PASSCODE_BCRYPT_ROUNDS', '12'))
+# Threads computing hashes off the event loop; bounds CPU spent on logins
+PASSCODE_HASH_WORKERS = int(os.environ.get('PASSCODE_HASH_WORKERS', '4'))
+
+# ============================================================================
+# ZEPHYR SETTINGS
+# ============================================================================
+# Mock mode returns fixed projects without calling Zephyr. Point
+# ZEPHYR_BASE_URL at stubs/zephyr_stub.py to exercise the real client locally.
+ZEPHYR_MOCK_MODE = os.environ.get('ZEPHYR_MOCK_MODE', 'true').lower() == 'true'
+ZEPHYR_BASE_URL = os.environ.get('ZEPHYR_BASE_URL', 'https://api.zephyrscale.smartbear.com/v2')
+ZEPHYR_PAGE_SIZE = 100                # maxResults per page
+ZEPHYR_MAX_CONCURRENCY = 5            # Pages fetched in parallel per request
+ZEPHYR_MAX_CONNECTIONS = 20           # Pooled HTTP connections shared by all requests
+ZEPHYR_TIMEOUT_SECONDS = 10
+ZEPHYR_MAX_RETRIES = 3                # Retries on 429/5xx/network errors
+ZEPHYR_BACKOFF_SECONDS = 0.5          # Doubled on each retry unless Retry-After is sent
+ZEPHYR_RATE_LIMIT_PER_SECOND = float(os.environ.get('ZEPHYR_RATE_LIMIT_PER_SECOND', '20'))
+# Projects fetched for a token are reused while the registration form is open
+ZEPHYR_TOKEN_CACHE_TTL_SECONDS = int(os.environ.get('ZEPHYR_TOKEN_CACHE_TTL_SECONDS', '300'))
+
+# ============================================================================
+# JIRA SETTINGS
+# ============================================================================
+# Mock mode returns synthetic issues for any JQL (see stubs/jira_stub.py)
+JIRA_MOCK_MODE = os.environ.get('JIRA_MOCK_MODE', 'true').lower() == 'true'
+JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL', 'https://jira.example.com')
+JIRA_PAGE_SIZE = 100                  # maxResults per search page (Jira caps at 100)
+JIRA_MAX_CONNECTIONS = 20
+JIRA_TIMEOUT_SECONDS = 30
+JIRA_MAX_RETRIES = 3
+JIRA_BACKOFF_SECONDS = 0.5
+JIRA_RATE_LIMIT_PER_SECOND = float(os.environ.get('JIRA_RATE_LIMIT_PER_SECOND', '20'))
+
+# ============================================================================
+# REQUIREMENT IMPORT SETTINGS
+# ============================================================================
+IMPORT_FOLDER_CONCURRENCY = 10        # JQL searches running at once
+IMPORT_CREATE_CONCURRENCY = 20        # Zephyr test case creations in flight
+
+# ============================================================================
+# EXECUTION RESULT SETTINGS
+# ============================================================================
+EXECUTION_BATCH_MAX_RESULTS = 100000   # Results accepted per update-execution-status call
+EXECUTION_WRITE_CHUNK_SIZE = 1000      # Upserts per unordered bulk_write
+EXECUTION_WRITE_CONCURRENCY = 4        # bulk_write calls in flight
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -81,18 +149,85 @@ LOGGING_CONFIG = {
     },
 }
 
+# ============================================================================
+# MONGODB SETTINGS
+# ============================================================================
+# When enabled, startup only reports which indexes would be created
+MONGO_INDEX_DRY_RUN = os.environ.get('MONGO_INDEX_DRY_RUN', 'false').lower() == 'true'
+
+# ============================================================================
+# ID ALLOCATION
+# ============================================================================
+# Number of IDs reserved per round trip to the counters collection / sequence.
+# Unused IDs of a block are skipped when the process restarts.
+ID_BLOCK_SIZE = int(os.environ.get('ID_BLOCK_SIZE', '10'))
+
+# ============================================================================
+# LOGIN SETTINGS
+# ============================================================================
+# When enabled, last_login timestamps are buffered in-process and written
+# with one bulk_write per flush interval instead of one update per login.
+# Up to one interval of timestamps is lost if the process is killed.
+LAST_LOGIN_WRITE_BEHIND = os.environ.get('LAST_LOGIN_WRITE_BEHIND', 'false').lower() == 'true'
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = float(os.environ.get('LAST_LOGIN_FLUSH_INTERVAL_SECONDS', '5'))
+
 # ============================================================================
 # PAGINATION SETTINGS
 # ============================================================================
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 500
 
+# ============================================================================
+# CACHE SETTINGS
+# ============================================================================
+# Dashboard tiles are served from an in-process cache backed by the
+# counters collection; exact counts are only used when rebuilding counters
+DASHBOARD_STATS_TTL_SECONDS = int(os.environ.get('DASHBOARD_STATS_TTL_SECONDS', '30'))
+DASHBOARD_STATS_EXACT = os.environ.get('DASHBOARD_STATS_EXACT', 'false').lower() == 'true'
+
+# Release summaries are recomputed this many seconds after the last change
+# to a release's test cases or executions, coalescing bursts of writes
+RELEASE_SUMMARY_DEBOUNCE_SECONDS = float(os.environ.get('RELEASE_SUMMARY_DEBOUNCE_SECONDS', '2'))
+
+# Resolved team / user BOWs per release, invalidated when assignments change
+BOW_CACHE_TTL_SECONDS = int(os.environ.get('BOW_CACHE_TTL_SECONDS', '300'))
+BOW_CACHE_SIZE = 1000
+
+# Resolved per-user project lists (sidebar), invalidated on registration
+USER_PROJECTS_CACHE_TTL_SECONDS = int(os.environ.get('USER_PROJECTS_CACHE_TTL_SECONDS', '300'))
+USER_PROJECTS_CACHE_SIZE = 10000
+
+# ============================================================================
+# BACKGROUND JOB SETTINGS
+# ============================================================================
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '4'))    # Jobs executed concurrently
+JOB_MAX_ATTEMPTS = 3                  # Runs per job, counting restarts that interrupted it
+JOB_PROGRESS_INTERVAL_SECONDS = 1.0   # Min time between progress writes / stream polls
+JOB_RETENTION_DAYS = 7                # Finished jobs are removed by a TTL index
+JOB_HEARTBEAT_INTERVAL_SECONDS = 15   # Running jobs refresh heartbeat_at this often
+JOB_STALE_AFTER_SECONDS = 90          # Running jobs without a heartbeat for this long are requeued
+
+# ============================================================================
+# RELEASE CLONE SETTINGS
+# ============================================================================
+CLONE_BATCH_SIZE = 5000               # Documents per insert_many when $merge is unavailable
+
+# ============================================================================
+# CAPABILITY METRICS SETTINGS
+# ============================================================================
+METRICS_MAX_RELEASES = 100            # Most recent releases of a project compared
+METRICS_CURSOR_BATCH_SIZE = 10000     # Documents per cursor batch when loading records
+METRICS_CACHE_SIZE = 1000             # Per-release results memoized by (release_id, data_version)
+METRICS_CACHE_TTL_SECONDS = 3600      # Safety net for writes that bypass the data_version bump
+
 # ============================================================================
 # FILE UPLOAD SETTINGS
 # ============================================================================
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls', 'txt'}
+UPLOAD_CHUNK_BYTES = 1024 * 1024  # Uploads are written to disk in 1 MB chunks
+IMPORT_CHUNK_SIZE = 1000  # Rows parsed and inserted per insert_many
 
 # ============================================================================
 # ENVIRONMENT SPECIFIC OVERRIDES
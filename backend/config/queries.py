@@ -8,8 +8,16 @@ Naming Convention:
 - INSERT queries: INSERT_*
 - UPDATE queries: UPDATE_*
 - DELETE queries: DELETE_*
+
+Every statement is registered in ``query_registry`` at import: its text is
+whitespace-normalized and interned (so the driver statement cache and the
+Oracle shared pool see one stable text) and it gets a stable ID such as
+"UserQueries.GET_USER_BY_SOEID" used for per-statement metrics.
 """
 
+import hashlib
+import sys
+
 # ============================================================================
 # USER QUERIES
 # ============================================================================
@@ -170,19 +178,43 @@ class ProjectQueries:
     """
     
     # Used in: User's Project List (/api/projects/user-projects)
-    # Retrieves projects assigned to a specific user from ZEPHYR_PROJECTLIST
+    # Retrieves projects assigned to a specific user through the USER_PROJECTS
+    # mapping (index probe on its primary key, then PROJECTS by primary key)
     GET_USER_PROJECTS = """
         SELECT 
-            PROJECT_ID,
-            PROJECT_NAME
-        FROM PROJECTS
-        WHERE PROJECT_ID IN (
-            SELECT REGEXP_SUBSTR(ZEPHYR_PROJECTLIST, '[^,]+', 1, LEVEL)
-            FROM USERS
-            WHERE USER_ID = :user_id
-            CONNECT BY LEVEL <= REGEXP_COUNT(ZEPHYR_PROJECTLIST, ',') + 1
-        )
-        ORDER BY PROJECT_NAME
+            P.PROJECT_ID,
+            P.PROJECT_NAME
+        FROM USER_PROJECTS UP
+        JOIN PROJECTS P ON P.PROJECT_ID = UP.PROJECT_ID
+        WHERE UP.USER_ID = :user_id
+        ORDER BY P.PROJECT_NAME
+    """
+    
+    # Used in: migrate_user_projects.py (registration writes MongoDB only)
+    # Maps a user to a project; idempotent so re-running a backfill is safe
+    INSERT_USER_PROJECT = """
+        MERGE INTO USER_PROJECTS UP
+        USING (SELECT :user_id AS USER_ID, :project_id AS PROJECT_ID FROM DUAL) SRC
+        ON (UP.USER_ID = SRC.USER_ID AND UP.PROJECT_ID = SRC.PROJECT_ID)
+        WHEN NOT MATCHED THEN
+            INSERT (USER_ID, PROJECT_ID) VALUES (SRC.USER_ID, SRC.PROJECT_ID)
+    """
+    
+    # Used in: replacing a user's project list
+    # Removes all project mappings of a user before re-inserting them
+    DELETE_USER_PROJECTS = """
+        DELETE FROM USER_PROJECTS
+        WHERE USER_ID = :user_id
+    """
+    
+    # Used in: migrate_user_projects.py
+    # Reads the legacy comma-separated project lists to backfill USER_PROJECTS
+    GET_USER_PROJECT_LISTS = """
+        SELECT 
+            USER_ID,
+            ZEPHYR_PROJECTLIST
+        FROM USERS
+        WHERE ZEPHYR_PROJECTLIST IS NOT NULL
     """
     
     # Used in: Create Project API (/api/projects/create)
@@ -366,23 +398,78 @@ class UtilityQueries:
         SELECT 1 FROM DUAL
     """
     
-    # Used in: Generate unique IDs
-    # Gets next sequence value for user IDs
+    # Used in: Generate unique IDs (database/sequences.py OracleSequenceAllocator)
+    # Reserves a block of :count user IDs from USER_ID_SEQ in one round trip
     GET_NEXT_USER_ID = """
-        SELECT NVL(MAX(USER_ID), 0) + 1 as next_id
-        FROM USERS
+        SELECT USER_ID_SEQ.NEXTVAL as next_id
+        FROM DUAL
+        CONNECT BY LEVEL <= :count
     """
     
-    # Used in: Generate unique IDs
-    # Gets next sequence value for project IDs
+    # Used in: Generate unique IDs (database/sequences.py OracleSequenceAllocator)
+    # Reserves a block of :count project IDs from PROJECT_ID_SEQ in one round trip
     GET_NEXT_PROJECT_ID = """
-        SELECT NVL(MAX(PROJECT_ID), 0) + 1 as next_id
-        FROM PROJECTS
+        SELECT PROJECT_ID_SEQ.NEXTVAL as next_id
+        FROM DUAL
+        CONNECT BY LEVEL <= :count
     """
     
-    # Used in: Generate unique IDs
-    # Gets next sequence value for release IDs
+    # Used in: Generate unique IDs (database/sequences.py OracleSequenceAllocator)
+    # Reserves a block of :count release IDs from RELEASE_ID_SEQ in one round trip
     GET_NEXT_RELEASE_ID = """
-        SELECT NVL(MAX(RELEASE_ID), 0) + 1 as next_id
-        FROM RELEASES
+        SELECT RELEASE_ID_SEQ.NEXTVAL as next_id
+        FROM DUAL
+        CONNECT BY LEVEL <= :count
+    """
+
+
+# ============================================================================
+# QUERY REGISTRY
+# ============================================================================
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace in a statement and intern the result
+    
+    Statements here contain no whitespace inside string literals, so
+    collapsing runs of whitespace does not change their meaning.
     """
+    return sys.intern(" ".join(sql.split()))
+
+
+class QueryRegistry:
+    """Normalized statements and their stable IDs"""
+    
+    def __init__(self):
+        self._ids = {}
+    
+    def register(self, *query_classes):
+        """Normalize every query constant of the given classes in place
+        
+        Args:
+            query_classes: Classes holding UPPER_CASE SQL string attributes
+        """
+        for query_class in query_classes:
+            for name, value in list(vars(query_class).items()):
+                if name.isupper() and isinstance(value, str):
+                    text = normalize_sql(value)
+                    setattr(query_class, name, text)
+                    self._ids[text] = f"{query_class.__name__}.{name}"
+    
+    def statement_id(self, sql: str) -> str:
+        """Get the stable ID of a statement
+        
+        Registered statements resolve with a single dict lookup; ad hoc SQL
+        gets an ID derived from its normalized text.
+        """
+        statement_id = self._ids.get(sql)
+        if statement_id is None:
+            text = normalize_sql(sql)
+            statement_id = self._ids.get(text) or f"adhoc:{hashlib.sha1(text.encode()).hexdigest()[:12]}"
+        return statement_id
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+query_registry = QueryRegistry()
+query_registry.register(UserQueries, ProjectQueries, ReleaseQueries, DashboardQueries, UtilityQueries)
@@ -0,0 +1,135 @@
+"""Basis of Work (BOW) Resolution
+
+Resolves the test cases assigned to users in a release with one
+aggregation over users, $lookup-ed into zephyrdata by assigned_to, rather
+than one query per team member. The same pipeline serves a whole team
+(matched on user_teamid) or a single user (matched on user_soeid).
+
+Resolved rows are kept in a read-through cache. Entries of a release are
+dropped when its assignments change (test case imports) and the whole
+cache is cleared when team membership changes (registration).
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from config.config import BOW_CACHE_TTL_SECONDS, BOW_CACHE_SIZE
+from database.mongodb import users_collection
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_bow_cache = TTLCache(ttl=BOW_CACHE_TTL_SECONDS, maxsize=BOW_CACHE_SIZE)
+
+# Bumped per release on assignment changes, and globally on membership
+# changes; both are part of every cache key, so stale entries are never
+# read again and simply age out
+_release_generations: Dict[int, int] = {}
+_generation = 0
+
+WORK_ITEM_PROJECTION = {
+    "_id": 0,
+    "testcase_key": 1,
+    "name": 1,
+    "folder": 1,
+    "phase": 1,
+    "testcase_type": 1,
+    "priority": 1
+}
+
+
+def bow_pipeline(match: Dict[str, Any], release_id: int) -> List[Dict[str, Any]]:
+    """Users matching ``match`` with their work items in the release
+
+    Args:
+        match: Filter on users, e.g. {"user_teamid": "1"} or {"user_soeid": "AB12345"}
+        release_id: Release ID
+
+    Returns:
+        Aggregation pipeline producing one row per user
+    """
+    return [
+        {"$match": match},
+        {"$project": {"_id": 0, "user_id": 1, "soeid": "$user_soeid", "name": "$user_name"}},
+        {"$sort": {"name": 1}},
+        # Equality on assigned_to plus the release filter uses the (release_id, assigned_to) index
+        {"$lookup": {
+            "from": "zephyrdata",
+            "localField": "soeid",
+            "foreignField": "assigned_to",
+            "pipeline": [
+                {"$match": {"release_id": release_id, "type": "testcase"}},
+                {"$project": WORK_ITEM_PROJECTION},
+                {"$sort": {"testcase_key": 1}}
+            ],
+            "as": "work"
+        }},
+        {"$addFields": {"total": {"$size": "$work"}}}
+    ]
+
+
+def _cache_key(scope: str, value: str, release_id: int) -> tuple:
+    return (scope, value, release_id, _generation, _release_generations.get(release_id, 0))
+
+
+async def _iter_bow(scope: str, match: Dict[str, Any], value: str, release_id: int) -> AsyncIterator[Dict[str, Any]]:
+    """Yield BOW rows from the cache, or from the aggregation cursor while filling the cache"""
+    key = _cache_key(scope, value, release_id)
+    cached = _bow_cache.get(key)
+    if cached is not None:
+        for row in cached:
+            yield row
+        return
+
+    rows = []
+    async for row in users_collection.aggregate(bow_pipeline(match, release_id)):
+        rows.append(row)
+        yield row
+
+    # Only cache complete results, and only if no invalidation happened meanwhile
+    if key == _cache_key(scope, value, release_id):
+        _bow_cache.set(key, rows)
+
+
+def iter_team_bow(team_id: str, release_id: int) -> AsyncIterator[Dict[str, Any]]:
+    """Stream the BOW of every member of a team, one row per member
+
+    Args:
+        team_id: Team ID (user_teamid)
+        release_id: Release ID
+
+    Returns:
+        Async iterator of {"user_id", "soeid", "name", "total", "work"} rows
+    """
+    return _iter_bow("team", {"user_teamid": team_id}, team_id, release_id)
+
+
+async def get_user_bow(user_soeid: str, release_id: int) -> Optional[Dict[str, Any]]:
+    """BOW of a single user
+
+    Args:
+        user_soeid: User's SOEID
+        release_id: Release ID
+
+    Returns:
+        BOW row, or None if the user does not exist
+    """
+    soeid = user_soeid.upper()
+    rows = [row async for row in _iter_bow("user", {"user_soeid": soeid}, soeid, release_id)]
+    return rows[0] if rows else None
+
+
+def invalidate_bow(release_id: Optional[int] = None):
+    """Drop cached BOWs
+
+    Args:
+        release_id: Release whose assignments changed; clears every release
+            when omitted (e.g. after team membership changed)
+    """
+    global _generation
+    if release_id is None:
+        # Aggregations already running see a new key and skip caching their rows
+        _generation += 1
+        _bow_cache.clear()
+    else:
+        _release_generations[release_id] = _release_generations.get(release_id, 0) + 1
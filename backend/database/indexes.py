@@ -0,0 +1,170 @@
+"""MongoDB Index Management
+
+Declares every index the API relies on and ensures they exist at startup.
+Can also be run standalone to inspect what would change:
+
+    python -m database.indexes --dry-run
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from config.config import MONGO_INDEX_DRY_RUN, JOB_RETENTION_DAYS
+from database.mongodb import db
+
+logger = logging.getLogger(__name__)
+
+# Declarative index specification: collection, key pattern and options
+INDEX_SPECS = [
+    # Login / register lookups by SOEID, user ID allocation
+    {"collection": "users", "keys": [("user_soeid", 1)], "unique": True},
+    {"collection": "users", "keys": [("user_id", 1)], "unique": True},
+    # Reverse lookup of users by project (multikey on the project ID array)
+    {"collection": "users", "keys": [("zephyr_project_ids", 1)]},
+    # Team BOW: members of a team
+    {"collection": "users", "keys": [("user_teamid", 1)]},
+
+    # Project upserts during registration and $lookup from users
+    {"collection": "projects", "keys": [("project_id", 1)], "unique": True},
+
+    # Release ID allocation and lookups
+    {"collection": "releases", "keys": [("id", 1)], "unique": True},
+    # Releases-by-project keyset pagination
+    {"collection": "releases", "keys": [("project_id", 1), ("id", -1)]},
+
+    # Test case data per project / release / type
+    {"collection": "zephyrdata", "keys": [("project_id", 1), ("release_id", 1), ("type", 1)]},
+    # Per-release test case scans (release summaries, bulk import retries)
+    {"collection": "zephyrdata", "keys": [("release_id", 1), ("type", 1)]},
+
+    # BOW: $lookup of a user's work items in a release
+    {"collection": "zephyrdata", "keys": [("release_id", 1), ("assigned_to", 1)]},
+
+    # Execution results: one document per test case and cycle, upserted in bulk
+    {"collection": "executions", "keys": [("release_id", 1), ("testcase_key", 1), ("cycle", 1)], "unique": True},
+
+    # Materialized release summaries: $merge target and endpoint lookup
+    {"collection": "release_summaries", "keys": [("release_id", 1)], "unique": True},
+
+    # Requeue of unfinished background jobs at startup
+    {"collection": "jobs", "keys": [("status", 1), ("created_at", 1)]},
+    # Reclaim of running jobs whose worker stopped sending heartbeats
+    {"collection": "jobs", "keys": [("status", 1), ("heartbeat_at", 1)]},
+    # Finished jobs expire after the retention period
+    {"collection": "jobs", "keys": [("finished_at", 1)], "expireAfterSeconds": JOB_RETENTION_DAYS * 86400},
+]
+
+
+def index_name(keys: List[tuple]) -> str:
+    """Build the default MongoDB index name for a key pattern"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+def _key_pattern(keys) -> tuple:
+    """Normalize a key pattern for comparison (shell-created indexes use 1.0)"""
+    return tuple(
+        (field, int(direction) if isinstance(direction, float) else direction)
+        for field, direction in keys
+    )
+
+
+def _index_options(unique: bool, expire_after: Optional[int]) -> Dict:
+    """Options compared between declared and existing indexes"""
+    return {"unique": bool(unique), "expireAfterSeconds": expire_after}
+
+
+async def ensure_indexes(dry_run: bool = MONGO_INDEX_DRY_RUN) -> List[Dict]:
+    """Create declared indexes that do not exist yet
+
+    An existing index with the declared key pattern but different options
+    (unique, expireAfterSeconds) is reported as failed; it has to be
+    dropped and recreated by hand since MongoDB cannot change it in place.
+
+    Args:
+        dry_run: Only report missing indexes without creating them
+
+    Returns:
+        Report with one entry per declared index
+    """
+    report = []
+    existing_by_collection = {}
+
+    for spec in INDEX_SPECS:
+        collection_name = spec["collection"]
+        keys = spec["keys"]
+        unique = spec.get("unique", False)
+        expire_after = spec.get("expireAfterSeconds")
+        name = spec.get("name") or index_name(keys)
+
+        if collection_name not in existing_by_collection:
+            info = await db[collection_name].index_information()
+            existing_by_collection[collection_name] = {
+                _key_pattern(i["key"]): _index_options(i.get("unique", False), i.get("expireAfterSeconds"))
+                for i in info.values()
+            }
+
+        entry = {
+            "collection": collection_name,
+            "name": name,
+            "unique": unique,
+            "status": None,
+            "duration_ms": 0.0
+        }
+
+        existing = existing_by_collection[collection_name].get(_key_pattern(keys))
+        expected = _index_options(unique, expire_after)
+        if existing is not None and existing == expected:
+            entry["status"] = "exists"
+        elif existing is not None:
+            entry["status"] = "failed"
+            entry["error"] = f"Existing index options {existing} differ from declared {expected}"
+            logger.error(f"❌ Index {collection_name}.{name}: {entry['error']}")
+        elif dry_run:
+            entry["status"] = "would_create"
+        else:
+            start = time.perf_counter()
+            try:
+                options = {"expireAfterSeconds": expire_after} if expire_after is not None else {}
+                await db[collection_name].create_index(keys, name=name, unique=unique, **options)
+                entry["status"] = "created"
+            except Exception as e:
+                # e.g. duplicate values blocking a unique index; keep starting up
+                entry["status"] = "failed"
+                entry["error"] = str(e)
+                logger.error(f"❌ Failed to create index {collection_name}.{name}: {e}")
+            entry["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+        report.append(entry)
+
+    for entry in report:
+        if entry["status"] != "exists":
+            logger.info(
+                f"   Index {entry['collection']}.{entry['name']}: "
+                f"{entry['status']} ({entry['duration_ms']} ms)"
+            )
+
+    created = sum(1 for e in report if e["status"] == "created")
+    unchanged = sum(1 for e in report if e["status"] == "exists")
+    failed = sum(1 for e in report if e["status"] == "failed")
+    total_ms = round(sum(e["duration_ms"] for e in report), 2)
+    if dry_run:
+        pending = sum(1 for e in report if e["status"] == "would_create")
+        logger.info(f"🧪 Index dry run: {pending} of {len(report)} indexes would be created, {failed} mismatched")
+    else:
+        logger.info(f"✅ MongoDB indexes ensured: {created} created in {total_ms} ms, "
+                    f"{unchanged} unchanged, {failed} failed")
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ensure MongoDB indexes")
+    parser.add_argument("--dry-run", action="store_true", help="Report missing indexes without creating them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    for row in asyncio.run(ensure_indexes(dry_run=args.dry_run)):
+        print(row)
@@ -0,0 +1,84 @@
+"""Last Login Write-Behind Buffer
+
+Coalesces last_login updates so a burst of logins results in one
+unordered bulk_write per flush interval instead of one update per login.
+Only the latest timestamp per user is kept between flushes.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from pymongo import UpdateOne
+
+from config.config import LAST_LOGIN_FLUSH_INTERVAL_SECONDS
+from database.mongodb import users_collection
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """Buffers last_login timestamps keyed by user_id
+
+    Args:
+        interval: Seconds between background flushes
+    """
+
+    def __init__(self, interval: float = LAST_LOGIN_FLUSH_INTERVAL_SECONDS):
+        self.interval = interval
+        self._pending: Dict[int, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, user_id: int, login_time: datetime):
+        """Queue a last_login update for the next flush"""
+        self._pending[user_id] = login_time
+
+    async def flush(self) -> int:
+        """Write all pending timestamps
+
+        Returns:
+            Number of users written
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        operations = [
+            UpdateOne({"user_id": user_id}, {"$max": {"last_login": login_time}})
+            for user_id, login_time in pending.items()
+        ]
+        try:
+            await users_collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            # Put the batch back unless newer logins already replaced it
+            for user_id, login_time in pending.items():
+                self._pending.setdefault(user_id, login_time)
+            logger.warning(f"⚠️ Failed to flush {len(operations)} last_login updates: {e}")
+            return 0
+        return len(operations)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self):
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"✅ last_login write-behind enabled (flush every {self.interval}s)")
+
+    async def stop(self):
+        """Stop the background task and write what is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+last_login_buffer = LastLoginBuffer()
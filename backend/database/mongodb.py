@@ -18,6 +18,10 @@ users_collection = db['users']
 projects_collection = db['projects']
 releases_collection = db['releases']
 zephyrdata_collection = db['zephyrdata']
+counters_collection = db['counters']
+jobs_collection = db['jobs']
+executions_collection = db['executions']
+release_summaries_collection = db['release_summaries']
 
 
 async def test_connection():
@@ -30,6 +34,26 @@ async def test_connection():
         return False
 
 
+_transactions_supported = None
+
+
+async def supports_transactions():
+    """Check whether the deployment supports multi-document transactions
+    
+    Transactions need a replica set or sharded cluster; the result is
+    cached after the first check.
+    """
+    global _transactions_supported
+    if _transactions_supported is None:
+        try:
+            hello = await client.admin.command('hello')
+            _transactions_supported = 'setName' in hello or hello.get('msg') == 'isdbgrid'
+        except Exception as e:
+            logger.warning(f"Could not determine MongoDB topology: {e}")
+            _transactions_supported = False
+    return _transactions_supported
+
+
 def get_est_time():
     """Get current time in EST timezone"""
     return datetime.now(pytz.timezone('US/Eastern'))
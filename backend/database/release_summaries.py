@@ -0,0 +1,190 @@
+"""Release Summary Materialization
+
+Precomputes per-release totals into the release_summaries collection so
+the release summary endpoint is a single indexed lookup:
+
+- test cases by type and by phase (zephyrdata, type "testcase")
+- execution counts by status and pass rate (executions collection)
+
+A summary is recomputed by one aggregation ($unionWith + $facet + $merge)
+scoped to the release. Write paths await on_release_data_changed(), which
+bumps the release's data_version right away (the memoization key of
+derived results such as capability metrics, utils/capability_metrics.py)
+and schedules a debounced refresh so a burst of writes to the same release
+results in one recomputation. Refreshes still waiting at shutdown are run
+by flush_pending_refreshes().
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from config.config import RELEASE_SUMMARY_DEBOUNCE_SECONDS
+from database.mongodb import releases_collection, zephyrdata_collection, release_summaries_collection
+
+logger = logging.getLogger(__name__)
+
+# Execution statuses that count as not yet run when computing the pass rate
+NOT_EXECUTED_STATUSES = ("not_executed", "unexecuted")
+
+_pending_refreshes: Set[int] = set()
+# Strong references to scheduled refreshes; removed when they finish
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+def _counts_to_object(field: str) -> Dict[str, Any]:
+    """[{_id, count}] facet output -> {value: count}, with null grouped as 'unspecified'"""
+    return {
+        "$arrayToObject": {
+            "$map": {
+                "input": f"${field}",
+                "as": "group",
+                "in": {
+                    "k": {"$ifNull": [{"$toString": "$$group._id"}, "unspecified"]},
+                    "v": "$$group.count"
+                }
+            }
+        }
+    }
+
+
+def summary_pipeline(release_id: int) -> list:
+    """Aggregation computing one release's summary and merging it into release_summaries"""
+    return [
+        {"$match": {"release_id": release_id, "type": "testcase"}},
+        {"$project": {"_id": 0, "type": 1, "testcase_type": 1, "phase": 1}},
+        {"$unionWith": {
+            "coll": "executions",
+            "pipeline": [
+                {"$match": {"release_id": release_id}},
+                {"$project": {"_id": 0, "type": "execution", "status": 1}}
+            ]
+        }},
+        {"$facet": {
+            "by_type": [
+                {"$match": {"type": "testcase"}},
+                {"$group": {"_id": "$testcase_type", "count": {"$sum": 1}}}
+            ],
+            "by_phase": [
+                {"$match": {"type": "testcase"}},
+                {"$group": {"_id": "$phase", "count": {"$sum": 1}}}
+            ],
+            "by_status": [
+                {"$match": {"type": "execution"}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+            ]
+        }},
+        {"$project": {
+            "release_id": {"$literal": release_id},
+            "total_testcases": {"$sum": "$by_type.count"},
+            "testcases_by_type": _counts_to_object("by_type"),
+            "testcases_by_phase": _counts_to_object("by_phase"),
+            "total_executions": {"$sum": "$by_status.count"},
+            "executions_by_status": _counts_to_object("by_status"),
+            "not_executed": {"$sum": {
+                "$map": {
+                    "input": {"$filter": {
+                        "input": "$by_status",
+                        "as": "status",
+                        "cond": {"$in": ["$$status._id", list(NOT_EXECUTED_STATUSES)]}
+                    }},
+                    "as": "status",
+                    "in": "$$status.count"
+                }
+            }}
+        }},
+        {"$addFields": {
+            "executed": {"$subtract": ["$total_executions", "$not_executed"]},
+            "passed": {"$ifNull": ["$executions_by_status.pass", 0]}
+        }},
+        {"$addFields": {
+            "pass_rate": {"$cond": [
+                {"$gt": ["$executed", 0]},
+                {"$round": [{"$multiply": [{"$divide": ["$passed", "$executed"]}, 100]}, 2]},
+                0
+            ]},
+            "updated_at": "$$NOW"
+        }},
+        {"$merge": {
+            "into": "release_summaries",
+            "on": "release_id",
+            "whenMatched": "replace",
+            "whenNotMatched": "insert"
+        }}
+    ]
+
+
+async def refresh_release_summary(release_id: int):
+    """Recompute and store the summary of one release"""
+    await zephyrdata_collection.aggregate(summary_pipeline(release_id)).to_list(length=None)
+    logger.info(f"✅ Release summary refreshed for release {release_id}")
+
+
+async def get_release_summary(release_id: int) -> Optional[Dict[str, Any]]:
+    """Get the materialized summary, computing it on first access
+
+    Args:
+        release_id: Release ID
+
+    Returns:
+        Summary document without _id
+    """
+    summary = await release_summaries_collection.find_one({"release_id": release_id}, projection={"_id": 0})
+    if summary is None:
+        await refresh_release_summary(release_id)
+        summary = await release_summaries_collection.find_one({"release_id": release_id}, projection={"_id": 0})
+    return summary
+
+
+async def _debounced_refresh(release_id: int):
+    try:
+        await asyncio.sleep(RELEASE_SUMMARY_DEBOUNCE_SECONDS)
+        _pending_refreshes.discard(release_id)
+        await refresh_release_summary(release_id)
+    except asyncio.CancelledError:
+        # Shutdown; flush_pending_refreshes() runs it instead
+        _pending_refreshes.add(release_id)
+        raise
+    except Exception as e:
+        # The next change schedules another refresh; reads keep the last summary
+        logger.error(f"❌ Failed to refresh release summary for release {release_id}: {e}")
+
+
+async def on_release_data_changed(release_id: int):
+    """Hook for write paths that touch a release's test cases or executions
+
+    Bumps the release's data_version immediately and schedules a summary
+    refresh after RELEASE_SUMMARY_DEBOUNCE_SECONDS; further calls for the
+    same release before then share that refresh.
+
+    Args:
+        release_id: Release whose data changed
+    """
+    try:
+        await releases_collection.update_one({"id": release_id}, {"$inc": {"data_version": 1}})
+    except Exception as e:
+        # Called from finally blocks; never mask the write path's own outcome
+        logger.error(f"❌ Failed to bump data_version of release {release_id}: {e}")
+
+    if release_id in _pending_refreshes:
+        return
+    _pending_refreshes.add(release_id)
+    task = asyncio.get_running_loop().create_task(_debounced_refresh(release_id))
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def flush_pending_refreshes():
+    """Run the refreshes still waiting for their debounce delay (server shutdown)"""
+    tasks = list(_refresh_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    pending = sorted(_pending_refreshes)
+    _pending_refreshes.clear()
+    for release_id in pending:
+        try:
+            await refresh_release_summary(release_id)
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh release summary for release {release_id}: {e}")
@@ -96,13 +96,45 @@ COMMENT ON COLUMN RELEASES.RELEASE_NAME IS 'Release display name';
 COMMENT ON COLUMN RELEASES.RELEASE_START_DATE IS 'Release start date';
 COMMENT ON COLUMN RELEASES.RELEASE_END_DATE IS 'Release end date';
 
+-- ============================================================================
+-- 4. USER_PROJECTS TABLE
+-- ============================================================================
+-- Normalized user -> project mapping replacing the comma-separated
+-- USERS.ZEPHYR_PROJECTLIST for lookups. Backfill existing users with
+-- backend/migrate_user_projects.py.
+
+CREATE TABLE USER_PROJECTS (
+    USER_ID NUMBER NOT NULL,
+    PROJECT_ID NUMBER NOT NULL,
+    CONSTRAINT pk_user_projects PRIMARY KEY (USER_ID, PROJECT_ID)
+) ORGANIZATION INDEX;
+
+-- Reverse lookup: users with access to a project
+CREATE INDEX idx_user_projects_project ON USER_PROJECTS(PROJECT_ID);
+
+COMMENT ON TABLE USER_PROJECTS IS 'Projects each user has access to';
+
+
+-- ============================================================================
+-- 5. ID SEQUENCES
+-- ============================================================================
+-- Used by OracleSequenceAllocator (backend/database/sequences.py) instead of
+-- MAX(ID) + 1 scans. When creating these on a populated database, set
+-- START WITH above the current MAX of the matching ID column.
+
+CREATE SEQUENCE USER_ID_SEQ START WITH 1 INCREMENT BY 1 CACHE 20;
+CREATE SEQUENCE PROJECT_ID_SEQ START WITH 1 INCREMENT BY 1 CACHE 20;
+CREATE SEQUENCE RELEASE_ID_SEQ START WITH 1 INCREMENT BY 1 CACHE 20;
+
+
 -- ============================================================================
 -- VERIFICATION QUERIES
 -- ============================================================================
 -- Run these queries to verify tables were created successfully
 
 -- Check if tables exist
--- SELECT table_name FROM user_tables WHERE table_name IN ('USERS', 'PROJECTS', 'RELEASES');
+-- SELECT table_name FROM user_tables WHERE table_name IN ('USERS', 'PROJECTS', 'RELEASES', 'USER_PROJECTS');
+-- SELECT sequence_name FROM user_sequences;
 
 -- Check table structure
 -- DESC USERS;
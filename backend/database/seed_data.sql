@@ -239,6 +239,21 @@ COMMIT;
 
 SELECT 'Users inserted: ' || COUNT(*) FROM USERS;
 
+-- Populate USER_PROJECTS from the comma-separated project lists above
+-- (one-off set-based split; for existing databases use migrate_user_projects.py)
+INSERT INTO USER_PROJECTS (USER_ID, PROJECT_ID)
+SELECT DISTINCT
+    u.USER_ID,
+    TO_NUMBER(TRIM(REGEXP_SUBSTR(u.ZEPHYR_PROJECTLIST, '[^,]+', 1, l.LVL)))
+FROM USERS u
+JOIN (SELECT LEVEL AS LVL FROM DUAL CONNECT BY LEVEL <= 100) l
+    ON l.LVL <= REGEXP_COUNT(u.ZEPHYR_PROJECTLIST, ',') + 1
+WHERE u.ZEPHYR_PROJECTLIST IS NOT NULL;
+
+COMMIT;
+
+SELECT 'User project mappings inserted: ' || COUNT(*) FROM USER_PROJECTS;
+
 
 -- ============================================================================
 -- VERIFICATION QUERIES
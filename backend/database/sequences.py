@@ -0,0 +1,126 @@
+"""ID Allocation
+
+Allocates unique integer IDs without scanning for the current maximum.
+IDs are reserved from the backing store in blocks and handed out
+in-process, so most calls never leave the process.
+
+Two backends share the same interface:
+- MongoIdAllocator: counters collection, find_one_and_update with $inc
+- OracleSequenceAllocator: Oracle sequence, one NEXTVAL batch per block
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Iterable
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from config.config import ID_BLOCK_SIZE
+from database.mongodb import counters_collection, users_collection, releases_collection
+
+logger = logging.getLogger(__name__)
+
+
+class IdAllocator(ABC):
+    """Base class for block-allocating ID generators"""
+
+    def __init__(self, name: str, block_size: int = ID_BLOCK_SIZE):
+        self.name = name
+        self.block_size = max(1, block_size)
+        self._available = deque()
+        self._lock = asyncio.Lock()
+
+    async def next_id(self) -> int:
+        """Get the next unique ID
+
+        Returns:
+            Unique integer ID
+        """
+        async with self._lock:
+            if not self._available:
+                self._available.extend(await self._allocate_block(self.block_size))
+                logger.debug(f"Allocated ID block for {self.name}: {len(self._available)} ids")
+            return self._available.popleft()
+
+    @abstractmethod
+    async def _allocate_block(self, size: int) -> Iterable[int]:
+        """Reserve ``size`` IDs from the backing store"""
+
+
+class MongoIdAllocator(IdAllocator):
+    """ID allocator backed by a document in the counters collection
+
+    On first use the counter is raised to the current maximum ID in the
+    target collection ($max), so existing data never collides.
+    """
+
+    def __init__(self, name: str, collection, field: str, block_size: int = ID_BLOCK_SIZE):
+        super().__init__(name, block_size)
+        self.collection = collection
+        self.field = field
+        self.counter_id = f"seq_{name}"
+        self._synced = False
+
+    async def _sync_with_collection(self):
+        """Make sure the counter is not behind the IDs already stored"""
+        last_doc = await self.collection.find_one(
+            {self.field: {"$exists": True}},
+            projection={self.field: 1},
+            sort=[(self.field, -1)]
+        )
+        current_max = last_doc[self.field] if last_doc else 0
+
+        try:
+            await counters_collection.update_one(
+                {"_id": self.counter_id},
+                {"$max": {"value": current_max}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # Another process created the counter concurrently; retry once
+            await counters_collection.update_one(
+                {"_id": self.counter_id},
+                {"$max": {"value": current_max}}
+            )
+        self._synced = True
+
+    async def _allocate_block(self, size: int) -> Iterable[int]:
+        if not self._synced:
+            await self._sync_with_collection()
+
+        counter = await counters_collection.find_one_and_update(
+            {"_id": self.counter_id},
+            {"$inc": {"value": size}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        end = counter["value"]
+        return range(end - size + 1, end + 1)
+
+
+class OracleSequenceAllocator(IdAllocator):
+    """ID allocator backed by an Oracle sequence
+
+    Args:
+        name: Allocator name used in logs
+        query: UtilityQueries.GET_NEXT_*_ID statement returning :count values
+        db: Async database manager (utils.database.async_db_manager)
+        block_size: Number of IDs fetched per round trip
+    """
+
+    def __init__(self, name: str, query: str, db, block_size: int = ID_BLOCK_SIZE):
+        super().__init__(name, block_size)
+        self.query = query
+        self.db = db
+
+    async def _allocate_block(self, size: int) -> Iterable[int]:
+        rows = await self.db.execute_query(self.query, {"count": size})
+        return sorted(int(row['NEXT_ID']) for row in rows)
+
+
+# Allocators used by the MongoDB routes
+user_ids = MongoIdAllocator("user_id", users_collection, "user_id")
+release_ids = MongoIdAllocator("release_id", releases_collection, "id")
@@ -0,0 +1,104 @@
+"""Dashboard Statistics Engine
+
+Serves dashboard tile counts from a maintained counters document instead of
+counting every collection on each request. Write paths bump the counters
+atomically and reads are served from an in-process cache with a TTL.
+"""
+
+import logging
+from typing import Dict, Tuple
+
+from config.config import DASHBOARD_STATS_TTL_SECONDS, DASHBOARD_STATS_EXACT
+from database.mongodb import (
+    counters_collection,
+    projects_collection,
+    releases_collection,
+    users_collection,
+    zephyrdata_collection,
+    get_est_time
+)
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Counters document holding the dashboard totals
+STATS_COUNTER_ID = "dashboard_stats"
+
+# Counter field -> collection it counts
+COUNTED_COLLECTIONS = {
+    "total_projects": projects_collection,
+    "total_releases": releases_collection,
+    "total_users": users_collection,
+    "total_testcases": zephyrdata_collection,
+}
+
+_stats_cache = TTLCache(ttl=DASHBOARD_STATS_TTL_SECONDS, maxsize=1)
+
+
+async def increment_stat(field: str, amount: int = 1):
+    """Atomically bump a dashboard counter
+
+    Args:
+        field: Counter field (one of COUNTED_COLLECTIONS)
+        amount: Value to add, may be negative
+    """
+    if field not in COUNTED_COLLECTIONS:
+        raise ValueError(f"Unknown dashboard counter: {field}")
+    if not amount:
+        return
+
+    try:
+        await counters_collection.update_one(
+            {"_id": STATS_COUNTER_ID},
+            {"$inc": {field: amount}, "$set": {"updated_at": get_est_time()}}
+        )
+    except Exception as e:
+        # Counters are advisory; a failed bump is corrected by the next rebuild
+        logger.warning(f"⚠️ Failed to increment dashboard counter {field}: {e}")
+
+
+async def rebuild_stats(exact: bool = DASHBOARD_STATS_EXACT) -> Dict[str, int]:
+    """Recompute all dashboard counters from the collections
+
+    Args:
+        exact: Use count_documents instead of collection metadata counts
+
+    Returns:
+        Dictionary of recomputed counters
+    """
+    counts = {}
+    for field, collection in COUNTED_COLLECTIONS.items():
+        if exact:
+            counts[field] = await collection.count_documents({})
+        else:
+            counts[field] = await collection.estimated_document_count()
+
+    await counters_collection.update_one(
+        {"_id": STATS_COUNTER_ID},
+        {"$set": {**counts, "updated_at": get_est_time()}},
+        upsert=True
+    )
+    _stats_cache.invalidate(STATS_COUNTER_ID)
+
+    logger.info(f"✅ Dashboard counters rebuilt ({'exact' if exact else 'estimated'})")
+    return counts
+
+
+async def get_stats() -> Tuple[Dict[str, int], float]:
+    """Get dashboard counters, served from cache when fresh
+
+    Returns:
+        Tuple of (counters, cache age in seconds)
+    """
+    stats = _stats_cache.get(STATS_COUNTER_ID)
+    if stats is not None:
+        return stats, _stats_cache.age(STATS_COUNTER_ID)
+
+    doc = await counters_collection.find_one({"_id": STATS_COUNTER_ID})
+    if doc and all(field in doc for field in COUNTED_COLLECTIONS):
+        stats = {field: doc[field] for field in COUNTED_COLLECTIONS}
+    else:
+        stats = await rebuild_stats()
+
+    _stats_cache.set(STATS_COUNTER_ID, stats)
+    return stats, 0.0
@@ -0,0 +1,107 @@
+"""User Project Resolution
+
+Resolves the projects a user has access to with a single aggregation and
+keeps the resolved list in a read-through cache keyed by SOEID.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from config.config import USER_PROJECTS_CACHE_TTL_SECONDS, USER_PROJECTS_CACHE_SIZE
+from database.mongodb import users_collection
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_user_projects_cache = TTLCache(
+    ttl=USER_PROJECTS_CACHE_TTL_SECONDS,
+    maxsize=USER_PROJECTS_CACHE_SIZE
+)
+
+# Users registered before zephyr_project_ids existed only carry the
+# comma-separated zephyr_projectlist string; derive the array from it
+_PROJECT_IDS_EXPR = {
+    "$ifNull": [
+        "$zephyr_project_ids",
+        {
+            "$map": {
+                "input": {
+                    "$filter": {
+                        "input": {"$split": [{"$ifNull": ["$zephyr_projectlist", ""]}, ","]},
+                        "cond": {"$ne": [{"$trim": {"input": "$$this"}}, ""]}
+                    }
+                },
+                "in": {"$toInt": {"$trim": {"input": "$$this"}}}
+            }
+        }
+    ]
+}
+
+
+def parse_project_list(project_list: str) -> List[int]:
+    """Convert a comma-separated project list into integer IDs
+
+    Args:
+        project_list: Comma-separated project IDs (e.g. "1,2,3")
+
+    Returns:
+        List of project IDs
+    """
+    return [int(pid.strip()) for pid in (project_list or '').split(',') if pid.strip()]
+
+
+async def get_user_projects(user_soeid: str) -> Optional[List[Dict]]:
+    """Get the resolved project list for a user
+
+    Args:
+        user_soeid: User's SOEID
+
+    Returns:
+        List of {"id", "name"} dictionaries, or None if the user does not exist
+    """
+    soeid = user_soeid.upper()
+
+    cached = _user_projects_cache.get(soeid)
+    if cached is not None:
+        return cached
+
+    pipeline = [
+        {"$match": {"user_soeid": soeid}},
+        {"$limit": 1},
+        {"$project": {"_id": 0, "project_ids": _PROJECT_IDS_EXPR}},
+        {"$lookup": {
+            "from": "projects",
+            "localField": "project_ids",
+            "foreignField": "project_id",
+            "as": "projects"
+        }},
+        {"$project": {
+            "projects": {
+                "$map": {
+                    "input": "$projects",
+                    "in": {"id": "$$this.project_id", "name": "$$this.project_name"}
+                }
+            }
+        }}
+    ]
+
+    docs = await users_collection.aggregate(pipeline).to_list(length=1)
+    if not docs:
+        return None
+
+    projects = docs[0]["projects"]
+    _user_projects_cache.set(soeid, projects)
+    return projects
+
+
+def invalidate_user_projects(user_soeid: Optional[str] = None):
+    """Drop cached project lists
+
+    Args:
+        user_soeid: SOEID to invalidate; clears every user when omitted
+            (e.g. after new projects were written)
+    """
+    if user_soeid:
+        _user_projects_cache.invalidate(user_soeid.upper())
+    else:
+        _user_projects_cache.clear()
@@ -0,0 +1,108 @@
+"""Backfill user/project mappings from the legacy comma-separated lists
+
+MongoDB: sets users.zephyr_project_ids (integer array) from zephyr_projectlist
+Oracle:  fills the USER_PROJECTS join table from USERS.ZEPHYR_PROJECTLIST
+
+Both targets are idempotent and can be re-run safely.
+
+Usage:
+    python migrate_user_projects.py --target mongo [--dry-run]
+    python migrate_user_projects.py --target oracle [--dry-run]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, Iterator
+
+from pymongo import UpdateOne
+
+from config.queries import ProjectQueries
+from database.mongodb import users_collection
+from database.user_projects import parse_project_list, invalidate_user_projects
+
+# Users updated per bulk_write / mapping rows per executemany batch
+BATCH_SIZE = 1000
+
+
+async def migrate_mongo(dry_run: bool = False) -> Dict[str, int]:
+    """Add zephyr_project_ids to users that only have zephyr_projectlist"""
+    cursor = users_collection.find(
+        {"zephyr_project_ids": {"$exists": False}},
+        projection={"_id": 1, "zephyr_projectlist": 1},
+        batch_size=BATCH_SIZE
+    )
+
+    report = {"users": 0, "modified": 0}
+    operations = []
+    async for user in cursor:
+        project_ids = parse_project_list(user.get("zephyr_projectlist"))
+        operations.append(UpdateOne({"_id": user["_id"]}, {"$set": {"zephyr_project_ids": project_ids}}))
+        report["users"] += 1
+
+        if len(operations) >= BATCH_SIZE:
+            report["modified"] += await _flush(operations, dry_run)
+            operations = []
+
+    if operations:
+        report["modified"] += await _flush(operations, dry_run)
+
+    if not dry_run:
+        invalidate_user_projects()
+    return report
+
+
+async def _flush(operations, dry_run: bool) -> int:
+    if dry_run:
+        return 0
+    result = await users_collection.bulk_write(operations, ordered=False)
+    return result.modified_count
+
+
+def _mapping_rows(db) -> Iterator[Dict[str, int]]:
+    """Stream one bind row per (user, project) pair"""
+    for row in db.iter_query(ProjectQueries.GET_USER_PROJECT_LISTS):
+        for project_id in parse_project_list(row['ZEPHYR_PROJECTLIST']):
+            yield {"user_id": row['USER_ID'], "project_id": project_id}
+
+
+def migrate_oracle(dry_run: bool = False) -> Dict[str, int]:
+    """Fill USER_PROJECTS from USERS.ZEPHYR_PROJECTLIST"""
+    from utils.database import db_manager
+
+    if dry_run:
+        return {"mappings": sum(1 for _ in _mapping_rows(db_manager))}
+
+    result = db_manager.execute_many(
+        ProjectQueries.INSERT_USER_PROJECT,
+        _mapping_rows(db_manager),
+        batch_size=BATCH_SIZE
+    )
+    return {
+        "inserted": result["rows_affected"],
+        "batches": result["batches"],
+        "errors": len(result["errors"])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill user/project mappings")
+    parser.add_argument('--target', choices=['mongo', 'oracle'], required=True,
+                        help="Database to migrate")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Only count the rows that would be written")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.target == 'mongo':
+        report = asyncio.run(migrate_mongo(args.dry_run))
+    else:
+        report = migrate_oracle(args.dry_run)
+    elapsed = time.perf_counter() - started
+
+    mode = " (dry run)" if args.dry_run else ""
+    print(f"✅ {args.target} migration finished in {elapsed:.2f}s{mode}: {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,43 @@
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field, validator
-import hashlib
 import logging
 import re
 from typing import Optional, List
-from datetime import datetime, timedelta
-from jose import jwt
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from database.mongodb import users_collection, projects_collection, get_est_time
+from config.config import LAST_LOGIN_WRITE_BEHIND
+from database.mongodb import (
+    client,
+    users_collection,
+    projects_collection,
+    get_est_time,
+    supports_transactions
+)
+from database.last_login import last_login_buffer
+from database.sequences import user_ids
+from database.stats import increment_stat
+from database.bow import invalidate_bow
+from database.user_projects import invalidate_user_projects
+from utils.auth import create_access_token
+from utils.passwords import check_password_async, hash_password_async
+from utils.zephyr_client import zephyr_client, ZephyrAuthError, ZephyrError
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-# JWT Configuration
-JWT_SECRET_KEY = "your-secret-key-change-in-production"
-JWT_ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 480
+# Fields read on login; tokens and other large fields stay on the server
+LOGIN_PROJECTION = {
+    "_id": 0,
+    "user_id": 1,
+    "user_soeid": 1,
+    "user_name": 1,
+    "user_role": 1,
+    "user_teamid": 1,
+    "user_password": 1,
+    "zephyr_projectlist": 1
+}
 
 
 class ZephyrProject(BaseModel):
@@ -70,53 +91,97 @@ class LoginResponse(BaseModel):
     user: Optional[dict] = None
 
 
-def hash_password(password: str) -> str:
-    """Hash password using SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-
-def create_access_token(data: dict) -> str:
-    """Create JWT access token"""
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+async def save_registration(user_doc: dict, projects: List[ZephyrProject]) -> int:
+    """Persist a new user and their Zephyr projects
+    
+    Projects are written with a single unordered bulk_write of upserts, so
+    the number of round trips does not grow with the project count. On a
+    replica set both writes run inside one transaction.
+    
+    Args:
+        user_doc: User document to insert
+        projects: Projects returned by Zephyr for the user
+        
+    Returns:
+        Number of projects that did not exist before
+    """
+    now = get_est_time()
+    project_ops = [
+        UpdateOne(
+            {"project_id": project.id},
+            {"$setOnInsert": {
+                "project_id": project.id,
+                "project_name": project.name,
+                "created_at": now
+            }},
+            upsert=True
+        )
+        for project in projects
+    ]
+    
+    async def write(session=None) -> int:
+        await users_collection.insert_one(user_doc, session=session)
+        if not project_ops:
+            return 0
+        try:
+            result = await projects_collection.bulk_write(project_ops, ordered=False, session=session)
+            return result.upserted_count
+        except BulkWriteError as e:
+            # A concurrent registration may insert the same new project first.
+            # Inside a transaction the server has already aborted it, so the
+            # error must propagate: concurrent upserts there surface as
+            # transient write conflicts that with_transaction retries.
+            if session is not None:
+                raise
+            if any(err.get('code') != 11000 for err in e.details.get('writeErrors', [])):
+                raise
+            return e.details.get('nUpserted', 0)
+    
+    if await supports_transactions():
+        async with await client.start_session() as session:
+            return await session.with_transaction(write)
+    return await write()
 
 
 @router.post("/validate-zephyr-token")
 async def validate_zephyr_token(request: ValidateZephyrTokenRequest):
     """Validate Zephyr token and fetch projects
     
-    This is a mock implementation. In production, this would call actual Zephyr API.
+    Calls the Zephyr Scale /projects API (fixed projects when
+    ZEPHYR_MOCK_MODE is enabled). Results are cached per token, so
+    repeated validations from the registration form do not re-hit Zephyr.
     """
     try:
-        # Mock validation - check if token is not empty and has minimum length
+        # Check token format before calling Zephyr
         if len(request.token) < 10:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid Zephyr token format"
             )
         
-        # Mock Zephyr API response - simulating project data with integer IDs
-        # In production, you would call: GET https://api.zephyrscale.smartbear.com/v2/projects
-        mock_projects = [
-            {"id": 1, "name": "CQE Platform"},
-            {"id": 2, "name": "Test Automation Suite"},
-            {"id": 3, "name": "Performance Testing"},
-            {"id": 4, "name": "API Testing Framework"},
-            {"id": 5, "name": "Mobile App Testing"},
-        ]
+        projects = await zephyr_client.get_projects(request.token)
         
-        logger.info(f"✅ Zephyr token validated, returning {len(mock_projects)} projects")
+        logger.info(f"✅ Zephyr token validated, returning {len(projects)} projects")
         
         return {
             "success": True,
             "message": "Token validated successfully",
-            "projects": mock_projects
+            "projects": projects
         }
         
     except HTTPException:
         raise
+    except ZephyrAuthError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Zephyr token"
+        )
+    except ZephyrError as e:
+        logger.error(f"❌ Zephyr unavailable during token validation: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Zephyr is not reachable, please try again"
+        )
     except Exception as e:
         logger.error(f"❌ Token validation error: {e}")
         raise HTTPException(
@@ -138,16 +203,14 @@ async def register(request: RegisterRequest):
             )
         
         # Get next user ID
-        last_user = await users_collection.find_one(
-            sort=[("user_id", -1)]
-        )
-        next_user_id = (last_user['user_id'] if last_user else 0) + 1
+        next_user_id = await user_ids.next_id()
         
         # Hash password
-        hashed_password = hash_password(request.passcode)
+        hashed_password = await hash_password_async(request.passcode)
         
         # Extract project IDs for zephyr_projectlist (comma-separated)
         project_ids = ",".join([str(p.id) for p in request.projects_data])
+        project_id_list = [p.id for p in request.projects_data]
         
         # Create user document with specified defaults
         user_doc = {
@@ -165,24 +228,27 @@ async def register(request: RegisterRequest):
             "last_login": get_est_time(),
             "manager_verified": "0",  # Default as specified
             "zephyr_projectlist": project_ids,  # Comma-separated project IDs from Zephyr
+            "zephyr_project_ids": project_id_list,  # Same list as integers for $lookup
             "curr_version": "1.4",  # Default as specified
             "lib_flag": "No",  # Default as specified
             "created_at": get_est_time()
         }
         
-        # Insert user
-        result = await users_collection.insert_one(user_doc)
+        # Insert user and upsert all projects in one batch
+        try:
+            new_projects = await save_registration(user_doc, request.projects_data)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this SOEID already exists"
+            )
+        
+        await increment_stat("total_users")
+        await increment_stat("total_projects", new_projects)
         
-        # Save projects to projects collection
-        for project in request.projects_data:
-            # Check if project already exists
-            existing_project = await projects_collection.find_one({"project_id": project.id})
-            if not existing_project:
-                await projects_collection.insert_one({
-                    "project_id": project.id,
-                    "project_name": project.name,
-                    "created_at": get_est_time()
-                })
+        # Drop cached project lists that this registration made stale
+        invalidate_user_projects(None if new_projects else request.soeid)
+        invalidate_bow()
         
         logger.info(f"✅ New user registered: {request.soeid}")
         logger.info(f"   All Projects: {project_ids}")
@@ -226,34 +292,46 @@ async def login(request: LoginRequest):
                 detail="Passcode must be exactly 4 digits"
             )
         
-        # Get user from database
-        user = await users_collection.find_one({"user_soeid": request.soeid.upper()})
+        # Salted hashes cannot be matched in the query, so read the stored
+        # hash and verify it off the event loop
+        user = await users_collection.find_one(
+            {"user_soeid": request.soeid.upper()},
+            projection=LOGIN_PROJECTION
+        )
+        matches, needs_rehash = (False, False)
+        if user:
+            matches, needs_rehash = await check_password_async(request.passcode, user['user_password'])
         
-        if not user:
+        if not matches:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid SOEID or passcode"
             )
         
-        # Verify password
-        if hash_password(request.passcode) != user['user_password']:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid SOEID or passcode"
+        login_time = get_est_time()
+        if needs_rehash:
+            # Upgrade legacy/outdated hashes while the plain passcode is known
+            new_hash = await hash_password_async(request.passcode)
+            await users_collection.update_one(
+                {"user_id": user['user_id'], "user_password": user['user_password']},
+                {"$set": {"user_password": new_hash, "last_login": login_time}}
+            )
+            logger.info(f"✅ Passcode hash upgraded for {request.soeid}")
+        elif LAST_LOGIN_WRITE_BEHIND:
+            last_login_buffer.record(user['user_id'], login_time)
+        else:
+            await users_collection.update_one(
+                {"user_id": user['user_id']},
+                {"$set": {"last_login": login_time}}
             )
-        
-        # Update last login
-        await users_collection.update_one(
-            {"user_id": user['user_id']},
-            {"$set": {"last_login": get_est_time()}}
-        )
         
         # Create JWT token
         token = create_access_token(
             data={
                 "user_id": user['user_id'],
                 "soeid": user['user_soeid'],
-                "role": user['user_role']
+                "role": user['user_role'],
+                "team_id": user['user_teamid']
             }
         )
         
@@ -3,12 +3,7 @@
 from fastapi import APIRouter, HTTPException
 import logging
 
-from database.mongodb import (
-    projects_collection,
-    releases_collection,
-    users_collection,
-    zephyrdata_collection
-)
+from database.stats import get_stats
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
@@ -18,27 +13,26 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 async def get_dashboard_stats():
     """Get dashboard statistics
     
-    Returns counts for projects, releases, users, and testcases
+    Returns counts for projects, releases, users, and testcases.
+    Counts come from the maintained counters document and are cached
+    in-process, so they may be up to DASHBOARD_STATS_TTL_SECONDS stale.
     """
     try:
-        # Count totals from each collection
-        total_projects = await projects_collection.count_documents({})
-        total_releases = await releases_collection.count_documents({})
-        total_users = await users_collection.count_documents({})
-        total_testcases = await zephyrdata_collection.count_documents({})
+        counters, cache_age = await get_stats()
         
-        logger.info(f"✅ Dashboard stats retrieved")
+        logger.info(f"✅ Dashboard stats retrieved (cache age {cache_age:.1f}s)")
         
         return {
             "success": True,
             "stats": {
-                "total_projects": total_projects,
-                "total_releases": total_releases,
-                "total_users": total_users,
-                "total_testcases": total_testcases,
+                "total_projects": counters["total_projects"],
+                "total_releases": counters["total_releases"],
+                "total_users": counters["total_users"],
+                "total_testcases": counters["total_testcases"],
                 "active_cycles": 3,  # Mock data as specified
                 "requirements": 156  # Mock data as specified
-            }
+            },
+            "cache_age_seconds": round(cache_age, 3)
         }
         
     except Exception as e:
@@ -1,29 +1,51 @@
 """Release API Routes"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 import logging
+from typing import Optional
 
+from config.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from database.mongodb import releases_collection
+from utils.auth import get_current_user
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/releases", tags=["Releases"])
+router = APIRouter(prefix="/releases", tags=["Releases"], dependencies=[Depends(get_current_user)])
+
+# Only the fields returned to the client are pulled from MongoDB
+RELEASE_LIST_PROJECTION = {"_id": 0, "id": 1, "name": 1, "project_id": 1}
 
 
 @router.get("/by-project/{project_id}")
-async def get_releases_by_project(project_id: int):
-    """Get all releases for a specific project
+async def get_releases_by_project(
+    project_id: int,
+    after_id: Optional[int] = Query(None, description="Return releases with an ID lower than this (keyset cursor)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+):
+    """Get releases for a specific project, newest first
+    
+    Uses keyset pagination on the release ID so each page is a bounded
+    index range scan on (project_id, id).
     
     Args:
         project_id: Project ID
+        after_id: Cursor from the previous page's next_after_id
+        limit: Maximum number of releases to return
         
     Returns:
-        List of releases for the project
+        Page of releases for the project and the cursor for the next page
     """
     try:
-        # Fetch releases from database
+        query = {"project_id": project_id}
+        if after_id is not None:
+            query["id"] = {"$lt": after_id}
+        
+        # Fetch one extra row to know whether another page exists
         releases = await releases_collection.find(
-            {"project_id": project_id}
-        ).sort("id", -1).to_list(length=None)
+            query, RELEASE_LIST_PROJECTION
+        ).sort("id", -1).limit(limit + 1).to_list(length=limit + 1)
+        
+        has_more = len(releases) > limit
+        releases = releases[:limit]
         
         # Format response
         result = [
@@ -36,7 +58,11 @@ async def get_releases_by_project(project_id: int):
         ]
         
         logger.info(f"✅ Retrieved {len(result)} releases for project {project_id}")
-        return {"success": True, "releases": result}
+        return {
+            "success": True,
+            "releases": result,
+            "next_after_id": result[-1]['id'] if has_more else None
+        }
         
     except Exception as e:
         logger.error(f"❌ Error fetching releases: {e}")
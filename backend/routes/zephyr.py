@@ -3,19 +3,46 @@
 Handles all Zephyr left panel menu actions
 """
 
-from fastapi import APIRouter, HTTPException, Body
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Body, File, Form, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, validator
+import asyncio
+import json
 import logging
-from typing import Optional
-
+import os
+import uuid
+from typing import List, Optional
+
+from config.config import (
+    EXECUTION_BATCH_MAX_RESULTS,
+    JOB_PROGRESS_INTERVAL_SECONDS,
+    UPLOAD_FOLDER,
+    MAX_FILE_SIZE,
+    ALLOWED_EXTENSIONS,
+    UPLOAD_CHUNK_BYTES
+)
 from database.mongodb import (
     releases_collection,
+    users_collection,
     zephyrdata_collection,
     get_est_time
 )
+from database.bow import get_user_bow, invalidate_bow, iter_team_bow
+from database.release_summaries import get_release_summary as load_release_summary, on_release_data_changed
+from database.sequences import release_ids
+from database.stats import increment_stat
+from utils.auth import CurrentUser, get_current_user
+from utils.capability_metrics import get_capability_metrics as compute_capability_metrics
+from utils.execution_results import ExecutionBatch
+from utils.release_clone import clone_release_structure
+from utils.http_client import ApiAuthError
+from utils.jobs import job_runner, JobContext, JobError, FINISHED_STATUSES
+from utils.requirement_import import import_requirements as run_requirement_import
+from utils.streaming import iter_ndjson, ndjson_stream, NDJSON_MEDIA_TYPE
+from utils.testcase_import import import_testcases
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/zephyr", tags=["Zephyr Actions"])
+router = APIRouter(prefix="/zephyr", tags=["Zephyr Actions"], dependencies=[Depends(get_current_user)])
 
 
 class PhaseConfig(BaseModel):
@@ -34,30 +61,53 @@ class ReleaseRequest(BaseModel):
     use_previous_structure: bool = False
     previous_build_release: Optional[str] = None
     phases: PhaseConfig
-    user_soeid: str
+
+
+class RequirementRow(BaseModel):
+    folder_name: str
+    jql: str
+
+    @validator('folder_name', 'jql')
+    def validate_not_blank(cls, v):
+        v = v.strip()
+        if not v:
+            raise ValueError('Folder name and JQL must not be blank')
+        return v
 
 
 class ImportRequirementsRequest(BaseModel):
     release_id: int
     project_id: int
-    requirements: list
+    requirements: List[RequirementRow]
 
 
 @router.post("/create-release")
-async def create_release(request: ReleaseRequest):
+async def create_release(request: ReleaseRequest, current_user: CurrentUser = Depends(get_current_user)):
     """Create a new release
     
     Used in: Create Release menu option
+    
+    With use_previous_structure, the structure of the previous release
+    (previous_build_release, or the latest release of the project) is
+    copied by a background job whose ID is returned as job_id. The release
+    records the copy in clone_status ("pending", "completed" or "failed");
+    it is created even if the job cannot be started, with clone_status
+    "failed" and the reason in clone_error.
     """
     try:
+        previous_release = None
+        if request.use_previous_structure:
+            query = {"project_id": request.project_id}
+            if request.previous_build_release:
+                query["build_release"] = request.previous_build_release
+            previous_release = await releases_collection.find_one(
+                query, projection={"_id": 0, "id": 1}, sort=[("id", -1)]
+            )
+            if not previous_release:
+                raise HTTPException(status_code=400, detail="Previous release not found")
+        
         # Get next release ID
-        last_release = await releases_collection.find_one(
-            sort=[("id", -1)]
-        )
-        if last_release and 'id' in last_release:
-            next_release_id = last_release['id'] + 1
-        else:
-            next_release_id = 1
+        next_release_id = await release_ids.next_id()
         
         # Create release document
         release_doc = {
@@ -69,63 +119,153 @@ async def create_release(request: ReleaseRequest):
             "end_date": request.end_date,
             "use_previous_structure": request.use_previous_structure,
             "previous_build_release": request.previous_build_release,
+            "previous_release_id": previous_release["id"] if previous_release else None,
+            "clone_status": "pending" if previous_release else None,
+            "clone_error": None,
             "phases": {
                 "load_test": request.phases.load_test,
                 "endurance_test": request.phases.endurance_test,
                 "sanity_test": request.phases.sanity_test,
                 "standalone_test": request.phases.standalone_test
             },
-            "created_by": request.user_soeid,
+            "created_by": current_user.soeid,
             "created_at": get_est_time()
         }
         
         await releases_collection.insert_one(release_doc)
+        await increment_stat("total_releases")
         
         logger.info(f"✅ Release created: {request.release_name} (ID: {next_release_id})")
         
+        job_id = None
+        message = "Release created successfully"
+        if previous_release:
+            try:
+                job_id = await job_runner.submit(
+                    "clone_release_structure",
+                    {"source_release_id": previous_release["id"], "release_id": next_release_id},
+                    created_by=current_user.user_id
+                )
+            except Exception as e:
+                # The release exists either way; report the copy as failed instead of the whole request
+                logger.error(f"❌ Could not start structure copy for release {next_release_id}: {e}")
+                release_doc["clone_status"] = "failed"
+                release_doc["clone_error"] = f"Copy could not be started: {e}"
+                message = "Release created, but copying the previous structure could not be started"
+                await _set_clone_status(next_release_id, "failed", release_doc["clone_error"])
+        
         return {
             "success": True,
-            "message": "Release created successfully",
-            "release_id": next_release_id
+            "message": message,
+            "release_id": next_release_id,
+            "job_id": job_id,
+            "clone_status": release_doc["clone_status"],
+            "clone_error": release_doc["clone_error"]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error creating release: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/import-requirements")
-async def import_requirements(request: ImportRequirementsRequest):
+async def _set_clone_status(release_id: int, status: str, error: Optional[str] = None):
+    """Record the outcome of a release's structure copy on the release"""
+    await releases_collection.update_one({"id": release_id}, {"$set": {"clone_status": status, "clone_error": error}})
+
+
+@job_runner.handler("clone_release_structure")
+async def run_clone_release_structure(job: JobContext) -> dict:
+    """Job: copy the previous release's structure into a new release (utils/release_clone.py)"""
+    release_id = job.params["release_id"]
+    try:
+        report = await clone_release_structure(job.params["source_release_id"], release_id, progress=job.progress)
+    except asyncio.CancelledError:
+        raise  # Requeued; the release stays pending
+    except Exception as e:
+        await _set_clone_status(release_id, "failed", str(e))
+        raise
+    else:
+        # Count the copied test cases once per release, however many attempts the copy took
+        completed = await releases_collection.update_one(
+            {"id": release_id, "clone_status": {"$ne": "completed"}},
+            {"$set": {"clone_status": "completed", "clone_error": None}}
+        )
+        if completed.modified_count:
+            await increment_stat("total_testcases", report["testcases"])
+        return report
+    finally:
+        invalidate_bow(release_id)
+        await on_release_data_changed(release_id)
+
+
+def _job_accepted(job_id: str, message: str) -> dict:
+    """Response body of endpoints that run as background jobs"""
+    return {
+        "success": True,
+        "message": message,
+        "job_id": job_id,
+        "status_url": f"/api/zephyr/jobs/{job_id}"
+    }
+
+
+@job_runner.handler("import_requirements", rerun=False)
+async def run_import_requirements(job: JobContext) -> dict:
+    """Job: run the Jira -> Zephyr import (utils/requirement_import.py)
+
+    Not re-run after an interruption: folders and test cases already
+    created in Zephyr would be created a second time.
+    """
+    params = job.params
+    user = await users_collection.find_one(
+        {"user_id": job.created_by},
+        projection={"_id": 0, "jira_token": 1, "zephyr_token": 1}
+    )
+    if not user:
+        raise ValueError("Submitting user no longer exists")
+    
+    try:
+        report = await run_requirement_import(
+            params["requirements"],
+            params["project_id"],
+            jira_token=user.get('jira_token', ''),
+            zephyr_token=user.get('zephyr_token', ''),
+            progress=job.progress
+        )
+    except ApiAuthError as e:
+        raise JobError(f"{e}, please update it in your profile", code="invalid_token") from e
+    
+    logger.info(f"✅ Successfully imported {report['created']} requirements "
+                f"from {len(report['folders'])} folders in {report['total_ms']:.0f}ms")
+    return report
+
+
+@router.post("/import-requirements", status_code=202)
+async def import_requirements(request: ImportRequirementsRequest, current_user: CurrentUser = Depends(get_current_user)):
     """Import requirements for a release
     
+    Queues a background job that runs each folder's JQL search in Jira and
+    creates a Zephyr test case per issue; poll the returned job for progress
+    and the per-folder report. A rejected Jira or Zephyr token fails the job
+    with error_code "invalid_token".
+    
     Used in: Manage Release Data -> Import Requirements
     """
     try:
         logger.info(f"✅ Import requirements called for release {request.release_id}, project {request.project_id}")
         logger.info(f"   Requirements count: {len(request.requirements)}")
         
-        # Mock Zephyr API call - In production, this would call:
-        # POST https://api.zephyrscale.smartbear.com/v2/testcases
-        # with proper authentication and data transformation
-        
-        imported_count = 0
-        for req in request.requirements:
-            folder_name = req.get('folder_name', '')
-            jql = req.get('jql', '')
-            
-            logger.info(f"   Importing: Folder='{folder_name}', JQL='{jql}'")
-            
-            # Mock: Simulate successful import
-            # In production: Execute JQL query in Jira, get requirements, create test cases in Zephyr
-            imported_count += 1
-        
-        logger.info(f"✅ Successfully imported {imported_count} requirements")
-        
-        return {
-            "success": True,
-            "message": f"Successfully imported {imported_count} requirements from Jira to Zephyr",
-            "imported_count": imported_count
-        }
+        job_id = await job_runner.submit(
+            "import_requirements",
+            {
+                "release_id": request.release_id,
+                "project_id": request.project_id,
+                "requirements": [row.model_dump() for row in request.requirements]
+            },
+            created_by=current_user.user_id
+        )
+        return _job_accepted(job_id, "Requirement import started")
         
     except Exception as e:
         logger.error(f"❌ Error importing requirements: {e}")
@@ -172,21 +312,110 @@ async def create_testcase(release_id: int = Body(..., embed=True)):
         raise HTTPException(status_code=500, detail="Error creating test case")
 
 
-@router.post("/import-bulk-testcases")
-async def import_bulk_testcases(release_id: int = Body(..., embed=True)):
+async def _save_upload(upload: UploadFile, prefix: str) -> str:
+    """Stream an upload to UPLOAD_FOLDER in chunks, enforcing MAX_FILE_SIZE
+    
+    Returns:
+        Path of the saved file
+    """
+    filename = os.path.basename(upload.filename or "")
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    if extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+        )
+    
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    path = os.path.join(UPLOAD_FOLDER, f"{prefix}_{filename}")
+    size = 0
+    try:
+        with open(path, 'wb') as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds the {MAX_FILE_SIZE // (1024 * 1024)} MB limit"
+                    )
+                f.write(chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return path
+
+
+@job_runner.handler("import_bulk_testcases")
+async def run_import_bulk_testcases(job: JobContext) -> dict:
+    """Job: import test cases from an uploaded file (utils/testcase_import.py)"""
+    params = job.params
+    path = params["path"]
+    
+    if not os.path.exists(path):
+        # Keep whatever an earlier run imported rather than deleting it below
+        raise ValueError(f"Uploaded file {os.path.basename(path)} is no longer available")
+    
+    if job.attempts > 1:
+        # An interrupted run may have inserted part of the file already
+        await zephyrdata_collection.delete_many({
+            "type": "testcase",
+            "release_id": params["release_id"],
+            "source_file": os.path.basename(path)
+        })
+    
+    try:
+        report = await import_testcases(path, params["release_id"], params["project_id"], progress=job.progress)
+    except asyncio.CancelledError:
+        raise  # Requeued; the next attempt needs the upload
+    except Exception:
+        os.remove(path)
+        raise
+    else:
+        os.remove(path)
+        return report
+    finally:
+        invalidate_bow(params["release_id"])
+        await on_release_data_changed(params["release_id"])
+
+
+@router.post("/import-bulk-testcases", status_code=202)
+async def import_bulk_testcases(
+    release_id: int = Form(...),
+    file: UploadFile = File(...),
+    current_user: CurrentUser = Depends(get_current_user)
+):
     """Import test cases in bulk
     
+    Accepts a CSV, tab-delimited TXT, XLSX or XLS upload with a header row
+    (testcase_key and name required; folder, phase, testcase_type,
+    priority, assigned_to optional). The file is saved in chunks and
+    imported by a background job.
+    
     Used in: Manage Release Data -> Import Bulk Testcases
     """
     try:
-        logger.info(f"✅ Import bulk testcases called for release {release_id}")
-        
-        # TODO: Implement bulk import logic
-        return {
-            "success": True,
-            "message": "Bulk testcase import initiated"
-        }
+        logger.info(f"✅ Import bulk testcases called for release {release_id}: {file.filename}")
+        
+        release = await releases_collection.find_one({"id": release_id}, projection={"_id": 0, "project_id": 1})
+        if not release:
+            raise HTTPException(status_code=404, detail="Release not found")
+        
+        path = await _save_upload(file, uuid.uuid4().hex)
+        job_id = await job_runner.submit(
+            "import_bulk_testcases",
+            {
+                "release_id": release_id,
+                "project_id": release["project_id"],
+                "path": path,
+                "filename": file.filename
+            },
+            created_by=current_user.user_id
+        )
+        return _job_accepted(job_id, "Bulk testcase import initiated")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error importing bulk testcases: {e}")
         raise HTTPException(status_code=500, detail="Error importing bulk testcases")
@@ -212,21 +441,73 @@ async def manage_cycles_phases(release_id: int = Body(..., embed=True)):
         raise HTTPException(status_code=500, detail="Error managing cycles/phases")
 
 
+def _load_json_results(body: bytes) -> list:
+    """Parse a JSON array request body"""
+    results = json.loads(body)
+    if not isinstance(results, list):
+        raise ValueError("Body must be a JSON array of results")
+    return results
+
+
 @router.post("/update-execution-status")
-async def update_execution_status(release_id: int = Body(..., embed=True)):
+async def update_execution_status(
+    request: Request,
+    release_id: int = Query(...),
+    current_user: CurrentUser = Depends(get_current_user)
+):
     """Update test execution status
     
     Used in: Manage Release Data -> Update Execution Status
+    
+    The body is a JSON array, or an NDJSON stream (Content-Type
+    application/x-ndjson), of {testcase_key, cycle, status, executed_at}
+    results; see utils/execution_results.py for validation, de-duplication
+    and batching.
+    
+    Args:
+        release_id: Release the results belong to (query parameter)
+    
+    Returns:
+        Accepted/rejected counts
     """
     try:
-        logger.info(f"✅ Update execution status called for release {release_id}")
+        release = await releases_collection.find_one({"id": release_id}, projection={"_id": 1})
+        if not release:
+            raise HTTPException(status_code=404, detail="Release not found")
+        
+        batch = ExecutionBatch()
+        too_many = HTTPException(
+            status_code=413,
+            detail=f"At most {EXECUTION_BATCH_MAX_RESULTS} results per request"
+        )
+        
+        try:
+            if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+                async for raw in iter_ndjson(request.stream()):
+                    if batch.received >= EXECUTION_BATCH_MAX_RESULTS:
+                        raise too_many
+                    batch.add(raw)
+            else:
+                results = await asyncio.to_thread(_load_json_results, await request.body())
+                if len(results) > EXECUTION_BATCH_MAX_RESULTS:
+                    raise too_many
+                # Validation of large batches is CPU bound; keep it off the event loop
+                await asyncio.to_thread(lambda: [batch.add(raw) for raw in results])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        report = await batch.write(release_id, updated_by=current_user.soeid)
+        if report["accepted"]:
+            await on_release_data_changed(release_id)
         
-        # TODO: Implement execution status update logic
         return {
             "success": True,
-            "message": "Execution status update ready"
+            "message": f"{report['accepted']} execution results accepted, {report['rejected']} rejected",
+            **report
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error updating execution status: {e}")
         raise HTTPException(status_code=500, detail="Error updating execution status")
@@ -273,19 +554,19 @@ async def update_central_test_repo(release_id: int = Body(..., embed=True)):
 
 
 @router.get("/view-my-bow")
-async def view_my_bow(user_soeid: str, release_id: int):
+async def view_my_bow(release_id: int, current_user: CurrentUser = Depends(get_current_user)):
     """View my BOW (Basis of Work)
     
     Used in: View My BOW
+    
+    Test cases of the release assigned to the current user (database/bow.py).
     """
     try:
-        logger.info(f"✅ View my BOW called for {user_soeid}, release {release_id}")
-        
-        # TODO: Implement BOW retrieval logic
+        bow = await get_user_bow(current_user.soeid, release_id)
         return {
             "success": True,
             "message": "BOW data retrieved",
-            "data": []
+            "data": bow["work"] if bow else []
         }
         
     except Exception as e:
@@ -294,21 +575,41 @@ async def view_my_bow(user_soeid: str, release_id: int):
 
 
 @router.get("/view-team-bow")
-async def view_team_bow(team_id: str, release_id: int):
+async def view_team_bow(
+    release_id: int,
+    team_id: Optional[str] = None,
+    stream: bool = False,
+    current_user: CurrentUser = Depends(get_current_user)
+):
     """View team's BOW
     
     Used in: View My Team's BOW
+    
+    One row per team member with the test cases assigned to them in the
+    release, resolved by a single aggregation (database/bow.py).
+    
+    Args:
+        release_id: Release ID
+        team_id: Team to show; defaults to the current user's team
+        stream: Return NDJSON, one member per line, for large teams
     """
     try:
-        logger.info(f"✅ View team BOW called for team {team_id}, release {release_id}")
+        team_id = team_id or current_user.team_id
+        if not team_id:
+            raise HTTPException(status_code=400, detail="team_id is required")
         
-        # TODO: Implement team BOW retrieval logic
+        if stream:
+            return StreamingResponse(ndjson_stream(iter_team_bow(team_id, release_id)), media_type=NDJSON_MEDIA_TYPE)
+        
+        members = [row async for row in iter_team_bow(team_id, release_id)]
         return {
             "success": True,
             "message": "Team BOW data retrieved",
-            "data": []
+            "data": members
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error viewing team BOW: {e}")
         raise HTTPException(status_code=500, detail="Error viewing team BOW")
@@ -319,17 +620,24 @@ async def get_release_summary(release_id: int):
     """Get release summary view
     
     Used in: Release Summary View
+    
+    Reads the summary precomputed by database/release_summaries.py, which
+    is refreshed whenever imports or execution updates touch the release.
     """
     try:
-        logger.info(f"✅ Release summary called for release {release_id}")
+        release = await releases_collection.find_one({"id": release_id}, projection={"_id": 1})
+        if not release:
+            raise HTTPException(status_code=404, detail="Release not found")
         
-        # TODO: Implement release summary logic
+        summary = await load_release_summary(release_id)
         return {
             "success": True,
             "message": "Release summary retrieved",
-            "summary": {}
+            "summary": summary or {}
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error getting release summary: {e}")
         raise HTTPException(status_code=500, detail="Error getting release summary")
@@ -340,17 +648,22 @@ async def get_capability_metrics(release_id: int):
     """View capability metrics
     
     Used in: View Capability Metrics
+    
+    Computed by utils/capability_metrics.py and memoized per release data version.
     """
     try:
-        logger.info(f"✅ Capability metrics called for release {release_id}")
+        metrics = await compute_capability_metrics(release_id)
+        if metrics is None:
+            raise HTTPException(status_code=404, detail="Release not found")
         
-        # TODO: Implement capability metrics logic
         return {
             "success": True,
             "message": "Capability metrics retrieved",
-            "metrics": {}
+            "metrics": metrics
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error getting capability metrics: {e}")
         raise HTTPException(status_code=500, detail="Error getting capability metrics")
@@ -374,3 +687,35 @@ async def configure_confluence(release_id: int = Body(..., embed=True)):
     except Exception as e:
         logger.error(f"❌ Error configuring confluence: {e}")
         raise HTTPException(status_code=500, detail="Error configuring confluence")
+
+
+async def _job_updates(job_id: str):
+    """Yield the job document whenever it changes, until it finishes"""
+    last_seen = None
+    while True:
+        job = await job_runner.get(job_id)
+        if job is None:
+            return
+        marker = (job["status"], job.get("updated_at"))
+        if marker != last_seen:
+            last_seen = marker
+            yield job
+        if job["status"] in FINISHED_STATUSES:
+            return
+        await asyncio.sleep(JOB_PROGRESS_INTERVAL_SECONDS)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, stream: bool = False, current_user: CurrentUser = Depends(get_current_user)):
+    """Get background job status, progress and result
+    
+    With stream=true the response is NDJSON: one line per progress change,
+    ending with the finished job.
+    """
+    job = await job_runner.get(job_id)
+    if job is None or job.get("created_by") != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if stream:
+        return StreamingResponse(ndjson_stream(_job_updates(job_id)), media_type=NDJSON_MEDIA_TYPE)
+    return {"success": True, "job": job}
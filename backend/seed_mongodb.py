@@ -7,6 +7,7 @@ from database.mongodb import (
     users_collection,
     zephyrdata_collection
 )
+from database.stats import rebuild_stats
 
 
 async def seed_database():
@@ -135,6 +136,10 @@ async def seed_database():
     await zephyrdata_collection.insert_many(zephyr_data)
     print(f"✅ Seeded {len(zephyr_data)} zephyr data records")
     
+    # Reset dashboard counters to the seeded totals
+    await rebuild_stats(exact=True)
+    print("✅ Rebuilt dashboard counters")
+    
     print("🎉 Database seeding completed successfully!")
 
 
@@ -7,6 +7,15 @@ import pytz
 
 from routes import auth, projects, releases, dashboard, zephyr
 from database.mongodb import db, test_connection
+from database.indexes import ensure_indexes
+from database.last_login import last_login_buffer
+from database.release_summaries import flush_pending_refreshes
+from config.config import LAST_LOGIN_WRITE_BEHIND
+from utils.database import async_db_manager, db_manager
+from utils.db_metrics import statement_metrics
+from utils.jira_client import jira_client
+from utils.jobs import job_runner
+from utils.zephyr_client import zephyr_client
 
 # Configure logging
 logging.basicConfig(
@@ -47,8 +56,34 @@ async def startup_event():
     # Test database connection
     if await test_connection():
         logger.info("✅ Database connection verified")
+        
+        try:
+            await ensure_indexes()
+        except Exception as e:
+            logger.error(f"❌ Failed to ensure MongoDB indexes: {e}")
     else:
         logger.warning("⚠️ Database connection test failed")
+    
+    if LAST_LOGIN_WRITE_BEHIND:
+        last_login_buffer.start()
+    
+    try:
+        await job_runner.start()
+    except Exception as e:
+        logger.error(f"❌ Failed to start background job runner: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release database resources on shutdown"""
+    await job_runner.stop()
+    await flush_pending_refreshes()
+    await last_login_buffer.stop()
+    await zephyr_client.close()
+    await jira_client.close()
+    await async_db_manager.close_pool()
+    # Scripts or thread mode may have opened the synchronous pool as well
+    db_manager.close_pool()
 
 
 @app.get("/api")
@@ -71,3 +106,30 @@ async def health_check():
         "version": "1.4",
         "timestamp": datetime.now(pytz.timezone('US/Eastern')).isoformat()
     }
+
+
+@app.get("/api/health/pool")
+async def pool_health():
+    """Oracle connection pool metrics
+    
+    Live busy/open counts plus acquire wait histogram and timeouts,
+    used to size the pool under peak load.
+    """
+    return {
+        "status": "healthy",
+        "pool": async_db_manager.pool_stats(),
+        "timestamp": datetime.now(pytz.timezone('US/Eastern')).isoformat()
+    }
+
+
+@app.get("/api/health/queries")
+async def query_health(limit: int = 20):
+    """Per-statement execution counts and latency percentiles
+    
+    Hotspot table of SQL statements ordered by total execution time.
+    """
+    return {
+        "status": "healthy",
+        "statements": statement_metrics.snapshot(limit),
+        "timestamp": datetime.now(pytz.timezone('US/Eastern')).isoformat()
+    }
@@ -0,0 +1,67 @@
+"""Jira API Stub
+
+Minimal stand-in for the Jira REST API search endpoint, used to exercise
+the real Jira client and the requirement import pipeline locally. Every
+JQL returns a deterministic number of synthetic issues (20-119).
+
+Usage (from backend/):
+    python -m stubs.jira_stub --port 8082 --latency 0.2
+    JIRA_MOCK_MODE=false JIRA_BASE_URL=http://localhost:8082 uvicorn server:app
+
+Any token of 10+ characters is accepted, except tokens starting with "bad".
+"""
+
+import argparse
+import asyncio
+
+from fastapi import FastAPI, Header, HTTPException, Query
+
+from utils.jira_client import mock_issue_count
+
+
+def create_app(latency: float = 0.0) -> FastAPI:
+    """Build the stub application
+
+    Args:
+        latency: Seconds added to every response
+    """
+    app = FastAPI(title="Jira Stub")
+    app.state.requests = 0
+
+    @app.get("/rest/api/2/search")
+    async def search(
+        jql: str,
+        authorization: str = Header(None),
+        startAt: int = Query(0, ge=0),
+        maxResults: int = Query(50, ge=1, le=100)
+    ):
+        app.state.requests += 1
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        if len(token) < 10 or token.startswith("bad"):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        if latency:
+            await asyncio.sleep(latency)
+
+        total = mock_issue_count(jql)
+        issues = [
+            {"id": str(10000 + i), "key": f"REQ-{i}", "fields": {"summary": f"Requirement {i}"}}
+            for i in range(startAt + 1, min(total, startAt + maxResults) + 1)
+        ]
+        return {"startAt": startAt, "maxResults": maxResults, "total": total, "issues": issues}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Jira API stub")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.latency), host="0.0.0.0", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Zephyr Scale API Stub
+
+Minimal stand-in for the Zephyr Scale v2 API, used to exercise the real
+Zephyr client locally. Serves paginated /v2/projects, project lookup and
+folder/test case creation, with optional latency and injected transient
+failures.
+
+Usage (from backend/):
+    python -m stubs.zephyr_stub --port 8081 --projects 250 --latency 0.2
+    ZEPHYR_MOCK_MODE=false ZEPHYR_BASE_URL=http://localhost:8081/v2 uvicorn server:app
+
+Any token of 10+ characters is accepted, except tokens starting with "bad".
+"""
+
+import argparse
+import asyncio
+import itertools
+
+from fastapi import Body, FastAPI, Header, HTTPException, Query
+from fastapi.responses import JSONResponse
+
+
+def create_app(project_count: int = 25, latency: float = 0.0, fail_every: int = 0) -> FastAPI:
+    """Build the stub application
+
+    Args:
+        project_count: Number of projects served
+        latency: Seconds added to every response
+        fail_every: Answer every Nth request with 503 (0 disables)
+    """
+    app = FastAPI(title="Zephyr Scale Stub")
+    app.state.requests = 0
+    app.state.testcases = []
+    counter = itertools.count(1)
+    ids = itertools.count(1)
+
+    projects = [
+        {"id": i, "key": f"PRJ{i}", "name": f"Project {i}", "enabled": True}
+        for i in range(1, project_count + 1)
+    ]
+
+    def check_token(authorization: str):
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        if len(token) < 10 or token.startswith("bad"):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+
+    async def simulate(authorization: str):
+        """Count, authenticate and delay a request; returns a 503 response when injecting a failure"""
+        app.state.requests += 1
+        check_token(authorization)
+        if latency:
+            await asyncio.sleep(latency)
+        if fail_every and next(counter) % fail_every == 0:
+            return JSONResponse(status_code=503, content={"message": "Service Unavailable"})
+        return None
+
+    @app.get("/v2/projects")
+    async def list_projects(
+        authorization: str = Header(None),
+        startAt: int = Query(0, ge=0),
+        maxResults: int = Query(10, ge=1, le=1000)
+    ):
+        failure = await simulate(authorization)
+        if failure:
+            return failure
+
+        values = projects[startAt:startAt + maxResults]
+        return {
+            "startAt": startAt,
+            "maxResults": maxResults,
+            "total": len(projects),
+            "isLast": startAt + maxResults >= len(projects),
+            "values": values
+        }
+
+    @app.get("/v2/projects/{project_id}")
+    async def get_project(project_id: int, authorization: str = Header(None)):
+        failure = await simulate(authorization)
+        if failure:
+            return failure
+        if not 1 <= project_id <= len(projects):
+            raise HTTPException(status_code=404, detail="Project not found")
+        return projects[project_id - 1]
+
+    @app.post("/v2/folders", status_code=201)
+    async def create_folder(body: dict = Body(...), authorization: str = Header(None)):
+        failure = await simulate(authorization)
+        if failure:
+            return failure
+        return {"id": next(ids)}
+
+    @app.post("/v2/testcases", status_code=201)
+    async def create_testcase(body: dict = Body(...), authorization: str = Header(None)):
+        failure = await simulate(authorization)
+        if failure:
+            return failure
+        testcase_id = next(ids)
+        app.state.testcases.append(body)
+        return {"id": testcase_id, "key": f"{body['projectKey']}-T{testcase_id}"}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Zephyr Scale API stub")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--projects", type=int, default=25)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.projects, args.latency, args.fail_every), host="0.0.0.0", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
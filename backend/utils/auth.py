@@ -5,16 +5,35 @@ Handles password hashing, JWT token generation, and authentication helpers.
 
 import hashlib
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from config.config import JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from pydantic import BaseModel
+from config.config import JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, TOKEN_CACHE_SIZE
+from utils import passwords
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Verified principals keyed by sha256 of the token; entries expire with the token
+_token_cache = TTLCache(ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60, maxsize=TOKEN_CACHE_SIZE)
+
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+
+class CurrentUser(BaseModel):
+    """Authenticated user, built from the token claims"""
+    user_id: int
+    soeid: str
+    role: str
+    team_id: Optional[str] = None
+
 
 def hash_password(password: str) -> str:
-    """Hash password using SHA256
+    """Hash password with the configured scheme (see utils.passwords)
     
     Args:
         password: Plain text password
@@ -22,7 +41,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return passwords.hash_password(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -30,12 +49,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     Args:
         plain_password: Plain text password to verify
-        hashed_password: Stored hash to compare against
+        hashed_password: Stored hash (any supported scheme) to compare against
         
     Returns:
         True if password matches, False otherwise
     """
-    return hash_password(plain_password) == hashed_password
+    return passwords.check_password(plain_password, hashed_password)[0]
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -76,3 +95,66 @@ def decode_token(token: str) -> Optional[dict]:
     except JWTError as e:
         logger.error(f"Token decode error: {e}")
         return None
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def authenticate_token(token: str) -> Optional[CurrentUser]:
+    """Verify a token and return its principal
+    
+    The signature is verified once per token; the resulting principal is
+    cached until the token's own expiry, so repeated requests with the
+    same token skip HMAC verification and never read the users collection.
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        CurrentUser or None if the token is invalid or expired
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    
+    principal = _token_cache.get(key)
+    if principal is not None:
+        return principal
+    
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    
+    try:
+        principal = CurrentUser(
+            user_id=payload["user_id"],
+            soeid=payload["soeid"],
+            role=payload["role"],
+            team_id=payload.get("team_id")
+        )
+    except (KeyError, ValueError) as e:
+        logger.error(f"Token is missing required claims: {e}")
+        return None
+    
+    _token_cache.set(key, principal, ttl=payload["exp"] - time.time())
+    return principal
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme)
+) -> CurrentUser:
+    """FastAPI dependency resolving the bearer token to the current user
+    
+    Raises:
+        HTTPException: 401 when the token is missing, invalid or expired
+    """
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+    
+    principal = authenticate_token(credentials.credentials)
+    if principal is None:
+        raise _unauthorized("Invalid or expired token")
+    return principal
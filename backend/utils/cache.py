@@ -0,0 +1,77 @@
+"""In-process Caching Utilities
+
+Small TTL cache used to keep hot, rarely changing API data in memory.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded in-memory cache with per-entry expiry
+
+    Entries expire ``ttl`` seconds after they are stored. When ``maxsize``
+    is reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        value, stored_at, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value in the cache
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Lifetime of this entry, capped at the cache TTL
+        """
+        now = time.monotonic()
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (value, now, now + lifetime)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Seconds since the entry was stored, or None if not cached"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return time.monotonic() - entry[1]
+
+    def invalidate(self, key: Hashable):
+        """Remove a single entry from the cache"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
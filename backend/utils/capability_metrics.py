@@ -0,0 +1,212 @@
+"""Capability Metrics Engine
+
+Computes capability metrics for a release and the releases of its project
+that precede it:
+
+- coverage: share of the release's test cases executed at least once
+- pass / fail rates and their change from the previous release
+- defect density: linked defects per executed test case
+- per-phase throughput: executions per active day
+
+Test case and execution records are loaded in bulk with projection-only
+cursors and reduced with vectorized pandas/NumPy operations (one groupby
+pass covers every release being computed). Per-release results are
+memoized by (release_id, data_version); the release summary hook bumps
+data_version whenever a release's records change, so warm requests only
+read the releases collection.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.config import (
+    METRICS_MAX_RELEASES,
+    METRICS_CURSOR_BATCH_SIZE,
+    METRICS_CACHE_SIZE,
+    METRICS_CACHE_TTL_SECONDS
+)
+from database.mongodb import releases_collection, zephyrdata_collection, executions_collection
+from database.release_summaries import NOT_EXECUTED_STATUSES
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Loaded columns: field name -> projection expression
+TESTCASE_FIELDS = {"release_id": 1, "testcase_key": 1}
+EXECUTION_FIELDS = {
+    "release_id": 1,
+    "testcase_key": 1,
+    "status": 1,
+    "phase": 1,
+    "executed_at": 1,
+    "defect_count": {"$size": {"$ifNull": ["$defects", []]}}
+}
+
+# Columns of the per-release trend rows
+TREND_FIELDS = (
+    "total_testcases", "executions", "executed_testcases", "coverage",
+    "pass_rate", "fail_rate", "defects", "defect_density"
+)
+
+_metrics_cache = TTLCache(ttl=METRICS_CACHE_TTL_SECONDS, maxsize=METRICS_CACHE_SIZE)
+
+
+async def _load_frame(collection, query: Dict[str, Any], fields: Dict[str, Any]) -> pd.DataFrame:
+    """Read the projected fields of every matching document into a DataFrame
+
+    Values are accumulated column-wise so no per-document dictionaries are
+    kept alive while the cursor drains.
+    """
+    columns: Dict[str, List[Any]] = {field: [] for field in fields}
+    cursor = collection.aggregate(
+        [{"$match": query}, {"$project": {"_id": 0, **fields}}],
+        batchSize=METRICS_CURSOR_BATCH_SIZE
+    )
+    async for doc in cursor:
+        for field, values in columns.items():
+            values.append(doc.get(field))
+    return pd.DataFrame(columns, columns=list(fields))
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series, scale: float = 1.0) -> pd.Series:
+    """Element-wise numerator / denominator, 0 where the denominator is 0"""
+    num = numerator.to_numpy(dtype=float)
+    den = denominator.to_numpy(dtype=float)
+    values = np.divide(num * scale, den, out=np.zeros_like(num), where=den > 0)
+    return pd.Series(values, index=numerator.index).round(2)
+
+
+def compute_release_metrics(
+    release_ids: List[int],
+    testcases: pd.DataFrame,
+    executions: pd.DataFrame
+) -> Dict[int, Dict[str, Any]]:
+    """Compute metrics of several releases in one vectorized pass
+
+    Args:
+        release_ids: Releases to compute (releases without records get zeros)
+        testcases: Columns release_id, testcase_key
+        executions: Columns release_id, testcase_key, status, phase, executed_at, defect_count
+
+    Returns:
+        Dict mapping release ID to its metrics
+    """
+    index = pd.Index(release_ids, name="release_id")
+
+    keys = ["release_id", "testcase_key"]
+    release_testcases = testcases[keys].drop_duplicates()
+
+    # Statuses are classified once per distinct value, then by code lookup
+    codes, uniques = pd.factorize(executions["status"])
+    lowered = np.array([str(u).lower() for u in uniques] + [""], dtype=object)  # code -1 (missing) -> ""
+    was_executed = (lowered != "") & ~np.isin(lowered, NOT_EXECUTED_STATUSES)
+    executed = executions[was_executed[codes]].assign(
+        passed=(lowered == "pass")[codes][was_executed[codes]],
+        failed=(lowered == "fail")[codes][was_executed[codes]]
+    )
+    by_release = executed.groupby("release_id")
+
+    # Coverage only counts executions of test cases that belong to the release
+    covered = executed[keys].drop_duplicates().merge(release_testcases, on=keys)
+
+    frame = pd.DataFrame({
+        "total_testcases": release_testcases.groupby("release_id").size(),
+        "executions": by_release.size(),
+        "executed_testcases": covered.groupby("release_id").size(),
+        "passed": by_release["passed"].sum(),
+        "failed": by_release["failed"].sum(),
+        "defects": by_release["defect_count"].sum()
+    }).reindex(index).fillna(0).astype(int)
+
+    frame["coverage"] = _ratio(frame["executed_testcases"], frame["total_testcases"], 100)
+    frame["pass_rate"] = _ratio(frame["passed"], frame["executions"], 100)
+    frame["fail_rate"] = _ratio(frame["failed"], frame["executions"], 100)
+    frame["defect_density"] = _ratio(frame["defects"], frame["executed_testcases"])
+
+    # Per-phase throughput: executions per day on which the phase had executions
+    phases = executed.assign(
+        phase=executed["phase"].fillna("unspecified"),
+        day=pd.to_datetime(executed["executed_at"], errors="coerce", utc=True).dt.floor("D")
+    ).groupby(["release_id", "phase"]).agg(executions=("release_id", "size"), active_days=("day", "nunique"))
+    phases["per_day"] = _ratio(phases["executions"], phases["active_days"])
+
+    phases_by_release: Dict[int, Dict[str, Any]] = {}
+    for (release_id, phase), row in phases.iterrows():
+        phases_by_release.setdefault(release_id, {})[phase] = {
+            "executions": int(row["executions"]),
+            "active_days": int(row["active_days"]),
+            "per_day": float(row["per_day"])
+        }
+
+    return {
+        int(release_id): {**row, "phase_throughput": phases_by_release.get(release_id, {})}
+        for release_id, row in frame.to_dict("index").items()
+    }
+
+
+async def _compute_and_cache(releases: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Load records of the given releases in bulk and memoize their metrics"""
+    release_ids = [r["id"] for r in releases]
+    testcases, executions = await asyncio.gather(
+        _load_frame(zephyrdata_collection, {"release_id": {"$in": release_ids}, "type": "testcase"}, TESTCASE_FIELDS),
+        _load_frame(executions_collection, {"release_id": {"$in": release_ids}}, EXECUTION_FIELDS)
+    )
+
+    # pandas work is CPU bound; keep it off the event loop
+    metrics = await asyncio.to_thread(compute_release_metrics, release_ids, testcases, executions)
+    for release in releases:
+        _metrics_cache.set((release["id"], release.get("data_version", 0)), metrics[release["id"]])
+
+    logger.info(f"✅ Capability metrics computed for {len(release_ids)} releases "
+                f"({len(testcases)} test cases, {len(executions)} executions)")
+    return metrics
+
+
+async def get_capability_metrics(release_id: int) -> Optional[Dict[str, Any]]:
+    """Capability metrics of a release with the trend across its project
+
+    Args:
+        release_id: Release ID
+
+    Returns:
+        Metrics document, or None if the release does not exist
+    """
+    release = await releases_collection.find_one({"id": release_id}, projection={"_id": 0, "project_id": 1})
+    if not release:
+        return None
+
+    # The selected release and the ones before it (index on project_id, id)
+    releases = await releases_collection.find(
+        {"project_id": release["project_id"], "id": {"$lte": release_id}},
+        projection={"_id": 0, "id": 1, "name": 1, "data_version": 1}
+    ).sort("id", -1).limit(METRICS_MAX_RELEASES).to_list(length=METRICS_MAX_RELEASES)
+
+    releases.reverse()
+    metrics = {r["id"]: _metrics_cache.get((r["id"], r.get("data_version", 0))) for r in releases}
+    stale = [r for r in releases if metrics[r["id"]] is None]
+    if stale:
+        metrics.update(await _compute_and_cache(stale))
+
+    trend = pd.DataFrame(
+        [{field: metrics[r["id"]][field] for field in TREND_FIELDS} for r in releases],
+        index=[r["id"] for r in releases]
+    )
+    trend["pass_rate_change"] = trend["pass_rate"].diff().fillna(0).round(2)
+    trend["fail_rate_change"] = trend["fail_rate"].diff().fillna(0).round(2)
+    rows = trend.to_dict("index")
+
+    current = rows[release_id]
+    return {
+        "release_id": release_id,
+        "project_id": release["project_id"],
+        "current": {
+            **metrics[release_id],
+            "pass_rate_change": current["pass_rate_change"],
+            "fail_rate_change": current["fail_rate_change"]
+        },
+        "releases": [{"release_id": r["id"], "name": r.get("name"), **rows[r["id"]]} for r in releases]
+    }
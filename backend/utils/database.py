@@ -4,10 +4,28 @@ Handles Oracle database connections, query execution, and connection pooling.
 """
 
 import oracledb
+import asyncio
+import functools
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
-from contextlib import contextmanager
+import re
+import threading
+import time
+from collections import defaultdict, namedtuple
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, AsyncIterator, Callable, Sequence, Tuple, Union
+from contextlib import contextmanager, asynccontextmanager
 from config.config import ORACLE_CONFIG
+from config.queries import (
+    UserQueries,
+    ProjectQueries,
+    ReleaseQueries,
+    DashboardQueries,
+    UtilityQueries,
+    query_registry
+)
+from utils.db_metrics import PoolMetrics, statement_metrics
 import os
 
 logger = logging.getLogger(__name__)
@@ -16,39 +34,234 @@ logger = logging.getLogger(__name__)
 MOCK_MODE = os.environ.get('DB_MOCK_MODE', 'true').lower() == 'true'
 
 
+def _pool_params() -> Dict[str, Any]:
+    """Build connection pool arguments from ORACLE_CONFIG"""
+    return {
+        'user': ORACLE_CONFIG['user'],
+        'password': ORACLE_CONFIG['password'],
+        'dsn': ORACLE_CONFIG['dsn'],
+        'min': ORACLE_CONFIG.get('min_pool', 2),
+        'max': ORACLE_CONFIG.get('max_pool', 10),
+        'increment': ORACLE_CONFIG.get('increment', 1),
+        # Bounded acquire waits instead of blocking forever on a busy pool
+        'getmode': oracledb.POOL_GETMODE_TIMEDWAIT,
+        'wait_timeout': int(ORACLE_CONFIG.get('pool_timeout', 30) * 1000),
+        'max_lifetime_session': ORACLE_CONFIG.get('max_lifetime_session', 0),
+        'ping_interval': ORACLE_CONFIG.get('ping_interval', 60),
+        # Large enough to keep every registered statement parsed per session
+        'stmtcachesize': max(ORACLE_CONFIG.get('stmtcachesize', 20), len(query_registry)),
+    }
+
+
+@contextmanager
+def _timed(query: str):
+    """Record execution count and latency of a statement"""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        statement_metrics.record(query_registry.statement_id(query), time.perf_counter() - start, error)
+
+
+def _is_pool_timeout(error: Exception) -> bool:
+    """Check whether an acquire failed because the pool wait timed out"""
+    if isinstance(error, oracledb.Error) and error.args:
+        return getattr(error.args[0], 'full_code', None) == 'DPY-4005'
+    return False
+
+
+def _row_factory(columns: Sequence[str], row_format: str) -> Callable:
+    """Build a converter from raw row tuples to the requested format
+    
+    Args:
+        columns: Column names from cursor.description
+        row_format: 'dict', 'tuple' or 'namedtuple'
+    """
+    if row_format == 'tuple':
+        return tuple
+    if row_format == 'namedtuple':
+        return namedtuple('Row', columns, rename=True)._make
+    if row_format == 'dict':
+        return lambda row: dict(zip(columns, row))
+    raise ValueError(f"Unsupported row format: {row_format}")
+
+
+def _prepare_cursor(cursor, arraysize: Optional[int], prefetchrows: Optional[int]):
+    """Apply fetch batch sizes to a cursor (must run before execute)"""
+    cursor.arraysize = arraysize or ORACLE_CONFIG.get('arraysize', 100)
+    cursor.prefetchrows = prefetchrows or ORACLE_CONFIG.get('prefetchrows', 2)
+
+
+def _batched(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Split an iterable of bind rows into lists of at most batch_size"""
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _batch_size(batch_size: Optional[int]) -> int:
+    return batch_size or ORACLE_CONFIG.get('batch_size', 1000)
+
+
+class MockIntegrityError(Exception):
+    """Raised by the mock engine when a unique constraint would be violated"""
+
+
+class MockTable:
+    """In-memory table with a primary key and hash indexes
+    
+    Rows are stored in a dict keyed by primary key; each indexed column
+    maps values to the set of primary keys holding them, so lookups by
+    primary or indexed column are O(1).
+    """
+    
+    def __init__(self, name: str, primary_key: Union[str, Tuple[str, ...]], indexes: Sequence[str] = (),
+                 unique: Sequence[str] = ()):
+        self.name = name
+        self.primary_key = primary_key
+        self._key_columns = primary_key if isinstance(primary_key, tuple) else (primary_key,)
+        self.unique = set(unique)
+        self.rows: Dict[Any, Dict[str, Any]] = {}
+        self.indexes: Dict[str, Dict[Any, set]] = {
+            column: defaultdict(set) for column in set(indexes) | self.unique
+        }
+    
+    def key(self, row: Dict[str, Any]) -> Any:
+        """Primary key value of a row (a tuple for composite keys)"""
+        if len(self._key_columns) == 1:
+            return row[self._key_columns[0]]
+        return tuple(row[column] for column in self._key_columns)
+    
+    def _index(self, row: Dict[str, Any]):
+        pk = self.key(row)
+        for column, index in self.indexes.items():
+            index[row.get(column)].add(pk)
+    
+    def _unindex(self, row: Dict[str, Any]):
+        pk = self.key(row)
+        for column, index in self.indexes.items():
+            keys = index.get(row.get(column))
+            if keys:
+                keys.discard(pk)
+                if not keys:
+                    del index[row.get(column)]
+    
+    def _check_unique(self, row: Dict[str, Any], ignore_pk: Any = None):
+        for column in self.unique:
+            holders = self.indexes[column].get(row.get(column), set()) - {ignore_pk}
+            if holders:
+                raise MockIntegrityError(f"ORA-00001: unique constraint ({self.name}.{column}) violated")
+    
+    def insert(self, row: Dict[str, Any]) -> int:
+        """Insert a row, enforcing primary key and unique columns"""
+        pk = self.key(row)
+        if pk in self.rows:
+            raise MockIntegrityError(f"ORA-00001: unique constraint ({self.name}.{self.primary_key}) violated")
+        self._check_unique(row)
+        self.rows[pk] = dict(row)
+        self._index(row)
+        return 1
+    
+    def get(self, pk: Any) -> Optional[Dict[str, Any]]:
+        """Look up a row by primary key"""
+        return self.rows.get(pk)
+    
+    def find(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        """Look up rows by an indexed column"""
+        if column == self.primary_key:
+            row = self.rows.get(value)
+            return [row] if row else []
+        return [self.rows[pk] for pk in self.indexes[column].get(value, ())]
+    
+    def update(self, pk: Any, changes: Dict[str, Any]) -> int:
+        """Update a row by primary key, keeping indexes in sync"""
+        row = self.rows.get(pk)
+        if row is None:
+            return 0
+        self._check_unique({**row, **changes}, ignore_pk=pk)
+        self._unindex(row)
+        row.update(changes)
+        self._index(row)
+        return 1
+    
+    def delete(self, pk: Any) -> int:
+        """Delete a row by primary key"""
+        row = self.rows.pop(pk, None)
+        if row is None:
+            return 0
+        self._unindex(row)
+        return 1
+    
+    def all(self) -> List[Dict[str, Any]]:
+        return list(self.rows.values())
+
+
+def _select_columns(query: str) -> List[str]:
+    """Output column names of a SELECT, honoring aliases"""
+    select_list = re.search(r'SELECT\s+(.*?)\s+FROM\s', query, re.IGNORECASE | re.DOTALL).group(1)
+    return [item.split()[-1].split('.')[-1].upper() for item in select_list.split(',')]
+
+
+def _to_date(value: Optional[str]) -> Optional[datetime]:
+    """Mock TO_DATE(:value, 'YYYY-MM-DD')"""
+    return datetime.strptime(value, '%Y-%m-%d') if value else None
+
+
 class MockDatabase:
-    """Mock database for development/testing without Oracle DB"""
+    """Mock database for development/testing without Oracle DB
+    
+    A small in-memory table engine. Statements are dispatched by identity
+    to a handler per query defined in config/queries.py, so reads are
+    indexed lookups and INSERT/UPDATE/DELETE statements persist.
+    """
     
     def __init__(self):
         logger.info("⚠️ Running in MOCK DATABASE mode - no real Oracle connection")
+        self._lock = threading.RLock()
         self._load_mock_data()
+        self._register_handlers()
     
     def _load_mock_data(self):
         """Load mock data for testing"""
+        self.users = MockTable('USERS', 'USER_ID', unique=['USER_SOEID'])
+        self.projects = MockTable('PROJECTS', 'PROJECT_ID')
+        self.releases = MockTable('RELEASES', 'RELEASE_ID', indexes=['PROJECT_ID'])
+        self.user_projects = MockTable('USER_PROJECTS', ('USER_ID', 'PROJECT_ID'), indexes=['USER_ID'])
+        self.sequences = {'USER_ID_SEQ': 1, 'PROJECT_ID_SEQ': 5, 'RELEASE_ID_SEQ': 3}
+        
         # Mock users (passcode: 1234 hashed)
-        self.users = [
-            {
-                'USER_ID': 1, 'USER_SOEID': 'TEST123', 'USER_NAME': 'John Smith',
-                'USER_PASSWORD': '03ac674216f3e15c761ee1a5e255f067953623c8b388b4459e13f978d7c846f4',
-                'USER_ROLE': 'Admin', 'USER_TEAMID': 'TEAM-A', 'MANAGER_SOEID': 'MGR001',
-                'MANAGER_ID': 100, 'ZEPHYR_PROJECTLIST': '1,2,3', 'MANAGER_VERIFIED': 'YES',
-                'CURR_VERSION': '1.0', 'LIB_FLAG': 'Y', 'ZEPHYR_TOKEN': None, 'JIRA_TOKEN': None,
-                'ZEPHYR_BASEFOLDERID': None, 'ZEPHYR_PROJECTID': None, 'JIRA_PROJECTID': None
-            }
-        ]
+        self.users.insert({
+            'USER_ID': 1, 'USER_SOEID': 'TEST123', 'USER_NAME': 'John Smith',
+            'USER_PASSWORD': '03ac674216f3e15c761ee1a5e255f067953623c8b388b4459e13f978d7c846f4',
+            'USER_ROLE': 'Admin', 'USER_TEAMID': 'TEAM-A', 'MANAGER_SOEID': 'MGR001',
+            'MANAGER_ID': 100, 'ZEPHYR_PROJECTLIST': '1,2,3', 'MANAGER_VERIFIED': 'YES',
+            'CURR_VERSION': '1.0', 'LIB_FLAG': 'Y', 'ZEPHYR_TOKEN': None, 'JIRA_TOKEN': None,
+            'ZEPHYR_BASEFOLDERID': None, 'ZEPHYR_PROJECTID': None, 'JIRA_PROJECTID': None,
+            'LAST_LOGIN': None
+        })
+        
+        for project_id in (1, 2, 3):
+            self.user_projects.insert({'USER_ID': 1, 'PROJECT_ID': project_id})
         
         # Mock projects
-        self.projects = [
+        for project in [
             {'PROJECT_ID': 1, 'PROJECT_NAME': 'CQE Platform'},
             {'PROJECT_ID': 2, 'PROJECT_NAME': 'Test Automation Suite'},
             {'PROJECT_ID': 3, 'PROJECT_NAME': 'API Gateway'},
             {'PROJECT_ID': 4, 'PROJECT_NAME': 'Analytics Engine'},
             {'PROJECT_ID': 5, 'PROJECT_NAME': 'Mobile Application'},
-        ]
+        ]:
+            self.projects.insert(project)
         
         # Mock releases
-        from datetime import datetime
-        self.releases = [
+        for release in [
             {'RELEASE_ID': 1, 'PROJECT_ID': 1, 'RELEASE_NAME': 'Release v2.5.0',
              'RELEASE_START_DATE': datetime(2024, 1, 1), 'RELEASE_END_DATE': datetime(2024, 3, 31),
              'BUILD_RELEASE': 'BUILD-250', 'CONFLUENCE_PAGEID': 'PAGE-12345',
@@ -64,38 +277,157 @@ class MockDatabase:
              'BUILD_RELEASE': 'BUILD-240', 'CONFLUENCE_PAGEID': 'PAGE-12347',
              'CONFLUENCE_TOKEN': None, 'CONF_UPDATE': 'YES', 'CONFTEAM_NAME': 'CQE Team Alpha',
              'CONFEND_DATE': None},
+        ]:
+            self.releases.insert(release)
+    
+    def _register_handlers(self):
+        """Map each statement in config/queries.py to its handler"""
+        self._handlers = {
+            UserQueries.GET_USER_BY_SOEID: lambda p: self.users.find('USER_SOEID', p.get('soeid')),
+            UserQueries.GET_USER_BY_ID: lambda p: self.users.find('USER_ID', p.get('user_id')),
+            UserQueries.GET_ALL_USERS: lambda p: sorted(self.users.all(), key=lambda u: u['USER_NAME'] or ''),
+            UserQueries.INSERT_USER: self._insert_user,
+            UserQueries.UPDATE_LAST_LOGIN: lambda p: self.users.update(p['user_id'], {'LAST_LOGIN': datetime.now()}),
+            UserQueries.UPDATE_PASSWORD: lambda p: self.users.update(p['user_id'], {'USER_PASSWORD': p['password']}),
+            UserQueries.UPDATE_USER_ROLE: lambda p: self.users.update(p['user_id'], {'USER_ROLE': p['role']}),
+            UserQueries.UPDATE_USER_TOKENS: lambda p: self.users.update(p['user_id'], {
+                'ZEPHYR_TOKEN': p['zephyr_token'], 'JIRA_TOKEN': p['jira_token']
+            }),
+            
+            ProjectQueries.GET_ALL_PROJECTS: lambda p: sorted(self.projects.all(), key=lambda r: r['PROJECT_NAME']),
+            ProjectQueries.GET_PROJECT_BY_ID: lambda p: self.projects.find('PROJECT_ID', p.get('project_id')),
+            ProjectQueries.GET_USER_PROJECTS: self._get_user_projects,
+            ProjectQueries.INSERT_USER_PROJECT: self._insert_user_project,
+            ProjectQueries.DELETE_USER_PROJECTS: self._delete_user_projects,
+            ProjectQueries.GET_USER_PROJECT_LISTS: lambda p: [
+                u for u in self.users.all() if u.get('ZEPHYR_PROJECTLIST') is not None
+            ],
+            ProjectQueries.INSERT_PROJECT: lambda p: self.projects.insert({
+                'PROJECT_ID': p['project_id'], 'PROJECT_NAME': p['project_name']
+            }),
+            ProjectQueries.UPDATE_PROJECT: lambda p: self.projects.update(p['project_id'], {
+                'PROJECT_NAME': p['project_name']
+            }),
+            
+            ReleaseQueries.GET_RELEASES_BY_PROJECT: lambda p: sorted(
+                self.releases.find('PROJECT_ID', p.get('project_id')),
+                key=lambda r: r['RELEASE_START_DATE'] or datetime.min, reverse=True
+            ),
+            ReleaseQueries.GET_RELEASE_BY_ID: lambda p: self.releases.find('RELEASE_ID', p.get('release_id')),
+            ReleaseQueries.GET_ACTIVE_RELEASES: self._get_active_releases,
+            ReleaseQueries.INSERT_RELEASE: lambda p: self.releases.insert({
+                'RELEASE_ID': p['release_id'], 'PROJECT_ID': p['project_id'], **self._release_fields(p)
+            }),
+            ReleaseQueries.UPDATE_RELEASE: lambda p: self.releases.update(p['release_id'], self._release_fields(p)),
+            ReleaseQueries.DELETE_RELEASE: lambda p: self.releases.delete(p['release_id']),
+            
+            DashboardQueries.GET_ZEPHYR_STATS: lambda p: [{
+                'TOTAL_RELEASES': len(self.releases.find('PROJECT_ID', p.get('project_id'))),
+                'CURRENT_RELEASE_ID': p.get('release_id')
+            }],
+            DashboardQueries.GET_JIRA_STATS: lambda p: [{
+                'TOTAL_RELEASES': len(self.releases.find('PROJECT_ID', p.get('project_id')))
+            }],
+            
+            UtilityQueries.TEST_CONNECTION: lambda p: [{'1': 1}],
+            "SELECT 1 FROM DUAL": lambda p: [{'1': 1}],
+            UtilityQueries.GET_NEXT_USER_ID: lambda p: self._next_values('USER_ID_SEQ', p),
+            UtilityQueries.GET_NEXT_PROJECT_ID: lambda p: self._next_values('PROJECT_ID_SEQ', p),
+            UtilityQueries.GET_NEXT_RELEASE_ID: lambda p: self._next_values('RELEASE_ID_SEQ', p),
+        }
+        
+        # Output columns of every SELECT, resolved once
+        self._columns = {
+            query_registry.statement_id(query): _select_columns(query)
+            for query in self._handlers
+            if query.lstrip().upper().startswith('SELECT')
+        }
+        
+        # Dispatch on the registry's statement ID rather than the SQL text
+        self._handlers = {
+            query_registry.statement_id(query): handler
+            for query, handler in self._handlers.items()
+        }
+    
+    def _insert_user(self, p: Dict[str, Any]) -> int:
+        return self.users.insert({
+            'USER_ID': p['user_id'], 'USER_SOEID': p['soeid'], 'USER_NAME': p['user_name'],
+            'USER_PASSWORD': p['password'], 'USER_ROLE': p['role'], 'USER_TEAMID': p['team_id'],
+            'LAST_LOGIN': datetime.now(), 'MANAGER_VERIFIED': p['manager_verified'],
+            'CURR_VERSION': p['version'], 'LIB_FLAG': p['lib_flag']
+        })
+    
+    def _get_user_projects(self, p: Dict[str, Any]) -> List[Dict[str, Any]]:
+        projects = [
+            self.projects.get(mapping['PROJECT_ID'])
+            for mapping in self.user_projects.find('USER_ID', p.get('user_id'))
+        ]
+        return sorted((r for r in projects if r), key=lambda r: r['PROJECT_NAME'])
+    
+    def _insert_user_project(self, p: Dict[str, Any]) -> int:
+        row = {'USER_ID': p['user_id'], 'PROJECT_ID': p['project_id']}
+        if self.user_projects.get(self.user_projects.key(row)):
+            return 0
+        return self.user_projects.insert(row)
+    
+    def _delete_user_projects(self, p: Dict[str, Any]) -> int:
+        mappings = self.user_projects.find('USER_ID', p['user_id'])
+        return sum(self.user_projects.delete(self.user_projects.key(m)) for m in mappings)
+    
+    def _get_active_releases(self, p: Dict[str, Any]) -> List[Dict[str, Any]]:
+        now = datetime.now()
+        active = [
+            r for r in self.releases.all()
+            if r['RELEASE_START_DATE'] and r['RELEASE_END_DATE']
+            and r['RELEASE_START_DATE'] <= now <= r['RELEASE_END_DATE']
         ]
+        return sorted(active, key=lambda r: r['RELEASE_START_DATE'], reverse=True)
+    
+    @staticmethod
+    def _release_fields(p: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'RELEASE_NAME': p['release_name'],
+            'RELEASE_START_DATE': _to_date(p.get('start_date')),
+            'RELEASE_END_DATE': _to_date(p.get('end_date')),
+            'BUILD_RELEASE': p.get('build_release'),
+            'CONFLUENCE_PAGEID': p.get('confluence_pageid'),
+            'CONFLUENCE_TOKEN': p.get('confluence_token'),
+            'CONF_UPDATE': p.get('conf_update'),
+            'CONFTEAM_NAME': p.get('confteam_name'),
+            'CONFEND_DATE': _to_date(p.get('confend_date')),
+        }
+    
+    def _next_values(self, sequence: str, p: Dict[str, Any]) -> List[Dict[str, Any]]:
+        count = p.get('count', 1)
+        first = self.sequences[sequence] + 1
+        self.sequences[sequence] += count
+        return [{'NEXT_ID': value} for value in range(first, first + count)]
+    
+    def _dispatch(self, query: str, params: Optional[Dict[str, Any]]):
+        handler = self._handlers.get(query_registry.statement_id(query))
+        if handler is None:
+            logger.warning(f"Mock database has no handler for statement: {' '.join(query.split())[:80]}...")
+            return None
+        with _timed(query), self._lock:
+            return handler(params or {})
     
     def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Mock execute query"""
-        params = params or {}
-        
-        # Simple query matching
-        if 'FROM USERS' in query:
-            if 'USER_SOEID = :soeid' in query:
-                soeid = params.get('soeid')
-                return [u for u in self.users if u['USER_SOEID'] == soeid]
-            return self.users
-        
-        elif 'FROM PROJECTS' in query:
-            if 'PROJECT_ID = :project_id' in query:
-                project_id = params.get('project_id')
-                return [p for p in self.projects if p['PROJECT_ID'] == project_id]
-            return self.projects
-        
-        elif 'FROM RELEASES' in query:
-            if 'PROJECT_ID = :project_id' in query:
-                project_id = params.get('project_id')
-                return [r for r in self.releases if r['PROJECT_ID'] == project_id]
-            elif 'RELEASE_ID = :release_id' in query:
-                release_id = params.get('release_id')
-                return [r for r in self.releases if r['RELEASE_ID'] == release_id]
-            return self.releases
-        
-        elif 'FROM DUAL' in query:
-            return [{'1': 1}]
-        
-        return []
+        rows = self._dispatch(query, params) or []
+        columns = self._columns.get(query_registry.statement_id(query))
+        if not columns:
+            return [dict(row) for row in rows]
+        return [{column: row.get(column) for column in columns} for row in rows]
+    
+    def iter_query(self, query: str, params: Dict[str, Any] = None, row_format: str = 'dict',
+                   arraysize: int = None, prefetchrows: int = None) -> Iterator[Any]:
+        """Mock streaming query"""
+        rows = self.execute_query(query, params)
+        if not rows:
+            return
+        make_row = _row_factory(tuple(rows[0].keys()), row_format)
+        for row in rows:
+            yield make_row(tuple(row.values())) if row_format != 'dict' else row
     
     def execute_one(self, query: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Mock execute one"""
@@ -104,47 +436,82 @@ class MockDatabase:
     
     def execute_update(self, query: str, params: Dict[str, Any] = None) -> int:
         """Mock execute update"""
-        logger.info(f"Mock update: {query[:50]}...")
-        return 1
+        return self._dispatch(query, params) or 0
+    
+    def execute_many(self, query: str, rows: Iterable[Any], batch_size: int = None) -> Dict[str, Any]:
+        """Mock batch DML, applying each row through execute_update"""
+        result = {"rows_affected": 0, "batches": 0, "errors": []}
+        offset = 0
+        for batch in _batched(rows, _batch_size(batch_size)):
+            for index, row in enumerate(batch):
+                try:
+                    result["rows_affected"] += self.execute_update(query, row)
+                except MockIntegrityError as e:
+                    result["errors"].append({"row": offset + index, "message": str(e)})
+            offset += len(batch)
+            result["batches"] += 1
+        return result
     
     def test_connection(self) -> bool:
         """Mock connection test"""
         return True
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """Mock pool metrics"""
+        return {"mock": True, **PoolMetrics().snapshot()}
+    
     def close_pool(self):
         """Mock close pool"""
         pass
 
 
 class DatabaseManager:
-    """Manages Oracle database connections and operations"""
+    """Manages Oracle database connections and operations
+    
+    The pool is created on first use: in native async mode the API serves
+    requests from AsyncDatabaseManager, and only scripts (migrations,
+    benchmarks) need synchronous sessions.
+    """
     
     def __init__(self):
         self.pool = None
-        self._initialize_pool()
+        self.metrics = PoolMetrics()
+        self._pool_lock = threading.Lock()
     
     def _initialize_pool(self):
         """Initialize Oracle connection pool"""
+        with self._pool_lock:
+            if self.pool is not None:
+                return
+            try:
+                self.pool = oracledb.create_pool(**_pool_params())
+                logger.info("✅ Oracle connection pool created successfully")
+            except Exception as e:
+                logger.error(f"❌ Failed to create Oracle connection pool: {e}")
+                raise
+    
+    def _acquire(self):
+        """Acquire a pooled connection, recording wait time and timeouts"""
+        if self.pool is None:
+            self._initialize_pool()
+        start = time.perf_counter()
         try:
-            self.pool = oracledb.create_pool(
-                user=ORACLE_CONFIG['user'],
-                password=ORACLE_CONFIG['password'],
-                dsn=ORACLE_CONFIG['dsn'],
-                min=ORACLE_CONFIG.get('min_pool', 2),
-                max=ORACLE_CONFIG.get('max_pool', 10),
-                increment=ORACLE_CONFIG.get('increment', 1)
-            )
-            logger.info("✅ Oracle connection pool created successfully")
+            connection = self.pool.acquire()
         except Exception as e:
-            logger.error(f"❌ Failed to create Oracle connection pool: {e}")
+            if _is_pool_timeout(e):
+                self.metrics.record_timeout()
+            else:
+                self.metrics.record_error()
             raise
+        self.metrics.record_acquire(time.perf_counter() - start)
+        return connection
     
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
         connection = None
         try:
-            connection = self.pool.acquire()
+            connection = self._acquire()
             yield connection
         except Exception as e:
             logger.error(f"Database connection error: {e}")
@@ -157,19 +524,43 @@ class DatabaseManager:
     
     def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Execute SELECT query and return results as list of dictionaries"""
+        return list(self.iter_query(query, params))
+    
+    def iter_query(self, query: str, params: Dict[str, Any] = None, row_format: str = 'dict',
+                   arraysize: int = None, prefetchrows: int = None) -> Iterator[Any]:
+        """Execute SELECT query and yield rows as they are fetched
+        
+        Rows are pulled from the server in ``arraysize`` batches, so memory
+        stays bounded regardless of the result size. The connection is held
+        until the generator is exhausted or closed.
+        
+        Args:
+            query: SQL query
+            params: Bind parameters
+            row_format: 'dict', 'tuple' or 'namedtuple'
+            arraysize: Rows per fetch round trip (defaults to ORACLE_CONFIG)
+            prefetchrows: Rows returned with the execute (defaults to ORACLE_CONFIG)
+            
+        Yields:
+            One row per result in the requested format
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute(query, params or {})
-                
-                # Get column names
-                columns = [col[0] for col in cursor.description]
+                _prepare_cursor(cursor, arraysize, prefetchrows)
+                with _timed(query):
+                    cursor.execute(query, params or {})
                 
-                # Fetch all rows and convert to list of dictionaries
-                rows = cursor.fetchall()
-                results = [dict(zip(columns, row)) for row in rows]
+                # Column names are resolved once and shared by every row
+                columns = tuple(col[0] for col in cursor.description)
+                make_row = _row_factory(columns, row_format)
                 
-                return results
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield make_row(row)
             finally:
                 cursor.close()
     
@@ -178,7 +569,8 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute(query, params or {})
+                with _timed(query):
+                    cursor.execute(query, params or {})
                 
                 # Get column names
                 columns = [col[0] for col in cursor.description]
@@ -197,7 +589,8 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute(query, params or {})
+                with _timed(query):
+                    cursor.execute(query, params or {})
                 conn.commit()
                 return cursor.rowcount
             except Exception as e:
@@ -207,12 +600,53 @@ class DatabaseManager:
             finally:
                 cursor.close()
     
+    def execute_many(self, query: str, rows: Iterable[Any], batch_size: int = None) -> Dict[str, Any]:
+        """Execute INSERT/UPDATE/DELETE for many bind rows with executemany
+        
+        Rows are sent in batches of ``batch_size`` on a single connection,
+        with one round trip and one commit per batch. Rows rejected by the
+        database (constraint violations, bad values) are reported through
+        batch errors instead of failing the whole batch.
+        
+        Args:
+            query: DML statement
+            rows: Iterable of bind dictionaries or tuples
+            batch_size: Rows per executemany call (defaults to ORACLE_CONFIG)
+            
+        Returns:
+            Dictionary with rows_affected, batches and per-row errors
+        """
+        result = {"rows_affected": 0, "batches": 0, "errors": []}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                offset = 0
+                for batch in _batched(rows, _batch_size(batch_size)):
+                    with _timed(query):
+                        cursor.executemany(query, batch, batcherrors=True)
+                    for error in cursor.getbatcherrors():
+                        result["errors"].append({"row": offset + error.offset, "message": error.message})
+                    conn.commit()
+                    result["rows_affected"] += cursor.rowcount
+                    result["batches"] += 1
+                    offset += len(batch)
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Batch update failed after {result['batches']} batches: {e}")
+                raise
+            finally:
+                cursor.close()
+        
+        if result["errors"]:
+            logger.warning(f"⚠️ Batch update rejected {len(result['errors'])} rows")
+        return result
+    
     def test_connection(self) -> bool:
         """Test database connectivity"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT 1 FROM DUAL")
+                cursor.execute(UtilityQueries.TEST_CONNECTION)
                 cursor.fetchone()
                 cursor.close()
             logger.info("✅ Database connection test successful")
@@ -221,16 +655,258 @@ class DatabaseManager:
             logger.error(f"❌ Database connection test failed: {e}")
             return False
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """Live pool counts and acquire metrics"""
+        return self.metrics.snapshot(self.pool)
+    
     def close_pool(self):
         """Close the connection pool"""
         if self.pool:
             self.pool.close()
+            self.pool = None
             logger.info("Connection pool closed")
 
 
+class AsyncDatabaseManager:
+    """Manages Oracle connections on python-oracledb's asyncio pool
+    
+    Same query API as DatabaseManager, but every method is a coroutine so
+    FastAPI routes can await queries without blocking the event loop.
+    
+    The pool is created on the first acquire: create_pool_async() needs a
+    running event loop, which does not exist yet when this module is
+    imported.
+    """
+    
+    def __init__(self):
+        self.pool = None
+        self.metrics = PoolMetrics()
+        self._pool_lock = asyncio.Lock()
+    
+    async def _initialize_pool(self):
+        """Initialize async Oracle connection pool"""
+        async with self._pool_lock:
+            if self.pool is not None:
+                return
+            try:
+                self.pool = oracledb.create_pool_async(**_pool_params())
+                logger.info("✅ Oracle async connection pool created successfully")
+            except Exception as e:
+                logger.error(f"❌ Failed to create Oracle async connection pool: {e}")
+                raise
+    
+    async def _acquire(self):
+        """Acquire a pooled connection, recording wait time and timeouts"""
+        if self.pool is None:
+            await self._initialize_pool()
+        start = time.perf_counter()
+        try:
+            connection = await self.pool.acquire()
+        except Exception as e:
+            if _is_pool_timeout(e):
+                self.metrics.record_timeout()
+            else:
+                self.metrics.record_error()
+            raise
+        self.metrics.record_acquire(time.perf_counter() - start)
+        return connection
+    
+    @asynccontextmanager
+    async def get_connection(self):
+        """Async context manager for database connections"""
+        connection = None
+        try:
+            connection = await self._acquire()
+            yield connection
+        except Exception as e:
+            logger.error(f"Database connection error: {e}")
+            if connection:
+                await connection.rollback()
+            raise
+        finally:
+            if connection:
+                await self.pool.release(connection)
+    
+    async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Execute SELECT query and return results as list of dictionaries"""
+        return [row async for row in self.iter_query(query, params)]
+    
+    async def iter_query(self, query: str, params: Dict[str, Any] = None, row_format: str = 'dict',
+                         arraysize: int = None, prefetchrows: int = None) -> AsyncIterator[Any]:
+        """Execute SELECT query and yield rows as they are fetched
+        
+        Async counterpart of DatabaseManager.iter_query.
+        """
+        async with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                _prepare_cursor(cursor, arraysize, prefetchrows)
+                with _timed(query):
+                    await cursor.execute(query, params or {})
+                columns = tuple(col[0] for col in cursor.description)
+                make_row = _row_factory(columns, row_format)
+                
+                while True:
+                    rows = await cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield make_row(row)
+    
+    async def execute_one(self, query: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Execute SELECT query and return single result as dictionary"""
+        async with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                with _timed(query):
+                    await cursor.execute(query, params or {})
+                columns = [col[0] for col in cursor.description]
+                row = await cursor.fetchone()
+                return dict(zip(columns, row)) if row else None
+    
+    async def execute_update(self, query: str, params: Dict[str, Any] = None) -> int:
+        """Execute INSERT/UPDATE/DELETE query and return affected rows"""
+        async with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                try:
+                    with _timed(query):
+                        await cursor.execute(query, params or {})
+                    await conn.commit()
+                    return cursor.rowcount
+                except Exception as e:
+                    await conn.rollback()
+                    logger.error(f"Update query failed: {e}")
+                    raise
+    
+    async def execute_many(self, query: str, rows: Iterable[Any], batch_size: int = None) -> Dict[str, Any]:
+        """Execute DML for many bind rows with executemany
+        
+        Async counterpart of DatabaseManager.execute_many.
+        """
+        result = {"rows_affected": 0, "batches": 0, "errors": []}
+        async with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                try:
+                    offset = 0
+                    for batch in _batched(rows, _batch_size(batch_size)):
+                        with _timed(query):
+                            await cursor.executemany(query, batch, batcherrors=True)
+                        for error in cursor.getbatcherrors():
+                            result["errors"].append({"row": offset + error.offset, "message": error.message})
+                        await conn.commit()
+                        result["rows_affected"] += cursor.rowcount
+                        result["batches"] += 1
+                        offset += len(batch)
+                except Exception as e:
+                    await conn.rollback()
+                    logger.error(f"Batch update failed after {result['batches']} batches: {e}")
+                    raise
+        
+        if result["errors"]:
+            logger.warning(f"⚠️ Batch update rejected {len(result['errors'])} rows")
+        return result
+    
+    async def test_connection(self) -> bool:
+        """Test database connectivity"""
+        try:
+            async with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    await cursor.execute(UtilityQueries.TEST_CONNECTION)
+                    await cursor.fetchone()
+            logger.info("✅ Database connection test successful")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Database connection test failed: {e}")
+            return False
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Live pool counts and acquire metrics"""
+        return self.metrics.snapshot(self.pool)
+    
+    async def close_pool(self):
+        """Close the connection pool"""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+            logger.info("Async connection pool closed")
+
+
+class ThreadedDatabaseManager:
+    """Async facade that runs a synchronous database manager in threads
+    
+    Fallback for environments where the native async pool is unavailable
+    (e.g. python-oracledb thick mode). The executor is sized to the pool
+    maximum so queued queries wait for a thread rather than a connection.
+    """
+    
+    def __init__(self, db, max_workers: int = None):
+        self.db = db
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or ORACLE_CONFIG.get('max_pool', 10),
+            thread_name_prefix="oracle-db"
+        )
+    
+    async def _run(self, func, *args):
+        """Run a blocking call on the executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+    
+    async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Execute SELECT query and return results as list of dictionaries"""
+        return await self._run(self.db.execute_query, query, params)
+    
+    async def iter_query(self, query: str, params: Dict[str, Any] = None, row_format: str = 'dict',
+                         arraysize: int = None, prefetchrows: int = None) -> AsyncIterator[Any]:
+        """Execute SELECT query and yield rows as they are fetched
+        
+        The wrapped generator is advanced on the executor one fetch batch
+        at a time, so the event loop never waits on the database.
+        """
+        batch_size = arraysize or ORACLE_CONFIG.get('arraysize', 100)
+        rows = self.db.iter_query(query, params, row_format, arraysize, prefetchrows)
+        try:
+            while True:
+                batch = await self._run(lambda: list(itertools.islice(rows, batch_size)))
+                if not batch:
+                    break
+                for row in batch:
+                    yield row
+        finally:
+            await self._run(rows.close)
+    
+    async def execute_one(self, query: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Execute SELECT query and return single result as dictionary"""
+        return await self._run(self.db.execute_one, query, params)
+    
+    async def execute_update(self, query: str, params: Dict[str, Any] = None) -> int:
+        """Execute INSERT/UPDATE/DELETE query and return affected rows"""
+        return await self._run(self.db.execute_update, query, params)
+    
+    async def execute_many(self, query: str, rows: Iterable[Any], batch_size: int = None) -> Dict[str, Any]:
+        """Execute DML for many bind rows with executemany"""
+        return await self._run(self.db.execute_many, query, rows, batch_size)
+    
+    async def test_connection(self) -> bool:
+        """Test database connectivity"""
+        return await self._run(self.db.test_connection)
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Live pool counts and acquire metrics of the wrapped manager"""
+        return self.db.pool_stats()
+    
+    async def close_pool(self):
+        """Close the wrapped pool and stop the worker threads"""
+        await self._run(self.db.close_pool)
+        self._executor.shutdown(wait=False)
+
+
 # Global database manager instance
 if MOCK_MODE:
     logger.warning("🧪 Using MOCK database mode. Set DB_MOCK_MODE=false to use real Oracle DB")
     db_manager = MockDatabase()
 else:
     db_manager = DatabaseManager()
+
+# Async database manager for use from async routes
+if MOCK_MODE or ORACLE_CONFIG.get('async_mode') == 'thread':
+    async_db_manager = ThreadedDatabaseManager(db_manager)
+else:
+    async_db_manager = AsyncDatabaseManager()
@@ -0,0 +1,189 @@
+"""Database Metrics
+
+Collects connection pool instrumentation (acquire waits, timeouts) so the
+Oracle pool can be sized from measurements, and per-statement execution
+counts and latencies for a query hotspot table.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (milliseconds) of the acquire wait histogram buckets
+ACQUIRE_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Latency samples kept per statement for percentile estimates
+STATEMENT_SAMPLE_SIZE = 1000
+
+
+class PoolMetrics:
+    """Thread-safe counters and acquire wait histogram for a connection pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all collected metrics"""
+        with self._lock:
+            self._bucket_counts = [0] * (len(ACQUIRE_WAIT_BUCKETS_MS) + 1)
+            self._acquires = 0
+            self._wait_sum_ms = 0.0
+            self._wait_max_ms = 0.0
+            self._timeouts = 0
+            self._errors = 0
+
+    def record_acquire(self, wait_seconds: float):
+        """Record a successful connection acquire
+
+        Args:
+            wait_seconds: Time spent waiting for the connection
+        """
+        wait_ms = wait_seconds * 1000
+        index = len(ACQUIRE_WAIT_BUCKETS_MS)
+        for i, bound in enumerate(ACQUIRE_WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._acquires += 1
+            self._wait_sum_ms += wait_ms
+            self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+
+    def record_timeout(self):
+        """Record an acquire that gave up after the pool wait timeout"""
+        with self._lock:
+            self._timeouts += 1
+
+    def record_error(self):
+        """Record an acquire that failed for another reason"""
+        with self._lock:
+            self._errors += 1
+
+    def snapshot(self, pool=None) -> Dict[str, Any]:
+        """Get current metrics
+
+        Args:
+            pool: Optional oracledb pool to read live busy/open counts from
+
+        Returns:
+            Dictionary of pool metrics
+        """
+        with self._lock:
+            buckets = {
+                f"le_{bound}ms": count
+                for bound, count in zip(ACQUIRE_WAIT_BUCKETS_MS, self._bucket_counts)
+            }
+            buckets[f"gt_{ACQUIRE_WAIT_BUCKETS_MS[-1]}ms"] = self._bucket_counts[-1]
+
+            stats = {
+                "acquires": self._acquires,
+                "timeouts": self._timeouts,
+                "errors": self._errors,
+                "acquire_wait_ms": {
+                    "avg": round(self._wait_sum_ms / self._acquires, 3) if self._acquires else 0.0,
+                    "max": round(self._wait_max_ms, 3),
+                    "histogram": buckets
+                }
+            }
+
+        if pool is not None:
+            stats["pool"] = {
+                "busy": pool.busy,
+                "open": pool.opened,
+                "min": pool.min,
+                "max": pool.max,
+                "wait_timeout_ms": pool.wait_timeout,
+                "max_lifetime_session": pool.max_lifetime_session,
+                "ping_interval": pool.ping_interval,
+                "stmtcachesize": pool.stmtcachesize
+            }
+
+        return stats
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+class StatementMetrics:
+    """Thread-safe execution count and latency per statement ID
+
+    Percentiles are computed from the most recent STATEMENT_SAMPLE_SIZE
+    executions of each statement.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, statement_id: str, seconds: float, error: bool = False):
+        """Record one execution
+
+        Args:
+            statement_id: Stable statement ID from query_registry
+            seconds: Execution time
+            error: Whether the execution raised
+        """
+        elapsed_ms = seconds * 1000
+        with self._lock:
+            stats = self._stats.get(statement_id)
+            if stats is None:
+                stats = self._stats[statement_id] = {
+                    "count": 0,
+                    "errors": 0,
+                    "total_ms": 0.0,
+                    "samples": deque(maxlen=STATEMENT_SAMPLE_SIZE)
+                }
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += elapsed_ms
+            stats["samples"].append(elapsed_ms)
+
+    def snapshot(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Hotspot table ordered by total execution time
+
+        Args:
+            limit: Maximum number of statements to return
+
+        Returns:
+            One row per statement with count, errors and latency percentiles
+        """
+        with self._lock:
+            items = [
+                (statement_id, dict(stats, samples=sorted(stats["samples"])))
+                for statement_id, stats in self._stats.items()
+            ]
+
+        rows = []
+        for statement_id, stats in items:
+            samples = stats["samples"]
+            rows.append({
+                "statement_id": statement_id,
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "total_ms": round(stats["total_ms"], 3),
+                "avg_ms": round(stats["total_ms"] / stats["count"], 3),
+                "p50_ms": round(_percentile(samples, 0.50), 3),
+                "p95_ms": round(_percentile(samples, 0.95), 3),
+                "p99_ms": round(_percentile(samples, 0.99), 3),
+                "max_ms": round(samples[-1], 3) if samples else 0.0
+            })
+
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self):
+        """Clear all statement metrics"""
+        with self._lock:
+            self._stats.clear()
+
+
+# Shared by every database manager in the process
+statement_metrics = StatementMetrics()
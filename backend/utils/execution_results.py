@@ -0,0 +1,192 @@
+"""Execution Result Ingestion
+
+Validates and writes batches of test execution results pushed by CI into
+the executions collection (one document per release, test case and cycle).
+
+- Results are validated as they are read, so NDJSON bodies are never
+  held in memory as raw text
+- Repeated results for the same (testcase_key, cycle) within a batch are
+  coalesced, keeping the most recent executed_at (the later result wins
+  ties). Results without executed_at lose to timestamped ones and are
+  stamped with the write time only after de-duplication
+- The remaining results are written as upserts with unordered bulk_write
+  calls of EXECUTION_WRITE_CHUNK_SIZE, EXECUTION_WRITE_CONCURRENCY at a time
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from config.config import EXECUTION_WRITE_CHUNK_SIZE, EXECUTION_WRITE_CONCURRENCY
+from database.mongodb import executions_collection, get_est_time
+
+logger = logging.getLogger(__name__)
+
+# zoneinfo rather than pytz: localize() dominated validation of large batches
+EST = ZoneInfo('US/Eastern')
+
+# Invalid results reported back to the caller
+MAX_REPORTED_ERRORS = 100
+
+
+def normalize_status(status: Any) -> str:
+    """'Not Executed' / 'not-executed' / 'NOT_EXECUTED' -> 'not_executed'"""
+    return str(status).strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _parse_executed_at(value: Any) -> datetime:
+    """ISO 8601 timestamp; times without an offset are taken as US/Eastern"""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).strip())
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=EST)
+    return parsed
+
+
+def validate_result(raw: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Clean one execution result
+
+    Required: testcase_key, cycle, status. Optional: executed_at (None
+    until ExecutionBatch.write() stamps it), phase, defects (list of
+    defect keys).
+
+    Returns:
+        Tuple of (cleaned result, None) or (None, error message)
+    """
+    if not isinstance(raw, dict):
+        return None, "Result must be an object"
+
+    result = {
+        "testcase_key": str(raw.get("testcase_key") or "").strip(),
+        "cycle": str(raw.get("cycle") if raw.get("cycle") is not None else "").strip(),
+        "status": normalize_status(raw.get("status") or "")
+    }
+    missing = [field for field, value in result.items() if not value]
+    if missing:
+        return None, f"Missing {', '.join(missing)}"
+
+    if raw.get("executed_at"):
+        try:
+            result["executed_at"] = _parse_executed_at(raw["executed_at"])
+        except (TypeError, ValueError):
+            return None, f"Invalid executed_at: {raw['executed_at']}"
+    else:
+        result["executed_at"] = None
+
+    if raw.get("phase"):
+        result["phase"] = str(raw["phase"]).strip()
+    if "defects" in raw:
+        defects = raw["defects"] or []
+        if not isinstance(defects, list):
+            return None, "defects must be a list"
+        result["defects"] = [str(defect) for defect in defects]
+
+    return result, None
+
+
+class ExecutionBatch:
+    """Accumulates validated, de-duplicated results of one request"""
+
+    def __init__(self):
+        self.received = 0
+        self.rejected = 0
+        self.duplicates = 0
+        self.errors: List[Dict[str, Any]] = []
+        self._results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add(self, raw: Any):
+        """Validate a result and keep it unless a newer one for the same test case and cycle exists"""
+        self.received += 1
+        result, error = validate_result(raw)
+        if error:
+            self.rejected += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append({"index": self.received - 1, "error": error})
+            return
+
+        key = (result["testcase_key"], result["cycle"])
+        existing = self._results.get(key)
+        if existing is not None:
+            self.duplicates += 1
+            kept, candidate = existing["executed_at"], result["executed_at"]
+            if kept is not None and (candidate is None or kept > candidate):
+                return
+        self._results[key] = result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def write(self, release_id: int, updated_by: Optional[str] = None) -> Dict[str, Any]:
+        """Upsert the accumulated results
+
+        Args:
+            release_id: Release the results belong to
+            updated_by: SOEID recorded on the written documents
+
+        Returns:
+            Report with accepted/rejected counts and write statistics
+        """
+        started = time.perf_counter()
+        now = get_est_time()
+
+        operations = [
+            UpdateOne(
+                {"release_id": release_id, "testcase_key": result["testcase_key"], "cycle": result["cycle"]},
+                {
+                    "$set": {
+                        **result,
+                        "executed_at": result["executed_at"] or now,
+                        "updated_at": now,
+                        "updated_by": updated_by
+                    },
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            for result in self._results.values()
+        ]
+        chunks = [
+            operations[i:i + EXECUTION_WRITE_CHUNK_SIZE]
+            for i in range(0, len(operations), EXECUTION_WRITE_CHUNK_SIZE)
+        ]
+
+        semaphore = asyncio.Semaphore(EXECUTION_WRITE_CONCURRENCY)
+        totals = {"upserted": 0, "modified": 0, "failed": 0}
+
+        async def write_chunk(chunk: List[UpdateOne]):
+            async with semaphore:
+                try:
+                    result = await executions_collection.bulk_write(chunk, ordered=False)
+                    details = result.bulk_api_result
+                except BulkWriteError as e:
+                    # Unordered: the rest of the chunk was still applied
+                    details = e.details
+                    totals["failed"] += len(details.get("writeErrors", []))
+                totals["upserted"] += details.get("nUpserted", 0)
+                totals["modified"] += details.get("nModified", 0)
+
+        await asyncio.gather(*(write_chunk(chunk) for chunk in chunks))
+
+        elapsed = time.perf_counter() - started
+        report = {
+            "received": self.received,
+            "accepted": len(operations) - totals["failed"],
+            "rejected": self.rejected + totals["failed"],
+            "duplicates": self.duplicates,
+            "upserted": totals["upserted"],
+            "modified": totals["modified"],
+            "errors": self.errors,
+            "elapsed_seconds": round(elapsed, 3)
+        }
+
+        logger.info(f"✅ Wrote {report['accepted']} execution results for release {release_id} "
+                    f"({self.duplicates} duplicates, {report['rejected']} rejected) in {elapsed:.2f}s")
+        return report
@@ -0,0 +1,181 @@
+"""HTTP Client Utilities
+
+Base class for the external REST API clients (Zephyr, Jira).
+
+- One pooled httpx.AsyncClient per service (keep-alive connections)
+- Optional token-bucket rate limit shared by every request of the client
+- Retry with exponential backoff on 429, 5xx and network errors; POSTs
+  (not idempotent) are only resent when the server cannot have applied
+  them: 429 responses and errors before the request was sent
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Transport errors raised before any byte of the request reached the server
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class ApiError(Exception):
+    """External API call failed"""
+
+
+class ApiAuthError(ApiError):
+    """External API rejected the token"""
+
+
+class RateLimiter:
+    """Async token bucket
+
+    Args:
+        rate: Requests allowed per second (0 disables limiting)
+        burst: Requests allowed back to back; defaults to ``rate``
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RestClient:
+    """Pooled JSON REST client with rate limiting and retries
+
+    Subclasses set ``service`` for log messages and ``error_class`` /
+    ``auth_error_class`` for the exceptions they raise.
+
+    Args:
+        base_url: API base URL
+        transport: Optional httpx transport (e.g. ASGITransport around a stub)
+        rate_limit: Requests per second across all callers (0 disables)
+        max_connections: Pooled connections
+        timeout: Seconds per request
+        max_retries: Retries on transient failures
+        backoff: First retry delay in seconds, doubled on each retry
+    """
+
+    service = "API"
+    error_class = ApiError
+    auth_error_class = ApiAuthError
+
+    def __init__(self, base_url: str, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 rate_limit: float = 0, max_connections: int = 20, timeout: float = 10,
+                 max_retries: int = 3, backoff: float = 0.5):
+        self.base_url = base_url.rstrip('/')
+        self.transport = transport
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._rate_limiter = RateLimiter(rate_limit)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, created on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    def _headers(self, token: str) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+
+    async def request(self, method: str, path: str, token: str, params: Dict[str, Any] = None,
+                      json: Any = None) -> Any:
+        """Send a request, retrying transient failures
+
+        Non-idempotent methods (POST) are retried only on 429 and on errors
+        raised before the request was sent, so a write the server already
+        applied is never repeated.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the base URL
+            token: API token
+            params: Query parameters
+            json: JSON body
+
+        Returns:
+            Decoded JSON body (None for empty responses)
+
+        Raises:
+            auth_error_class: Token rejected (401/403)
+            error_class: Request failed after all retries
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff * (2 ** attempt)
+            await self._rate_limiter.acquire()
+            try:
+                response = await self._http().request(
+                    method, path, params=params, json=json, headers=self._headers(token)
+                )
+            except httpx.TransportError as e:
+                # A timed-out write may still have been applied; only resend it if it never left
+                if attempt == self.max_retries or not (idempotent or isinstance(e, UNSENT_ERRORS)):
+                    raise self.error_class(f"{self.service} request failed: {e}") from e
+                logger.warning(f"⚠️ {self.service} {path} network error ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in (401, 403):
+                raise self.auth_error_class(f"Invalid {self.service} token")
+
+            retryable = idempotent or response.status_code == 429
+            if response.status_code in RETRY_STATUS_CODES and retryable and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+                logger.warning(f"⚠️ {self.service} {path} returned {response.status_code}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code >= 400:
+                raise self.error_class(f"{self.service} {method} {path} returned {response.status_code}")
+            return response.json() if response.content else None
+
+    async def get(self, path: str, token: str, params: Dict[str, Any] = None) -> Any:
+        """GET a JSON resource"""
+        return await self.request("GET", path, token, params=params)
+
+    async def post(self, path: str, token: str, json: Any = None) -> Any:
+        """POST a JSON body"""
+        return await self.request("POST", path, token, json=json)
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,112 @@
+"""Jira API Client
+
+Async client for the Jira REST API search endpoint, built on
+utils.http_client.RestClient (pooled connections, rate limit, retries).
+"""
+
+import hashlib
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from config.config import (
+    JIRA_MOCK_MODE,
+    JIRA_BASE_URL,
+    JIRA_PAGE_SIZE,
+    JIRA_MAX_CONNECTIONS,
+    JIRA_TIMEOUT_SECONDS,
+    JIRA_MAX_RETRIES,
+    JIRA_BACKOFF_SECONDS,
+    JIRA_RATE_LIMIT_PER_SECOND
+)
+from utils.http_client import ApiAuthError, ApiError, RestClient
+
+logger = logging.getLogger(__name__)
+
+# Only the fields needed to name a test case are requested
+SEARCH_FIELDS = "summary"
+
+
+class JiraError(ApiError):
+    """Jira API call failed"""
+
+
+class JiraAuthError(JiraError, ApiAuthError):
+    """Jira rejected the API token"""
+
+
+def mock_issue_count(jql: str) -> int:
+    """Deterministic number of synthetic issues for a JQL (20-119)"""
+    return 20 + int(hashlib.sha256(jql.encode()).hexdigest(), 16) % 100
+
+
+class JiraClient(RestClient):
+    """Async Jira client
+
+    Args:
+        base_url: Jira base URL (without /rest/api/2)
+        mock: Return synthetic issues instead of calling Jira
+        transport: Optional httpx transport (e.g. ASGITransport around the stub)
+    """
+
+    service = "Jira"
+    error_class = JiraError
+    auth_error_class = JiraAuthError
+
+    def __init__(self, base_url: str = JIRA_BASE_URL, mock: bool = JIRA_MOCK_MODE,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(
+            base_url,
+            transport=transport,
+            rate_limit=JIRA_RATE_LIMIT_PER_SECOND,
+            max_connections=JIRA_MAX_CONNECTIONS,
+            timeout=JIRA_TIMEOUT_SECONDS,
+            max_retries=JIRA_MAX_RETRIES,
+            backoff=JIRA_BACKOFF_SECONDS
+        )
+        self.mock = mock
+
+    async def iter_search(self, jql: str, token: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Run a JQL search and yield issues one page at a time
+
+        Pages are yielded as soon as they arrive, so callers can start
+        working on the first issues while later pages are still fetched.
+
+        Args:
+            jql: JQL query
+            token: Jira API token
+
+        Yields:
+            Lists of {"id", "key", "summary"} dictionaries
+        """
+        if self.mock:
+            total = mock_issue_count(jql)
+            for start in range(0, total, JIRA_PAGE_SIZE):
+                yield [
+                    {"id": str(10000 + i), "key": f"REQ-{i}", "summary": f"Requirement {i}"}
+                    for i in range(start + 1, min(total, start + JIRA_PAGE_SIZE) + 1)
+                ]
+            return
+
+        start_at = 0
+        while True:
+            page = await self.get("/rest/api/2/search", token, params={
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": JIRA_PAGE_SIZE,
+                "fields": SEARCH_FIELDS
+            })
+            issues = page.get("issues", [])
+            if issues:
+                yield [
+                    {"id": issue["id"], "key": issue["key"], "summary": issue["fields"].get("summary", "")}
+                    for issue in issues
+                ]
+
+            start_at += len(issues)
+            if not issues or start_at >= page.get("total", 0):
+                return
+
+
+jira_client = JiraClient()
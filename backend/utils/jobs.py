@@ -0,0 +1,342 @@
+"""Background Job Runner
+
+Runs long Zephyr operations outside the HTTP request. Endpoints submit a
+job and return its ID immediately; a bounded pool of worker coroutines
+executes queued jobs and records progress in the jobs collection, so
+status survives restarts and can be polled or streamed by clients.
+
+Handlers are registered per job type:
+
+    @job_runner.handler("import_requirements")
+    async def run_import(job: JobContext) -> dict:
+        await job.progress(done, total, "message")
+        return {...}   # stored as the job result
+
+Handlers raise JobError for expected failures the client should tell
+apart (e.g. a rejected API token); its code is stored as error_code.
+
+A running job records the worker process executing it (worker_id) and a
+heartbeat_at refreshed every JOB_HEARTBEAT_INTERVAL_SECONDS. Queued jobs
+are picked up at startup; running jobs are only taken over once their
+heartbeat is older than JOB_STALE_AFTER_SECONDS, so jobs of other live
+processes are left alone. A job runs at most JOB_MAX_ATTEMPTS times, and
+handlers must be safe to re-run. Handlers registered with rerun=False
+(e.g. ones creating records in external systems) are never run twice: an
+interrupted job of that type fails with error_code "interrupted".
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config.config import (
+    JOB_WORKERS,
+    JOB_MAX_ATTEMPTS,
+    JOB_PROGRESS_INTERVAL_SECONDS,
+    JOB_HEARTBEAT_INTERVAL_SECONDS,
+    JOB_STALE_AFTER_SECONDS
+)
+from database.mongodb import jobs_collection, get_est_time
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+
+class JobError(Exception):
+    """Expected job failure, recorded with a machine-readable error_code
+
+    Args:
+        message: Stored as the job error
+        code: Stored as the job error_code (e.g. "invalid_token")
+    """
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
+
+class JobContext:
+    """Passed to job handlers: parameters plus progress reporting"""
+
+    def __init__(self, job: Dict[str, Any]):
+        self.job_id = job["_id"]
+        self.type = job["type"]
+        self.params = job.get("params", {})
+        self.created_by = job.get("created_by")
+        self.attempts = job.get("attempts", 0) + 1  # Including this run
+        self._last_write = 0.0
+
+    async def progress(self, done: int, total: Optional[int] = None, message: Optional[str] = None):
+        """Record progress; writes are throttled to JOB_PROGRESS_INTERVAL_SECONDS
+
+        Args:
+            done: Units of work completed
+            total: Total units of work, if known
+            message: Short status text
+        """
+        now = time.monotonic()
+        final = total is not None and done >= total
+        if not final and now - self._last_write < JOB_PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_write = now
+
+        await jobs_collection.update_one(
+            {"_id": self.job_id},
+            {"$set": {
+                "progress": {"done": done, "total": total, "message": message},
+                "updated_at": get_est_time()
+            }}
+        )
+
+
+Handler = Callable[[JobContext], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobRunner:
+    """In-process job queue backed by the jobs collection
+
+    Args:
+        workers: Jobs executed concurrently
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS):
+        self.workers = max(1, workers)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, Handler] = {}
+        self._rerunnable: Dict[str, bool] = {}
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def handler(self, job_type: str, rerun: bool = True):
+        """Decorator registering the handler of a job type
+
+        Args:
+            job_type: Job type name
+            rerun: Whether an interrupted job may run again; False fails it instead
+        """
+        def register(func: Handler) -> Handler:
+            self._handlers[job_type] = func
+            self._rerunnable[job_type] = rerun
+            return func
+        return register
+
+    async def submit(self, job_type: str, params: Dict[str, Any], created_by: Optional[int] = None) -> str:
+        """Persist a new job and queue it
+
+        Args:
+            job_type: Registered job type
+            params: Handler parameters (stored in the job document)
+            created_by: User ID of the submitter
+
+        Returns:
+            Job ID
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job_id = uuid.uuid4().hex
+        now = get_est_time()
+        await jobs_collection.insert_one({
+            "_id": job_id,
+            "type": job_type,
+            "params": params,
+            "status": QUEUED,
+            "progress": {"done": 0, "total": None, "message": None},
+            "result": None,
+            "error": None,
+            "error_code": None,
+            "attempts": 0,
+            "created_by": created_by,
+            "worker_id": None,
+            "heartbeat_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "started_at": None,
+            "finished_at": None
+        })
+        self._queue.put_nowait(job_id)
+
+        logger.info(f"✅ Job {job_id} ({job_type}) queued")
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current job document, with the ID exposed as job_id"""
+        job = await jobs_collection.find_one({"_id": job_id}, projection={"params": 0})
+        if job:
+            job["job_id"] = job.pop("_id")
+        return job
+
+    async def _requeue_queued(self) -> int:
+        """Queue jobs left queued by a previous process"""
+        requeued = 0
+        cursor = jobs_collection.find(
+            {"status": QUEUED},
+            projection={"_id": 1, "attempts": 1},
+            sort=[("created_at", 1)]
+        )
+        async for job in cursor:
+            if job.get("attempts", 0) >= JOB_MAX_ATTEMPTS:
+                await self._finish(job["_id"], FAILED, error="Interrupted too many times")
+                continue
+            self._queue.put_nowait(job["_id"])
+            requeued += 1
+        return requeued
+
+    async def _reclaim_stale(self) -> int:
+        """Requeue running jobs whose worker stopped sending heartbeats
+
+        Jobs that already used JOB_MAX_ATTEMPTS runs are failed instead.
+        """
+        stale_before = get_est_time() - timedelta(seconds=JOB_STALE_AFTER_SECONDS)
+        stale = {
+            "status": RUNNING,
+            "$or": [{"heartbeat_at": {"$lt": stale_before}}, {"heartbeat_at": None}]
+        }
+        reclaimed = 0
+        cursor = jobs_collection.find(stale, projection={"_id": 1, "attempts": 1, "worker_id": 1})
+        async for job in cursor:
+            now = get_est_time()
+            if job.get("attempts", 0) >= JOB_MAX_ATTEMPTS:
+                update = {"status": FAILED, "error": "Interrupted too many times", "finished_at": now}
+            else:
+                update = {"status": QUEUED, "worker_id": None}
+            # The stale filter is repeated so a heartbeat sent meanwhile keeps the job with its worker
+            claimed = await jobs_collection.update_one({"_id": job["_id"], **stale}, {"$set": {**update, "updated_at": now}})
+            if not claimed.modified_count:
+                continue
+            logger.warning(f"⚠️ Job {job['_id']} lost its worker ({job.get('worker_id')}), marked {update['status']}")
+            if update["status"] == QUEUED:
+                self._queue.put_nowait(job["_id"])
+                reclaimed += 1
+        return reclaimed
+
+    async def _heartbeat(self, job_id: str):
+        """Keep heartbeat_at of a running job fresh until cancelled"""
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await jobs_collection.update_one(
+                    {"_id": job_id, "worker_id": self.worker_id},
+                    {"$set": {"heartbeat_at": get_est_time()}}
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Heartbeat of job {job_id} failed: {e}")
+
+    async def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None,
+                      error_code: Optional[str] = None):
+        now = get_est_time()
+        await jobs_collection.update_one(
+            {"_id": job_id},
+            {"$set": {
+                "status": status,
+                "result": result,
+                "error": error,
+                "error_code": error_code,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+
+    async def _run(self, job_id: str):
+        now = get_est_time()
+        job = await jobs_collection.find_one_and_update(
+            {"_id": job_id, "status": QUEUED},
+            {
+                "$set": {"status": RUNNING, "started_at": now, "worker_id": self.worker_id, "heartbeat_at": now},
+                "$inc": {"attempts": 1}
+            }
+        )
+        if job is None:
+            return  # Already picked up or finished
+
+        handler = self._handlers.get(job["type"])
+        if handler is None:
+            await self._finish(job_id, FAILED, error=f"No handler for job type {job['type']}")
+            return
+        if job.get("attempts", 0) > 0 and not self._rerunnable[job["type"]]:
+            # An earlier run may have done part of the work; running again would repeat it
+            logger.warning(f"⚠️ Job {job_id} ({job['type']}) was interrupted and is not safe to re-run")
+            await self._finish(job_id, FAILED, error="Interrupted before it finished; submit it again",
+                               error_code="interrupted")
+            return
+
+        started = time.perf_counter()
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            result = await handler(JobContext(job))
+        except asyncio.CancelledError:
+            raise  # Shutdown; stop() hands the job back to the queue
+        except JobError as e:
+            logger.error(f"❌ Job {job_id} ({job['type']}) failed [{e.code}]: {e}")
+            await self._finish(job_id, FAILED, error=str(e), error_code=e.code)
+            return
+        except Exception as e:
+            logger.error(f"❌ Job {job_id} ({job['type']}) failed: {e}")
+            await self._finish(job_id, FAILED, error=str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        await self._finish(job_id, SUCCEEDED, result=result)
+        logger.info(f"✅ Job {job_id} ({job['type']}) finished in {time.perf_counter() - started:.1f}s")
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Job worker error for {job_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _reaper(self):
+        """Periodically take over running jobs of workers that went away"""
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await self._reclaim_stale()
+            except Exception as e:
+                logger.error(f"❌ Reclaiming stale jobs failed: {e}")
+
+    async def start(self):
+        """Queue unfinished jobs and start the worker pool"""
+        if self._tasks:
+            return
+        requeued = await self._requeue_queued() + await self._reclaim_stale()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._reaper()))
+        logger.info(f"✅ Job runner {self.worker_id} started with {self.workers} workers ({requeued} jobs requeued)")
+
+    async def stop(self):
+        """Cancel the workers and hand this process's running jobs back to the queue"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        try:
+            result = await jobs_collection.update_many(
+                {"status": RUNNING, "worker_id": self.worker_id},
+                {"$set": {"status": QUEUED, "worker_id": None, "updated_at": get_est_time()}}
+            )
+            if result.modified_count:
+                logger.info(f"✅ {result.modified_count} interrupted jobs queued for the next start")
+        except Exception as e:
+            # Left running; another process takes them over once their heartbeat is stale
+            logger.warning(f"⚠️ Could not requeue interrupted jobs: {e}")
+
+
+job_runner = JobRunner()
@@ -0,0 +1,185 @@
+"""Password Hashing
+
+Pluggable passcode hashers. New hashes use the configured scheme
+(PASSCODE_HASH_ALGORITHM); stored hashes of any known scheme still verify,
+so legacy unsalted SHA-256 hashes can be upgraded on the next login.
+
+Slow hashes are computed on a bounded thread pool (bcrypt and argon2
+release the GIL while hashing), so they never stall the event loop.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import bcrypt
+
+from config.config import PASSCODE_HASH_ALGORITHM, PASSCODE_BCRYPT_ROUNDS, PASSCODE_HASH_WORKERS
+
+try:
+    import argon2
+except ImportError:  # argon2-cffi is optional
+    argon2 = None
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher(ABC):
+    """Interface for a password hashing scheme"""
+
+    scheme = ""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Hash a password with a fresh salt"""
+
+    @abstractmethod
+    def verify(self, password: str, hashed: str) -> bool:
+        """Whether ``password`` matches ``hashed``"""
+
+    @abstractmethod
+    def identify(self, hashed: str) -> bool:
+        """Whether ``hashed`` was produced by this scheme"""
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Whether a hash of this scheme uses outdated parameters"""
+        return False
+
+
+class Sha256Hasher(PasswordHasher):
+    """Legacy unsalted SHA-256 hex digest"""
+
+    scheme = "sha256"
+
+    def hash(self, password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return hmac.compare_digest(self.hash(password), hashed)
+
+    def identify(self, hashed: str) -> bool:
+        return len(hashed) == 64 and all(c in "0123456789abcdef" for c in hashed)
+
+
+class BcryptHasher(PasswordHasher):
+    """Salted bcrypt ($2b$)"""
+
+    scheme = "bcrypt"
+
+    def __init__(self, rounds: int = PASSCODE_BCRYPT_ROUNDS):
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(self.rounds)).decode()
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode(), hashed.encode())
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith(("$2a$", "$2b$", "$2y$"))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return int(hashed.split("$")[2]) != self.rounds
+
+
+class Argon2Hasher(PasswordHasher):
+    """Salted argon2id (requires argon2-cffi)"""
+
+    scheme = "argon2"
+
+    def __init__(self):
+        if argon2 is None:
+            raise RuntimeError("argon2-cffi is not installed")
+        self._hasher = argon2.PasswordHasher()
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return self._hasher.verify(hashed, password)
+        except argon2.exceptions.VerificationError:
+            return False
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith("$argon2")
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._hasher.check_needs_rehash(hashed)
+
+
+HASHERS = {
+    "sha256": Sha256Hasher,
+    "bcrypt": BcryptHasher,
+    "argon2": Argon2Hasher,
+}
+
+_instances: Dict[str, PasswordHasher] = {}
+
+_executor = ThreadPoolExecutor(max_workers=PASSCODE_HASH_WORKERS, thread_name_prefix="passcode-hash")
+
+
+def get_hasher(scheme: str = PASSCODE_HASH_ALGORITHM) -> PasswordHasher:
+    """Get the (shared) hasher for a scheme
+
+    Args:
+        scheme: One of HASHERS
+
+    Returns:
+        PasswordHasher instance
+    """
+    if scheme not in _instances:
+        if scheme not in HASHERS:
+            raise ValueError(f"Unknown passcode hash algorithm: {scheme}")
+        _instances[scheme] = HASHERS[scheme]()
+    return _instances[scheme]
+
+
+def identify_hasher(hashed: str) -> Optional[PasswordHasher]:
+    """Find the hasher that produced a stored hash"""
+    for scheme in HASHERS:
+        if scheme == "argon2" and argon2 is None:
+            continue
+        hasher = get_hasher(scheme)
+        if hasher.identify(hashed):
+            return hasher
+    return None
+
+
+def hash_password(password: str) -> str:
+    """Hash a passcode with the configured scheme"""
+    return get_hasher().hash(password)
+
+
+def check_password(password: str, hashed: str) -> Tuple[bool, bool]:
+    """Verify a passcode against a stored hash of any known scheme
+
+    Returns:
+        Tuple of (matches, needs_rehash). needs_rehash is True when the
+        passcode matched but the stored hash is not of the configured
+        scheme or uses outdated parameters.
+    """
+    hasher = identify_hasher(hashed or "")
+    if hasher is None:
+        logger.warning("⚠️ Stored passcode hash has an unknown format")
+        return False, False
+
+    if not hasher.verify(password, hashed):
+        return False, False
+
+    current = get_hasher()
+    return True, hasher is not current or current.needs_rehash(hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the hashing thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_executor, hash_password, password)
+
+
+async def check_password_async(password: str, hashed: str) -> Tuple[bool, bool]:
+    """check_password on the hashing thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_executor, check_password, password, hashed)
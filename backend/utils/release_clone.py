@@ -0,0 +1,134 @@
+"""Release Structure Cloning
+
+Copies the structure of a previous release (folders, cycles, phases and
+test case mappings in zephyrdata) into a newly created release, for
+releases created with use_previous_structure.
+
+The copy runs inside MongoDB: one aggregation matches the source
+documents, re-keys them to the new release and $merges them back into
+zephyrdata, so no document passes through the API process. Servers that
+reject $merge into the collection being aggregated fall back to streaming
+the source through a cursor and writing batches of CLONE_BATCH_SIZE with
+insert_many; memory stays bounded by one batch either way.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo.errors import OperationFailure
+
+from config.config import CLONE_BATCH_SIZE
+from database.mongodb import zephyrdata_collection
+
+logger = logging.getLogger(__name__)
+
+# zephyrdata document types that make up a release's structure
+STRUCTURE_TYPES = ("folder", "cycle", "phase", "testcase")
+
+
+def _source_filter(source_release_id: int) -> Dict[str, Any]:
+    return {"release_id": source_release_id, "type": {"$in": list(STRUCTURE_TYPES)}}
+
+
+def _rekey_stages(source_release_id: int, target_release_id: int) -> List[Dict[str, Any]]:
+    """Stages turning a source document into its copy in the target release"""
+    return [
+        {"$project": {"_id": 0}},
+        {"$addFields": {
+            "release_id": target_release_id,
+            "cloned_from_release": source_release_id,
+            "cloned_at": "$$NOW"
+        }}
+    ]
+
+
+async def _clone_with_merge(source_release_id: int, target_release_id: int):
+    pipeline = [
+        {"$match": _source_filter(source_release_id)},
+        *_rekey_stages(source_release_id, target_release_id),
+        {"$merge": {"into": "zephyrdata", "whenMatched": "fail", "whenNotMatched": "insert"}}
+    ]
+    await zephyrdata_collection.aggregate(pipeline).to_list(length=None)
+
+
+async def _clone_in_batches(
+    source_release_id: int,
+    target_release_id: int,
+    total: int,
+    progress: Optional[Callable[..., Awaitable[None]]]
+) -> int:
+    cursor = zephyrdata_collection.aggregate(
+        [{"$match": _source_filter(source_release_id)}, *_rekey_stages(source_release_id, target_release_id)],
+        batchSize=CLONE_BATCH_SIZE
+    )
+    copied = 0
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= CLONE_BATCH_SIZE:
+            await zephyrdata_collection.insert_many(batch, ordered=False)
+            copied += len(batch)
+            batch = []
+            if progress:
+                await progress(copied, total, f"{copied} of {total} documents copied")
+    if batch:
+        await zephyrdata_collection.insert_many(batch, ordered=False)
+        copied += len(batch)
+    return copied
+
+
+async def clone_release_structure(
+    source_release_id: int,
+    target_release_id: int,
+    progress: Optional[Callable[..., Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """Copy the structure of one release into another
+
+    Args:
+        source_release_id: Release to copy from
+        target_release_id: Newly created release
+        progress: Called with (done, total, message)
+
+    Returns:
+        Report with document counts, the copy method and docs/sec. The
+        caller adds the copied test cases to the dashboard stats once the
+        copy is known to be complete, since an interrupted copy is redone.
+    """
+    started = time.perf_counter()
+    source = _source_filter(source_release_id)
+
+    # Remove a partial copy left by an interrupted run
+    await zephyrdata_collection.delete_many({"release_id": target_release_id, "cloned_from_release": source_release_id})
+
+    total = await zephyrdata_collection.count_documents(source)
+    testcases = await zephyrdata_collection.count_documents({"release_id": source_release_id, "type": "testcase"})
+    if progress:
+        await progress(0, total, f"Copying {total} documents from release {source_release_id}")
+
+    method = "merge"
+    try:
+        await _clone_with_merge(source_release_id, target_release_id)
+    except OperationFailure as e:
+        logger.warning(f"⚠️ $merge clone unavailable ({e}); copying in batches")
+        method = "batched"
+        await zephyrdata_collection.delete_many({"release_id": target_release_id, "cloned_from_release": source_release_id})
+        total = await _clone_in_batches(source_release_id, target_release_id, total, progress)
+
+    if progress:
+        await progress(total, total, f"{total} documents copied")
+
+    elapsed = time.perf_counter() - started
+    report = {
+        "source_release_id": source_release_id,
+        "release_id": target_release_id,
+        "copied": total,
+        "testcases": testcases,
+        "method": method,
+        "elapsed_seconds": round(elapsed, 3),
+        "docs_per_second": round(total / elapsed, 1) if elapsed else 0.0
+    }
+
+    logger.info(f"✅ Cloned {total} documents from release {source_release_id} to {target_release_id} "
+                f"via {method} ({report['docs_per_second']} docs/s)")
+    return report
@@ -0,0 +1,142 @@
+"""Requirement Import Pipeline
+
+Imports Jira requirements into Zephyr as test cases, one Zephyr folder
+per requested (folder_name, JQL) pair.
+
+- JQL searches of all folders run concurrently (IMPORT_FOLDER_CONCURRENCY)
+- Each search streams its pages; test case creation for a page starts as
+  soon as the page arrives, while the next page is still being fetched
+- Test case creations share one cap across all folders
+  (IMPORT_CREATE_CONCURRENCY) and the clients' rate limits
+- A failing folder is reported without aborting the other folders; a
+  rejected token cancels the folders still running
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config.config import IMPORT_FOLDER_CONCURRENCY, IMPORT_CREATE_CONCURRENCY
+from utils.http_client import ApiAuthError, ApiError
+from utils.jira_client import jira_client, JiraClient
+from utils.zephyr_client import zephyr_client, ZephyrClient
+
+logger = logging.getLogger(__name__)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def import_requirements(
+    requirements: List[Dict[str, str]],
+    project_id: int,
+    jira_token: str,
+    zephyr_token: str,
+    jira: JiraClient = jira_client,
+    zephyr: ZephyrClient = zephyr_client,
+    progress: Optional[Callable[[int, int, str], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """Run the import for a list of folders
+
+    Args:
+        requirements: [{"folder_name", "jql"}, ...] rows from the import form
+        project_id: Zephyr project ID
+        jira_token: User's Jira API token
+        zephyr_token: User's Zephyr API token
+        jira: Jira client
+        zephyr: Zephyr client
+        progress: Called with (folders done, folders total, message) as folders finish
+
+    Returns:
+        Report with totals and per-folder counts and timings
+
+    Raises:
+        ApiAuthError: A token was rejected (no point continuing)
+    """
+    started = time.perf_counter()
+    project_key = await zephyr.get_project_key(project_id, zephyr_token)
+
+    folder_slots = asyncio.Semaphore(IMPORT_FOLDER_CONCURRENCY)
+    create_slots = asyncio.Semaphore(IMPORT_CREATE_CONCURRENCY)
+    folders_done = 0
+
+    async def create(issue: Dict[str, Any], folder_id: int) -> bool:
+        async with create_slots:
+            try:
+                await zephyr.create_testcase(
+                    project_key, f"{issue['key']} {issue['summary']}", zephyr_token, folder_id
+                )
+                return True
+            except ApiAuthError:
+                raise
+            except ApiError as e:
+                logger.warning(f"⚠️ Test case for {issue['key']} not created: {e}")
+                return False
+
+    async def import_folder(row: Dict[str, str]) -> Dict[str, Any]:
+        folder_name = row.get('folder_name', '').strip()
+        jql = row.get('jql', '').strip()
+        result = {
+            "folder_name": folder_name,
+            "jql": jql,
+            "issues": 0,
+            "created": 0,
+            "failed": 0,
+            "search_ms": 0.0,
+            "total_ms": 0.0,
+            "error": None
+        }
+
+        async with folder_slots:
+            folder_started = time.perf_counter()
+            creations = []
+            try:
+                folder_id = await zephyr.create_folder(project_key, folder_name, zephyr_token)
+                async for issues in jira.iter_search(jql, jira_token):
+                    result["issues"] += len(issues)
+                    creations.extend(asyncio.create_task(create(issue, folder_id)) for issue in issues)
+                result["search_ms"] = _elapsed_ms(folder_started)
+
+                outcomes = await asyncio.gather(*creations)
+                result["created"] = sum(outcomes)
+                result["failed"] = len(outcomes) - result["created"]
+            except (ApiAuthError, asyncio.CancelledError):
+                for task in creations:
+                    task.cancel()
+                raise
+            except ApiError as e:
+                for task in creations:
+                    task.cancel()
+                result["error"] = str(e)
+                logger.error(f"❌ Import of folder '{folder_name}' failed: {e}")
+            result["total_ms"] = _elapsed_ms(folder_started)
+
+        logger.info(f"   Folder '{folder_name}': {result['created']}/{result['issues']} "
+                    f"test cases in {result['total_ms']:.0f}ms")
+
+        nonlocal folders_done
+        folders_done += 1
+        if progress:
+            await progress(folders_done, len(requirements), f"Imported folder '{folder_name}'")
+        return result
+
+    tasks = [asyncio.create_task(import_folder(row)) for row in requirements]
+    try:
+        folders = await asyncio.gather(*tasks)
+    except BaseException:
+        # A rejected token fails every folder; stop the ones still running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return {
+        "folders": folders,
+        "issues": sum(f["issues"] for f in folders),
+        "created": sum(f["created"] for f in folders),
+        "failed": sum(f["failed"] for f in folders),
+        "failed_folders": sum(1 for f in folders if f["error"]),
+        "total_ms": _elapsed_ms(started)
+    }
@@ -0,0 +1,82 @@
+"""Streaming Response Helpers
+
+Encode row iterators as NDJSON for FastAPI StreamingResponse, e.g.:
+
+    rows = async_db_manager.iter_query(UserQueries.GET_ALL_USERS)
+    return StreamingResponse(ndjson_stream(rows), media_type=NDJSON_MEDIA_TYPE)
+
+and decode NDJSON request bodies line by line with iter_ndjson(request.stream()).
+"""
+
+import json
+from typing import Any, AsyncIterator, Iterator, Union
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _encode(row: Any) -> bytes:
+    """Encode one row as a JSON line"""
+    if hasattr(row, '_asdict'):
+        row = row._asdict()
+    return (json.dumps(row, default=str) + "\n").encode()
+
+
+def _ndjson_sync(rows: Iterator[Any]) -> Iterator[bytes]:
+    for row in rows:
+        yield _encode(row)
+
+
+async def _ndjson_async(rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield _encode(row)
+
+
+def ndjson_stream(rows: Union[Iterator[Any], AsyncIterator[Any]]):
+    """Wrap a row iterator as an NDJSON byte stream
+
+    Sync iterators stay sync so Starlette drives them from its threadpool;
+    async iterators are consumed on the event loop.
+
+    Args:
+        rows: Iterator of dicts, tuples or namedtuples
+
+    Returns:
+        Iterator of encoded JSON lines
+    """
+    if hasattr(rows, '__aiter__'):
+        return _ndjson_async(rows)
+    return _ndjson_sync(rows)
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Decode an NDJSON byte stream one line at a time
+
+    Blank lines are skipped. Lines that are not valid JSON raise ValueError
+    with their 1-based line number.
+
+    Args:
+        chunks: Raw body chunks, e.g. request.stream()
+
+    Yields:
+        Decoded value of each line
+    """
+    buffer = b""
+    line_number = 0
+
+    def decode(line: bytes) -> Any:
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise ValueError(f"Invalid JSON on line {line_number}")
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield decode(line)
+
+    if buffer.strip():
+        line_number += 1
+        yield decode(buffer)
@@ -0,0 +1,217 @@
+"""Bulk Test Case Import
+
+Streams test cases from an uploaded CSV/TXT/XLSX/XLS file into the
+zephyrdata collection.
+
+- CSV and tab-delimited TXT are read row by row with csv.reader
+- XLSX is read with openpyxl in read-only mode (rows streamed from the zip)
+- Legacy XLS (at most 65,536 rows) is loaded with pandas, which has no
+  chunked Excel reader
+- Rows are parsed off the event loop in chunks of IMPORT_CHUNK_SIZE and
+  each valid chunk is written with one unordered insert_many, so memory
+  stays constant regardless of the file size
+"""
+
+import asyncio
+import csv
+import itertools
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config.config import IMPORT_CHUNK_SIZE
+from database.mongodb import zephyrdata_collection, get_est_time
+from database.stats import increment_stat
+
+logger = logging.getLogger(__name__)
+
+# Header spellings accepted for each test case field
+COLUMN_ALIASES = {
+    "testcase_key": ("testcase_key", "test_case_key", "key", "testcase_id", "test_case_id"),
+    "name": ("name", "testcase_name", "test_case_name", "summary", "title"),
+    "folder": ("folder", "folder_name"),
+    "phase": ("phase",),
+    "testcase_type": ("testcase_type", "test_case_type", "type"),
+    "priority": ("priority",),
+    "assigned_to": ("assigned_to", "assignee", "owner"),
+}
+REQUIRED_FIELDS = ("testcase_key", "name")
+
+# Invalid rows reported back in the job result
+MAX_REPORTED_ERRORS = 100
+
+
+def _normalize_header(header: Any) -> str:
+    return str(header or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _header_map(headers: List[Any]) -> Dict[int, str]:
+    """Column index -> test case field for recognised headers"""
+    lookup = {alias: field for field, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    mapping = {}
+    for index, header in enumerate(headers):
+        field = lookup.get(_normalize_header(header))
+        if field and field not in mapping.values():
+            mapping[index] = field
+    return mapping
+
+
+def _rows_from_values(values: Iterator[Tuple[Any, ...]]) -> Iterator[Dict[str, Any]]:
+    """Turn a header row followed by value rows into field dictionaries"""
+    headers = next(values, None)
+    if headers is None:
+        return
+    mapping = _header_map(list(headers))
+    missing = [field for field in REQUIRED_FIELDS if field not in mapping.values()]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+    for row in values:
+        yield {
+            field: row[index] if index < len(row) else None
+            for index, field in mapping.items()
+        }
+
+
+def _iter_delimited(path: str, delimiter: str) -> Iterator[Dict[str, Any]]:
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from _rows_from_values(csv.reader(f, delimiter=delimiter))
+
+
+def _iter_xlsx(path: str) -> Iterator[Dict[str, Any]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from _rows_from_values(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def _iter_xls(path: str) -> Iterator[Dict[str, Any]]:
+    import pandas as pd
+
+    frame = pd.read_excel(path, header=None, dtype=object)
+    frame = frame.where(frame.notna(), None)
+    yield from _rows_from_values(frame.itertuples(index=False, name=None))
+
+
+def iter_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of an uploaded file as {field: value} dictionaries
+
+    Args:
+        path: Path of the uploaded file (extension selects the parser)
+
+    Raises:
+        ValueError: Unsupported extension or missing required columns
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension == 'csv':
+        return _iter_delimited(path, ',')
+    if extension == 'txt':
+        return _iter_delimited(path, '\t')
+    if extension == 'xlsx':
+        return _iter_xlsx(path)
+    if extension == 'xls':
+        return _iter_xls(path)
+    raise ValueError(f"Unsupported file type: .{extension}")
+
+
+def validate_row(row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Clean one parsed row
+
+    Returns:
+        Tuple of (cleaned fields, None) or (None, error message)
+    """
+    cleaned = {}
+    for field in COLUMN_ALIASES:
+        value = row.get(field)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        value = str(value).strip() if value is not None else ""
+        cleaned[field] = value or None
+
+    if not any(cleaned.values()):
+        return None, None  # Blank line, skipped silently
+    missing = [field for field in REQUIRED_FIELDS if not cleaned[field]]
+    if missing:
+        return None, f"Missing {', '.join(missing)}"
+    if cleaned["assigned_to"]:
+        # SOEIDs are stored upper case; BOW lookups match on them exactly
+        cleaned["assigned_to"] = cleaned["assigned_to"].upper()
+    return cleaned, None
+
+
+async def import_testcases(
+    path: str,
+    release_id: int,
+    project_id: int,
+    progress: Optional[Callable[..., Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """Import an uploaded file into zephyrdata
+
+    Args:
+        path: Uploaded file
+        release_id: Release the test cases belong to
+        project_id: Project of the release
+        progress: Called with (rows read, None, message) after each chunk
+
+    Returns:
+        Report with row counts, the first invalid rows and rows/sec
+    """
+    started = time.perf_counter()
+    source_file = os.path.basename(path)
+    rows = iter_rows(path)
+    report = {"rows": 0, "inserted": 0, "skipped": 0, "invalid": 0, "errors": []}
+
+    def next_chunk() -> List[Dict[str, Any]]:
+        # Parsing is blocking file I/O and CPU work; keep it off the event loop
+        return list(itertools.islice(rows, IMPORT_CHUNK_SIZE))
+
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next_chunk)
+            if not chunk:
+                break
+
+            imported_at = get_est_time()
+            docs = []
+            for row in chunk:
+                report["rows"] += 1
+                cleaned, error = validate_row(row)
+                if error:
+                    report["invalid"] += 1
+                    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                        # +1 for the header row, +1 for 1-based line numbers
+                        report["errors"].append({"line": report["rows"] + 1, "error": error})
+                elif cleaned is None:
+                    report["skipped"] += 1
+                else:
+                    docs.append({
+                        "type": "testcase",
+                        "project_id": project_id,
+                        "release_id": release_id,
+                        **cleaned,
+                        "source_file": source_file,
+                        "imported_at": imported_at
+                    })
+
+            if docs:
+                await zephyrdata_collection.insert_many(docs, ordered=False)
+                report["inserted"] += len(docs)
+
+            if progress:
+                await progress(report["rows"], None, f"{report['inserted']} test cases imported")
+    finally:
+        rows.close()
+
+    await increment_stat("total_testcases", report["inserted"])
+
+    elapsed = time.perf_counter() - started
+    report["elapsed_seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = round(report["rows"] / elapsed, 1) if elapsed else 0.0
+
+    logger.info(f"✅ Imported {report['inserted']} test cases from {source_file} "
+                f"({report['rows_per_second']} rows/s, {report['invalid']} invalid)")
+    return report
@@ -0,0 +1,186 @@
+"""Zephyr Scale API Client
+
+Shared async HTTP client for the Zephyr Scale Cloud REST API (v2), built
+on utils.http_client.RestClient (pooled connections, rate limit, retries).
+
+- Paginated endpoints: the first page gives the total, the remaining pages
+  are fetched concurrently under a per-request concurrency cap
+- Per-token TTL cache so repeated validations reuse the fetched projects
+"""
+
+import asyncio
+import hashlib
+import itertools
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from config.config import (
+    ZEPHYR_MOCK_MODE,
+    ZEPHYR_BASE_URL,
+    ZEPHYR_PAGE_SIZE,
+    ZEPHYR_MAX_CONCURRENCY,
+    ZEPHYR_MAX_CONNECTIONS,
+    ZEPHYR_TIMEOUT_SECONDS,
+    ZEPHYR_MAX_RETRIES,
+    ZEPHYR_BACKOFF_SECONDS,
+    ZEPHYR_RATE_LIMIT_PER_SECOND,
+    ZEPHYR_TOKEN_CACHE_TTL_SECONDS
+)
+from utils.cache import TTLCache
+from utils.http_client import ApiAuthError, ApiError, RestClient
+
+logger = logging.getLogger(__name__)
+
+# Returned in mock mode, matching the previous hard-coded response
+MOCK_PROJECTS = [
+    {"id": 1, "name": "CQE Platform"},
+    {"id": 2, "name": "Test Automation Suite"},
+    {"id": 3, "name": "Performance Testing"},
+    {"id": 4, "name": "API Testing Framework"},
+    {"id": 5, "name": "Mobile App Testing"},
+]
+
+
+class ZephyrError(ApiError):
+    """Zephyr API call failed"""
+
+
+class ZephyrAuthError(ZephyrError, ApiAuthError):
+    """Zephyr rejected the API token"""
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class ZephyrClient(RestClient):
+    """Async Zephyr Scale client
+
+    Args:
+        base_url: API base URL including the version (e.g. .../v2)
+        mock: Return synthetic data instead of calling Zephyr
+        transport: Optional httpx transport (e.g. ASGITransport around the stub)
+    """
+
+    service = "Zephyr"
+    error_class = ZephyrError
+    auth_error_class = ZephyrAuthError
+
+    def __init__(self, base_url: str = ZEPHYR_BASE_URL, mock: bool = ZEPHYR_MOCK_MODE,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(
+            base_url,
+            transport=transport,
+            rate_limit=ZEPHYR_RATE_LIMIT_PER_SECOND,
+            max_connections=ZEPHYR_MAX_CONNECTIONS,
+            timeout=ZEPHYR_TIMEOUT_SECONDS,
+            max_retries=ZEPHYR_MAX_RETRIES,
+            backoff=ZEPHYR_BACKOFF_SECONDS
+        )
+        self.mock = mock
+        self._projects_cache = TTLCache(ttl=ZEPHYR_TOKEN_CACHE_TTL_SECONDS, maxsize=1000)
+        self._project_keys: Dict[int, str] = {}
+        self._mock_ids = itertools.count(1)
+
+    async def get_all_pages(self, path: str, token: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Fetch every page of a paginated (startAt/maxResults) endpoint
+
+        Args:
+            path: Path relative to the base URL
+            token: Zephyr API token
+            params: Additional query parameters
+
+        Returns:
+            Concatenated ``values`` of all pages, in order
+        """
+        params = dict(params or {}, maxResults=ZEPHYR_PAGE_SIZE)
+        first = await self.get(path, token, dict(params, startAt=0))
+        values = list(first.get("values", []))
+
+        total = first.get("total")
+        if first.get("isLast", True) or total is None:
+            return values
+
+        page_size = first.get("maxResults") or ZEPHYR_PAGE_SIZE
+        semaphore = asyncio.Semaphore(ZEPHYR_MAX_CONCURRENCY)
+
+        async def fetch(start_at: int):
+            async with semaphore:
+                page = await self.get(path, token, dict(params, startAt=start_at))
+                return page.get("values", [])
+
+        pages = await asyncio.gather(*[fetch(start) for start in range(len(values), total, page_size)])
+        for page in pages:
+            values.extend(page)
+        return values
+
+    async def get_projects(self, token: str) -> List[Dict[str, Any]]:
+        """Projects visible to a token, cached per token
+
+        Args:
+            token: Zephyr API token
+
+        Returns:
+            List of {"id", "name"} dictionaries
+        """
+        if self.mock:
+            return MOCK_PROJECTS
+
+        key = _token_key(token)
+        cached = self._projects_cache.get(key)
+        if cached is not None:
+            return cached
+
+        values = await self.get_all_pages("/projects", token)
+        projects = [
+            {"id": project["id"], "name": project.get("name") or project.get("key")}
+            for project in values
+        ]
+
+        self._projects_cache.set(key, projects)
+        logger.info(f"✅ Fetched {len(projects)} Zephyr projects")
+        return projects
+
+    async def get_project_key(self, project_id: int, token: str) -> str:
+        """Project key (e.g. "CQE") for a project ID"""
+        if self.mock:
+            return f"PRJ{project_id}"
+        if project_id not in self._project_keys:
+            project = await self.get(f"/projects/{project_id}", token)
+            self._project_keys[project_id] = project["key"]
+        return self._project_keys[project_id]
+
+    async def create_folder(self, project_key: str, name: str, token: str) -> int:
+        """Create a test case folder
+
+        Returns:
+            Folder ID
+        """
+        if self.mock:
+            return next(self._mock_ids)
+        folder = await self.post("/folders", token, json={
+            "projectKey": project_key,
+            "name": name,
+            "folderType": "TEST_CASE"
+        })
+        return folder["id"]
+
+    async def create_testcase(self, project_key: str, name: str, token: str,
+                              folder_id: Optional[int] = None) -> Dict[str, Any]:
+        """Create a test case
+
+        Returns:
+            {"id", "key"} of the created test case
+        """
+        if self.mock:
+            testcase_id = next(self._mock_ids)
+            return {"id": testcase_id, "key": f"{project_key}-T{testcase_id}"}
+        body = {"projectKey": project_key, "name": name}
+        if folder_id is not None:
+            body["folderId"] = folder_id
+        return await self.post("/testcases", token, json=body)
+
+
+zephyr_client = ZephyrClient()
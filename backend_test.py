@@ -15,6 +15,11 @@ from datetime import datetime, timedelta
 BACKEND_URL = "https://cqe-dashboard-1.preview.emergentagent.com"
 API_BASE = f"{BACKEND_URL}/api"
 
+# Registered user the tests log in as; the release endpoints require a bearer token
+TEST_SOEID = os.environ.get("TEST_SOEID", "AB12345")
+TEST_PASSCODE = os.environ.get("TEST_PASSCODE", "1234")
+AUTH_TOKEN = None
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -59,6 +64,33 @@ async def test_health_check():
         print_error(f"Health check failed: {str(e)}")
         return False
 
+def auth_headers():
+    """JSON request headers with the bearer token from test_login"""
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {AUTH_TOKEN}"}
+
+async def test_login():
+    """Log in as the test user and keep the token for the other tests"""
+    global AUTH_TOKEN
+    print_test_header("Login")
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                f"{API_BASE}/auth/login",
+                json={"soeid": TEST_SOEID, "passcode": TEST_PASSCODE},
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                data = await response.json()
+                if response.status == 200 and data.get("success") and data.get("token"):
+                    AUTH_TOKEN = data["token"]
+                    print_success(f"Logged in as {TEST_SOEID}")
+                    return True
+                print_error(f"Login failed with status {response.status}: {data}")
+                return False
+    except Exception as e:
+        print_error(f"Login failed: {str(e)}")
+        return False
+
 async def test_create_release_valid():
     """Test creating a release with valid data"""
     print_test_header("Create Release - Valid Data")
@@ -79,8 +111,7 @@ async def test_create_release_valid():
             "endurance_test": 1,
             "sanity_test": 3,
             "standalone_test": 1
-        },
-        "user_soeid": "TEST123"
+        }
     }
     
     try:
@@ -88,7 +119,7 @@ async def test_create_release_valid():
             async with session.post(
                 f"{API_BASE}/zephyr/create-release",
                 json=test_data,
-                headers={"Content-Type": "application/json"}
+                headers=auth_headers()
             ) as response:
                 
                 response_text = await response.text()
@@ -120,7 +151,7 @@ async def test_get_releases_by_project(project_id, expected_release_id=None):
     
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.get(f"{API_BASE}/releases/by-project/{project_id}") as response:
+            async with session.get(f"{API_BASE}/releases/by-project/{project_id}", headers=auth_headers()) as response:
                 
                 response_text = await response.text()
                 print_info(f"Response status: {response.status}")
@@ -182,8 +213,7 @@ async def test_create_release_missing_fields():
             "endurance_test": 1,
             "sanity_test": 1,
             "standalone_test": 1
-        },
-        "user_soeid": "TEST123"
+        }
     }
     
     try:
@@ -191,7 +221,7 @@ async def test_create_release_missing_fields():
             async with session.post(
                 f"{API_BASE}/zephyr/create-release",
                 json=test_data,
-                headers={"Content-Type": "application/json"}
+                headers=auth_headers()
             ) as response:
                 
                 response_text = await response.text()
@@ -228,8 +258,7 @@ async def test_create_release_invalid_dates():
             "endurance_test": 1,
             "sanity_test": 1,
             "standalone_test": 1
-        },
-        "user_soeid": "TEST123"
+        }
     }
     
     try:
@@ -237,7 +266,7 @@ async def test_create_release_invalid_dates():
             async with session.post(
                 f"{API_BASE}/zephyr/create-release",
                 json=test_data,
-                headers={"Content-Type": "application/json"}
+                headers=auth_headers()
             ) as response:
                 
                 response_text = await response.text()
@@ -281,8 +310,7 @@ async def test_create_multiple_releases():
                 "endurance_test": i + 1,
                 "sanity_test": i + 1,
                 "standalone_test": i + 1
-            },
-            "user_soeid": "TEST123"
+            }
         }
         
         try:
@@ -290,7 +318,7 @@ async def test_create_multiple_releases():
                 async with session.post(
                     f"{API_BASE}/zephyr/create-release",
                     json=test_data,
-                    headers={"Content-Type": "application/json"}
+                    headers=auth_headers()
                 ) as response:
                     
                     if response.status == 200:
@@ -341,8 +369,7 @@ async def test_previous_structure_scenarios():
             "endurance_test": 1,
             "sanity_test": 3,
             "standalone_test": 1
-        },
-        "user_soeid": "TEST123"
+        }
     }
     
     try:
@@ -350,7 +377,7 @@ async def test_previous_structure_scenarios():
             async with session.post(
                 f"{API_BASE}/zephyr/create-release",
                 json=test_data_with_previous,
-                headers={"Content-Type": "application/json"}
+                headers=auth_headers()
             ) as response:
                 
                 if response.status == 200:
@@ -380,8 +407,7 @@ async def test_previous_structure_scenarios():
             "endurance_test": 1,
             "sanity_test": 1,
             "standalone_test": 1
-        },
-        "user_soeid": "TEST123"
+        }
     }
     
     try:
@@ -389,7 +415,7 @@ async def test_previous_structure_scenarios():
             async with session.post(
                 f"{API_BASE}/zephyr/create-release",
                 json=test_data_without_previous,
-                headers={"Content-Type": "application/json"}
+                headers=auth_headers()
             ) as response:
                 
                 if response.status == 200:
@@ -426,6 +452,14 @@ async def run_all_tests():
         print_error("Backend is not accessible. Stopping tests.")
         return test_results
     
+    # Login: every release endpoint requires a bearer token
+    result = await test_login()
+    test_results.append(("Login", result))
+    
+    if not result:
+        print_error("Could not log in (set TEST_SOEID / TEST_PASSCODE). Stopping tests.")
+        return test_results
+    
     # Test 2: Create Release with Valid Data
     release_id, project_id = await test_create_release_valid()
     test_results.append(("Create Release - Valid Data", release_id is not None))
@@ -6,6 +6,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "./ui/
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle } from "./ui/dialog";
 import { Calendar, CheckCircle2 } from "lucide-react";
 import axios from "axios";
+import { waitForJob } from "../lib/jobs";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -28,8 +29,7 @@ export const CreateReleaseForm = ({ selectedProject, onReleaseCreated }) => {
   const [success, setSuccess] = useState("");
   const [showSuccessDialog, setShowSuccessDialog] = useState(false);
   const [createdReleaseId, setCreatedReleaseId] = useState(null);
-
-  const user = JSON.parse(localStorage.getItem("cqe_user") || "{}");
+  const [cloneStatus, setCloneStatus] = useState("");
 
   const handleChange = (e) => {
     const { name, value } = e.target;
@@ -96,12 +96,12 @@ export const CreateReleaseForm = ({ selectedProject, onReleaseCreated }) => {
           endurance_test: parseInt(formData.endurance_test_phases) || 0,
           sanity_test: parseInt(formData.sanity_test_phases) || 0,
           standalone_test: parseInt(formData.standalone_test_phases) || 0
-        },
-        user_soeid: user.soeid
+        }
       });
 
       if (response.data.success) {
         setCreatedReleaseId(response.data.release_id);
+        setCloneStatus("");
         setShowSuccessDialog(true);
         // Reset form
         setFormData({
@@ -121,6 +121,30 @@ export const CreateReleaseForm = ({ selectedProject, onReleaseCreated }) => {
         if (onReleaseCreated) {
           onReleaseCreated();
         }
+
+        // The previous release's structure is copied by a background job
+        if (response.data.clone_error) {
+          setCloneStatus(`Copying the previous structure failed: ${response.data.clone_error}`);
+        } else if (response.data.job_id) {
+          setCloneStatus("Copying structure from the previous release...");
+          try {
+            const job = await waitForJob(response.data.job_id, (snapshot) => {
+              if (snapshot.progress?.message) {
+                setCloneStatus(snapshot.progress.message);
+              }
+            });
+            setCloneStatus(
+              job.status === "failed"
+                ? `Copying the previous structure failed: ${job.error}`
+                : `Copied ${job.result.copied} items from the previous release.`
+            );
+          } catch (jobErr) {
+            // The release was created; only following the copy failed
+            const detail = jobErr.response?.data?.detail || jobErr.message;
+            setCloneStatus(`Could not check the structure copy: ${detail}`);
+            console.error("Clone job polling error:", jobErr);
+          }
+        }
       }
     } catch (err) {
       const errorMessage = err.response?.data?.detail || "Failed to create release. Please try again.";
@@ -144,6 +168,9 @@ export const CreateReleaseForm = ({ selectedProject, onReleaseCreated }) => {
             <DialogDescription className="pt-2">
               Release has been created successfully with ID: <span className="font-semibold text-foreground">{createdReleaseId}</span>
             </DialogDescription>
+            {cloneStatus && (
+              <p className="text-sm text-muted-foreground">{cloneStatus}</p>
+            )}
           </DialogHeader>
           <div className="flex justify-end pt-4">
             <Button onClick={() => setShowSuccessDialog(false)}>Close</Button>
@@ -6,6 +6,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "./ui/
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle } from "./ui/dialog";
 import { CheckCircle2, Plus, Trash2 } from "lucide-react";
 import axios from "axios";
+import { waitForJob } from "../lib/jobs";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -21,6 +22,8 @@ export const ImportRequirementsForm = ({ selectedProject, selectedRelease }) =>
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
   const [showSuccessDialog, setShowSuccessDialog] = useState(false);
+  const [importReport, setImportReport] = useState(null);
+  const [progress, setProgress] = useState(null);
 
   const handleRowChange = (index, field, value) => {
     const newRows = [...rows];
@@ -70,6 +73,12 @@ export const ImportRequirementsForm = ({ selectedProject, selectedRelease }) =>
       });
 
       if (response.data.success) {
+        // The import runs as a background job; follow its progress
+        const job = await waitForJob(response.data.job_id, (snapshot) => setProgress(snapshot.progress));
+        if (job.status === "failed") {
+          throw new Error(job.error || "Import failed");
+        }
+        setImportReport(job.result);
         setShowSuccessDialog(true);
         // Reset form to initial 4 rows
         setRows([
@@ -80,11 +89,12 @@ export const ImportRequirementsForm = ({ selectedProject, selectedRelease }) =>
         ]);
       }
     } catch (err) {
-      const errorMessage = err.response?.data?.detail || "Failed to import requirements. Please try again.";
+      const errorMessage = err.response?.data?.detail || err.message || "Failed to import requirements. Please try again.";
       setError(errorMessage);
       console.error("Import requirements error:", err);
     } finally {
       setLoading(false);
+      setProgress(null);
     }
   };
 
@@ -100,6 +110,12 @@ export const ImportRequirementsForm = ({ selectedProject, selectedRelease }) =>
             </DialogTitle>
             <DialogDescription className="pt-2">
               Requirements have been successfully imported from Jira to Zephyr.
+              {importReport && (
+                <span className="block pt-2">
+                  {importReport.created} of {importReport.issues} test cases created
+                  across {importReport.folders.length} folders in {(importReport.total_ms / 1000).toFixed(1)}s.
+                </span>
+              )}
             </DialogDescription>
           </DialogHeader>
           <div className="flex justify-end pt-4">
@@ -129,6 +145,7 @@ export const ImportRequirementsForm = ({ selectedProject, selectedRelease }) =>
               <div className="bg-primary/10 text-primary px-3 py-2 rounded-lg text-sm flex items-center gap-2">
                 <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-primary"></div>
                 Importing requirements...
+                {progress?.total ? ` ${progress.done} of ${progress.total} folders done` : ""}
               </div>
             )}
 
@@ -26,6 +26,7 @@ import {
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const RELEASES_PAGE_SIZE = 500; // MAX_PAGE_SIZE of /releases/by-project
 
 export const Sidebar = ({ activeTab, selectedRelease, onProjectChange, onReleaseChange, onMenuAction }) => {
   const [expandedSection, setExpandedSection] = useState(null);
@@ -37,10 +38,9 @@ export const Sidebar = ({ activeTab, selectedRelease, onProjectChange, onRelease
   const [releaseSearchTerm, setReleaseSearchTerm] = useState("");
 
   useEffect(() => {
-    // Get user from localStorage
-    const user = JSON.parse(localStorage.getItem("cqe_user") || "{}");
-    if (user.soeid) {
-      fetchUserProjects(user.soeid);
+    // Projects of the logged-in user (identified by the bearer token)
+    if (localStorage.getItem("cqe_token")) {
+      fetchUserProjects();
     }
   }, []); // Only run once on mount
 
@@ -52,10 +52,10 @@ export const Sidebar = ({ activeTab, selectedRelease, onProjectChange, onRelease
     }
   }, [selectedProject]);
 
-  const fetchUserProjects = async (soeid) => {
+  const fetchUserProjects = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API}/projects/user/${soeid}`);
+      const response = await axios.get(`${API}/projects/me`);
       if (response.data.success) {
         setProjects(response.data.projects);
       }
@@ -68,10 +68,20 @@ export const Sidebar = ({ activeTab, selectedRelease, onProjectChange, onRelease
 
   const fetchReleases = async () => {
     try {
-      const response = await axios.get(`${API}/releases/by-project/${selectedProject}`);
-      if (response.data.success) {
-        setReleases(response.data.releases);
-      }
+      // The endpoint is paginated; follow next_after_id until every release is loaded
+      const allReleases = [];
+      let afterId = null;
+      do {
+        const response = await axios.get(`${API}/releases/by-project/${selectedProject}`, {
+          params: { limit: RELEASES_PAGE_SIZE, ...(afterId !== null && { after_id: afterId }) }
+        });
+        if (!response.data.success) {
+          return;
+        }
+        allReleases.push(...response.data.releases);
+        afterId = response.data.next_after_id;
+      } while (afterId !== null && afterId !== undefined);
+      setReleases(allReleases);
     } catch (error) {
       console.error("Error fetching releases:", error);
     }
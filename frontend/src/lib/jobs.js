@@ -0,0 +1,21 @@
+import axios from "axios";
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+const FINISHED = ["succeeded", "failed"];
+
+// Poll a background job until it finishes; onProgress receives each snapshot
+export async function waitForJob(jobId, onProgress, intervalMs = 1000) {
+  for (;;) {
+    const response = await axios.get(`${API}/zephyr/jobs/${jobId}`);
+    const job = response.data.job;
+    if (onProgress) {
+      onProgress(job);
+    }
+    if (FINISHED.includes(job.status)) {
+      return job;
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+}
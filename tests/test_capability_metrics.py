@@ -0,0 +1,91 @@
+"""Vectorized capability metrics over test case and execution frames"""
+
+import pandas as pd
+
+from utils.capability_metrics import compute_release_metrics
+
+
+def make_testcases(rows):
+    return pd.DataFrame(rows, columns=["release_id", "testcase_key"])
+
+
+def make_executions(rows):
+    return pd.DataFrame(rows, columns=["release_id", "testcase_key", "status", "phase", "executed_at", "defect_count"])
+
+
+def test_rates_coverage_and_defects():
+    testcases = make_testcases([(1, "T1"), (1, "T2"), (1, "T3"), (1, "T4")])
+    executions = make_executions([
+        (1, "T1", "pass", "SIT", "2024-03-01T10:00:00Z", 0),
+        (1, "T1", "fail", "SIT", "2024-03-02T10:00:00Z", 2),
+        (1, "T2", "Pass", "UAT", "2024-03-02T11:00:00Z", 0),
+        (1, "T3", "not_executed", "UAT", None, 0),
+    ])
+
+    metrics = compute_release_metrics([1], testcases, executions)[1]
+
+    assert metrics["total_testcases"] == 4
+    assert metrics["executions"] == 3
+    assert metrics["executed_testcases"] == 2
+    assert metrics["coverage"] == 50.0
+    assert metrics["passed"] == 2
+    assert metrics["failed"] == 1
+    assert metrics["pass_rate"] == 66.67
+    assert metrics["fail_rate"] == 33.33
+    assert metrics["defects"] == 2
+    assert metrics["defect_density"] == 1.0
+
+
+def test_phase_throughput_counts_active_days():
+    testcases = make_testcases([(1, "T1"), (1, "T2")])
+    executions = make_executions([
+        (1, "T1", "pass", "SIT", "2024-03-01T10:00:00Z", 0),
+        (1, "T2", "pass", "SIT", "2024-03-01T15:00:00Z", 0),
+        (1, "T1", "fail", "SIT", "2024-03-03T10:00:00Z", 0),
+        (1, "T2", "pass", None, "2024-03-03T10:00:00Z", 0),
+    ])
+
+    throughput = compute_release_metrics([1], testcases, executions)[1]["phase_throughput"]
+
+    assert throughput == {
+        "SIT": {"executions": 3, "active_days": 2, "per_day": 1.5},
+        "unspecified": {"executions": 1, "active_days": 1, "per_day": 1.0}
+    }
+
+
+def test_releases_are_computed_independently():
+    testcases = make_testcases([(1, "T1"), (2, "T1"), (2, "T2")])
+    executions = make_executions([
+        (1, "T1", "fail", "SIT", "2024-03-01T10:00:00Z", 1),
+        (2, "T1", "pass", "SIT", "2024-04-01T10:00:00Z", 0),
+    ])
+
+    metrics = compute_release_metrics([1, 2], testcases, executions)
+
+    assert (metrics[1]["coverage"], metrics[1]["fail_rate"]) == (100.0, 100.0)
+    assert (metrics[2]["coverage"], metrics[2]["pass_rate"]) == (50.0, 100.0)
+
+
+def test_release_without_records_gets_zeros():
+    metrics = compute_release_metrics([3], make_testcases([]), make_executions([]))[3]
+
+    assert metrics["total_testcases"] == 0
+    assert metrics["coverage"] == 0.0
+    assert metrics["pass_rate"] == 0.0
+    assert metrics["phase_throughput"] == {}
+
+
+def test_coverage_ignores_executions_of_unknown_testcases():
+    testcases = make_testcases([(1, "T1"), (1, "T2"), (2, "T3")])
+    executions = make_executions([
+        (1, "T1", "pass", "SIT", "2024-03-01T10:00:00Z", 0),
+        (1, "T3", "pass", "SIT", "2024-03-01T10:00:00Z", 0),
+        (1, "T9", "fail", "SIT", "2024-03-01T10:00:00Z", 0),
+    ])
+
+    metrics = compute_release_metrics([1, 2], testcases, executions)
+
+    assert metrics[1]["executed_testcases"] == 1
+    assert metrics[1]["coverage"] == 50.0
+    assert metrics[1]["executions"] == 3
+    assert metrics[2]["coverage"] == 0.0
@@ -0,0 +1,94 @@
+"""Validation and de-duplication of pushed execution results"""
+
+from datetime import datetime
+
+from utils.execution_results import EST, ExecutionBatch, normalize_status, validate_result
+
+
+def result(key="CQE-T1", cycle="C1", status="Pass", **extra):
+    return {"testcase_key": key, "cycle": cycle, "status": status, **extra}
+
+
+def test_normalize_status():
+    assert normalize_status("Not Executed") == "not_executed"
+    assert normalize_status(" not-executed ") == "not_executed"
+    assert normalize_status("PASS") == "pass"
+
+
+def test_validate_result_parses_timestamps():
+    cleaned, error = validate_result(result(executed_at="2024-03-01T10:00:00", defects=["BUG-1", 7], phase=" SIT "))
+
+    assert error is None
+    assert cleaned["executed_at"] == datetime(2024, 3, 1, 10, tzinfo=EST)
+    assert cleaned["defects"] == ["BUG-1", "7"]
+    assert cleaned["phase"] == "SIT"
+
+
+def test_validate_result_keeps_explicit_offset():
+    cleaned, _ = validate_result(result(executed_at="2024-03-01T10:00:00+00:00"))
+
+    assert cleaned["executed_at"].utcoffset().total_seconds() == 0
+
+
+def test_validate_result_errors():
+    assert validate_result("CQE-T1") == (None, "Result must be an object")
+    assert validate_result({"testcase_key": "CQE-T1", "cycle": 0}) == (None, "Missing status")
+    assert validate_result(result(executed_at="yesterday"))[1] == "Invalid executed_at: yesterday"
+    assert validate_result(result(defects="BUG-1"))[1] == "defects must be a list"
+
+
+def test_batch_keeps_latest_result_per_testcase_and_cycle():
+    batch = ExecutionBatch()
+    batch.add(result(status="Fail", executed_at="2024-03-01T12:00:00"))
+    batch.add(result(status="Pass", executed_at="2024-03-01T10:00:00"))
+    batch.add(result(cycle="C2", status="Blocked", executed_at="2024-03-01T09:00:00"))
+
+    assert len(batch) == 2
+    assert batch.duplicates == 1
+    assert batch._results[("CQE-T1", "C1")]["status"] == "fail"
+
+
+def test_batch_later_result_wins_ties():
+    batch = ExecutionBatch()
+    batch.add(result(status="Fail", executed_at="2024-03-01T10:00:00"))
+    batch.add(result(status="Pass", executed_at="2024-03-01T10:00:00"))
+
+    assert batch._results[("CQE-T1", "C1")]["status"] == "pass"
+
+
+def test_batch_counts_rejected_results_with_their_index():
+    batch = ExecutionBatch()
+    batch.add(result())
+    batch.add({"testcase_key": "CQE-T2"})
+    batch.add(42)
+
+    assert (batch.received, batch.rejected, len(batch)) == (3, 2, 1)
+    assert batch.errors == [
+        {"index": 1, "error": "Missing cycle, status"},
+        {"index": 2, "error": "Result must be an object"}
+    ]
+
+
+def test_timestamped_result_wins_over_one_without_executed_at():
+    batch = ExecutionBatch()
+    batch.add(result(status="Fail", executed_at="2024-03-01T10:00:00"))
+    batch.add(result(status="Pass"))
+
+    kept = batch._results[("CQE-T1", "C1")]
+    assert kept["status"] == "fail"
+    assert kept["executed_at"] == datetime(2024, 3, 1, 10, tzinfo=EST)
+
+    batch.add(result(status="Blocked", cycle="C2"))
+    batch.add(result(status="Pass", cycle="C2", executed_at="2024-03-01T09:00:00"))
+
+    assert batch._results[("CQE-T1", "C2")]["status"] == "pass"
+
+
+def test_results_without_executed_at_keep_the_later_one():
+    batch = ExecutionBatch()
+    batch.add(result(status="Fail"))
+    batch.add(result(status="Pass"))
+
+    kept = batch._results[("CQE-T1", "C1")]
+    assert kept["status"] == "pass"
+    assert kept["executed_at"] is None
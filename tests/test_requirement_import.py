@@ -0,0 +1,59 @@
+"""Jira -> Zephyr requirement import pipeline with in-memory clients"""
+
+import asyncio
+
+import pytest
+
+from utils.http_client import ApiAuthError
+from utils.requirement_import import import_requirements
+from utils.zephyr_client import ZephyrClient
+
+
+class FakeJira:
+    """Searches answer from a JQL -> pages map; "denied" rejects the token, "hang" never returns"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cancelled = []
+
+    async def iter_search(self, jql, token):
+        if jql == "denied":
+            await asyncio.sleep(0.01)
+            raise ApiAuthError("Invalid Jira token")
+        if jql == "hang":
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                self.cancelled.append(jql)
+                raise
+        for page in self.pages.get(jql, []):
+            yield page
+
+
+def issues(*keys):
+    return [{"id": key, "key": key, "summary": f"Requirement {key}"} for key in keys]
+
+
+def run_import(requirements, jira):
+    return asyncio.run(import_requirements(
+        requirements, 1, "jira-token", "zephyr-token",
+        jira=jira, zephyr=ZephyrClient(mock=True)
+    ))
+
+
+def test_every_folder_is_imported():
+    jira = FakeJira({"a": [issues("REQ-1", "REQ-2"), issues("REQ-3")], "b": [issues("REQ-4")]})
+
+    report = run_import([{"folder_name": "A", "jql": "a"}, {"folder_name": "B", "jql": "b"}], jira)
+
+    assert [(f["folder_name"], f["issues"], f["created"]) for f in report["folders"]] == [("A", 3, 3), ("B", 1, 1)]
+    assert (report["created"], report["failed"], report["failed_folders"]) == (4, 0, 0)
+
+
+def test_rejected_token_cancels_remaining_folders():
+    jira = FakeJira({})
+    requirements = [{"folder_name": "Slow", "jql": "hang"}, {"folder_name": "Denied", "jql": "denied"}]
+
+    with pytest.raises(ApiAuthError):
+        run_import(requirements, jira)
+    assert jira.cancelled == ["hang"]
@@ -0,0 +1,39 @@
+"""NDJSON request body decoding"""
+
+import asyncio
+
+import pytest
+
+from utils.streaming import iter_ndjson
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def decode(*parts: bytes):
+    async def run():
+        return [value async for value in iter_ndjson(chunks(*parts))]
+    return asyncio.run(run())
+
+
+def test_lines_split_across_chunks():
+    assert decode(b'{"a": 1}\n{"b"', b': 2}\n[3', b']\n') == [{"a": 1}, {"b": 2}, [3]]
+
+
+def test_last_line_without_newline():
+    assert decode(b'{"a": 1}\n{"b": 2}') == [{"a": 1}, {"b": 2}]
+
+
+def test_blank_lines_are_skipped():
+    assert decode(b'\n{"a": 1}\n  \n\r\n{"b": 2}\n\n') == [{"a": 1}, {"b": 2}]
+
+
+def test_invalid_line_reports_its_line_number():
+    with pytest.raises(ValueError, match="Invalid JSON on line 3"):
+        decode(b'{"a": 1}\n\n{"b": \n{"c": 3}\n')
+
+
+def test_empty_body():
+    assert decode() == []
@@ -0,0 +1,94 @@
+"""Parsing and validation of uploaded test case files"""
+
+import pytest
+
+from utils.testcase_import import iter_rows, validate_row
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_csv_rows_use_header_aliases(tmp_path):
+    path = write(tmp_path, "cases.csv",
+                 "Test Case Key,Summary,Folder,Assignee,Unrelated\n"
+                 "CQE-T1,Login works,Auth,ab12345,x\n")
+
+    rows = list(iter_rows(path))
+
+    assert rows == [{"testcase_key": "CQE-T1", "name": "Login works", "folder": "Auth", "assigned_to": "ab12345"}]
+
+
+def test_txt_is_tab_delimited(tmp_path):
+    path = write(tmp_path, "cases.txt", "key\tname\tphase\nCQE-T1\tLogin, then logout\tSIT\n")
+
+    rows = list(iter_rows(path))
+
+    assert rows == [{"testcase_key": "CQE-T1", "name": "Login, then logout", "phase": "SIT"}]
+
+
+def test_utf8_bom_does_not_hide_first_header(tmp_path):
+    path = write(tmp_path, "cases.csv", "﻿testcase_key,name\nCQE-T1,Login\n")
+
+    assert list(iter_rows(path))[0]["testcase_key"] == "CQE-T1"
+
+
+def test_short_rows_fill_missing_columns_with_none(tmp_path):
+    path = write(tmp_path, "cases.csv", "testcase_key,name,priority\nCQE-T1,Login\n")
+
+    assert list(iter_rows(path)) == [{"testcase_key": "CQE-T1", "name": "Login", "priority": None}]
+
+
+def test_xlsx_rows(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Key", "Name", "Priority"])
+    sheet.append(["CQE-T1", "Login", 2])
+    path = str(tmp_path / "cases.xlsx")
+    workbook.save(path)
+
+    row = list(iter_rows(path))[0]
+
+    assert row == {"testcase_key": "CQE-T1", "name": "Login", "priority": 2}
+
+
+def test_missing_required_column_is_rejected(tmp_path):
+    path = write(tmp_path, "cases.csv", "testcase_key,folder\nCQE-T1,Auth\n")
+
+    with pytest.raises(ValueError, match="name"):
+        list(iter_rows(path))
+
+
+def test_unsupported_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file type: .json"):
+        iter_rows(write(tmp_path, "cases.json", "[]"))
+
+
+def test_validate_row_cleans_values():
+    cleaned, error = validate_row({
+        "testcase_key": " CQE-T1 ",
+        "name": "Login",
+        "priority": 2.0,
+        "assigned_to": "ab12345",
+        "folder": ""
+    })
+
+    assert error is None
+    assert cleaned["testcase_key"] == "CQE-T1"
+    assert cleaned["priority"] == "2"
+    assert cleaned["assigned_to"] == "AB12345"
+    assert cleaned["folder"] is None
+
+
+def test_validate_row_skips_blank_rows():
+    assert validate_row({"testcase_key": "", "name": None}) == (None, None)
+
+
+def test_validate_row_reports_missing_required_fields():
+    cleaned, error = validate_row({"testcase_key": "CQE-T1", "folder": "Auth"})
+
+    assert cleaned is None
+    assert error == "Missing name"
@@ -0,0 +1,153 @@
+"""ZephyrClient against the Zephyr Scale stub, in process via httpx.ASGITransport"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from stubs.zephyr_stub import create_app
+from utils.zephyr_client import ZephyrAuthError, ZephyrClient, ZephyrError
+
+TOKEN = "valid-token-123"
+
+
+def make_client(app, max_retries=3) -> ZephyrClient:
+    client = ZephyrClient(
+        base_url="http://zephyr.test/v2",
+        mock=False,
+        transport=httpx.ASGITransport(app=app)
+    )
+    client.max_retries = max_retries
+    client.backoff = 0
+    return client
+
+
+def fetch_projects(client: ZephyrClient, token: str = TOKEN):
+    async def run():
+        try:
+            return await client.get_projects(token)
+        finally:
+            await client.close()
+    return asyncio.run(run())
+
+
+def test_get_projects_single_page():
+    app = create_app(project_count=5)
+
+    projects = fetch_projects(make_client(app))
+
+    assert [p["id"] for p in projects] == [1, 2, 3, 4, 5]
+    assert projects[0] == {"id": 1, "name": "Project 1"}
+    assert app.state.requests == 1
+
+
+def test_get_projects_fetches_every_page_in_order():
+    app = create_app(project_count=250)
+
+    projects = fetch_projects(make_client(app))
+
+    assert [p["id"] for p in projects] == list(range(1, 251))
+    assert app.state.requests == 3
+
+
+def test_get_projects_is_cached_per_token():
+    app = create_app(project_count=5)
+    client = make_client(app)
+
+    async def run():
+        try:
+            first = await client.get_projects(TOKEN)
+            second = await client.get_projects(TOKEN)
+            return first, second
+        finally:
+            await client.close()
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert app.state.requests == 1
+
+
+def test_transient_503_is_retried():
+    # Every second request fails: pages 2 and 3 each succeed on their retry
+    app = create_app(project_count=250, fail_every=2)
+
+    projects = fetch_projects(make_client(app))
+
+    assert [p["id"] for p in projects] == list(range(1, 251))
+    assert app.state.requests == 5
+
+
+def test_503_after_all_retries_raises():
+    app = create_app(project_count=5, fail_every=1)
+
+    with pytest.raises(ZephyrError, match="503"):
+        fetch_projects(make_client(app, max_retries=2))
+    assert app.state.requests == 3
+
+
+def test_rejected_token_raises_auth_error_without_retrying():
+    app = create_app(project_count=5)
+
+    with pytest.raises(ZephyrAuthError):
+        fetch_projects(make_client(app), token="bad-token-123")
+    assert app.state.requests == 1
+
+
+def test_failed_post_is_not_retried():
+    app = create_app(fail_every=1)
+    client = make_client(app)
+
+    async def run():
+        try:
+            return await client.create_folder("PRJ1", "Imported", TOKEN)
+        finally:
+            await client.close()
+
+    with pytest.raises(ZephyrError, match="503"):
+        asyncio.run(run())
+    assert app.state.requests == 1
+
+
+def test_post_is_retried_when_the_connection_was_never_made():
+    attempts = []
+
+    def refuse_then_answer(request):
+        attempts.append(request.method)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(201, json={"id": 7})
+
+    client = ZephyrClient(base_url="http://zephyr.test/v2", mock=False,
+                          transport=httpx.MockTransport(refuse_then_answer))
+    client.backoff = 0
+
+    async def run():
+        try:
+            return await client.create_folder("PRJ1", "Imported", TOKEN)
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()) == 7
+    assert attempts == ["POST", "POST"]
+
+
+def test_post_read_timeout_is_not_retried():
+    attempts = []
+
+    def time_out(request):
+        attempts.append(request.method)
+        raise httpx.ReadTimeout("Timed out", request=request)
+
+    client = ZephyrClient(base_url="http://zephyr.test/v2", mock=False, transport=httpx.MockTransport(time_out))
+    client.backoff = 0
+
+    async def run():
+        try:
+            return await client.create_testcase("PRJ1", "Login", TOKEN)
+        finally:
+            await client.close()
+
+    with pytest.raises(ZephyrError):
+        asyncio.run(run())
+    assert attempts == ["POST"]